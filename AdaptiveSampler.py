@@ -0,0 +1,186 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import Epsilon, createWarpCornerHandler, transformPointArrayMasked
+
+######################################################
+#	Globel Member
+
+#	NOTES - tolerance is in unit of xy, which is pixel for image warp
+DefaultTolerance = 0.5
+
+#	finest cell is 1 / 2^DefaultMaxDepth of unit square along each axis
+DefaultMaxDepth = 8
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class AdaptiveSampler( object ):
+	'''	this class designed for sampling unit square mapped by projective matrix
+		on mesh which is fine only where perspective bend the map.
+		Cell is split along u or v when bilinear interpolation of its corners
+		may be off from true map by more than tolerance
+	'''
+
+	def __init__( self, matrix, tolerance = DefaultTolerance, maxDepth = DefaultMaxDepth ):
+		'''	initialize class.
+			matrix is projective 3-by-3 matrix, such as projectiveMatrix of warp corner handler
+		'''
+
+		if tolerance <= 0:
+			raise ValueError( 'Tolerance must be positive' )
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.matrix = np.asarray( matrix, dtype = np.float64 )
+		self.tolerance = float( tolerance )
+		self.maxDepth = int( maxDepth )
+
+		#	number of point mapped by last sample
+		self.evaluationCount = 0
+
+	#
+	#	Operation Function
+	#
+
+	def sample( self ):
+		'''	this function will subdivide unit square and map mesh vertex
+			return N-by-2 uv array, N-by-2 xy array and M-by-4 vertex index
+			of each cell as P00, P10, P11, P01
+
+			NOTES - neighbor cells may differ in size, so edge of big cell can
+			        have vertex of small cell on it. Gap along such edge is also
+			        bounded by tolerance. Cell of finest size is kept even if it is
+			        still over tolerance, but it is dropped if it touch line at infinity
+		'''
+
+		numFinest = 1 << self.maxDepth
+
+		#	cell as ( u0, v0, size u, size v ) in unit of finest cell
+		cellArray = np.array( [ [ 0, 0, numFinest, numFinest ] ], dtype = np.int64 )
+
+		leafList = []
+
+		while len( cellArray ):
+
+			errorU, errorV = self.estimateError_internal( cellArray, numFinest )
+
+			#	split only the axis that bend, error of two axis add up
+			splitU = ( errorU > self.tolerance * 0.5 ) & ( cellArray[ :, 2 ] > 1 )
+			splitV = ( errorV > self.tolerance * 0.5 ) & ( cellArray[ :, 3 ] > 1 )
+
+			leafMask = ~( splitU | splitV ) & np.isfinite( errorU + errorV )
+			leafList.append( cellArray[ leafMask ] )
+
+			splitMask = splitU | splitV
+			cellArray = self.splitCell_internal( cellArray[ splitMask ], splitU[ splitMask ], splitV[ splitMask ] )
+
+		leafArray = np.concatenate( leafList )
+
+		#	corner of each leaf as P00, P10, P11, P01, shared corner is mapped once
+		u0, v0, sizeU, sizeV = leafArray.T
+		cornerU = np.column_stack( ( u0, u0 + sizeU, u0 + sizeU, u0 ) )
+		cornerV = np.column_stack( ( v0, v0, v0 + sizeV, v0 + sizeV ) )
+
+		keyArray, cellIndexArray = np.unique( cornerV * ( numFinest + 1 ) + cornerU, return_inverse = True )
+
+		uvArray = np.column_stack( ( keyArray % ( numFinest + 1 ), keyArray // ( numFinest + 1 ) ) ) / float( numFinest )
+		xyArray = transformPointArrayMasked( self.matrix, uvArray )[0]
+
+		self.evaluationCount = len( uvArray )
+
+		return uvArray, xyArray, cellIndexArray.reshape( -1, 4 )
+
+	#
+	#	Internal Function
+	#
+
+	def estimateError_internal( self, cellArray, numFinest ):
+		'''	this function will return bound of bilinear interpolation error
+			along u and along v of each cell, inf if cell touch line at infinity
+
+			NOTES - for x = X / W, derivative is x_u = Lx( v ) / W^2 with
+			        Lx( v ) = ( a*h - g*b ) * v + ( a*w0 - g*c ), so x_uu = -2g * Lx / W^3.
+			        Lx and W are linear, so their bound over cell is at corner, and
+			        bilinear error along u is at most size^2 / 8 * max | x_uu |
+		'''
+
+		( a, b, c ), ( d, e, f ), ( g, h, w0 ) = self.matrix
+
+		u0 = cellArray[ :, 0 ] / float( numFinest )
+		v0 = cellArray[ :, 1 ] / float( numFinest )
+		u1 = u0 + cellArray[ :, 2 ] / float( numFinest )
+		v1 = v0 + cellArray[ :, 3 ] / float( numFinest )
+
+		#	w is linear, so its minimum is at corner
+		minW = np.minimum( g * u0, g * u1 ) + np.minimum( h * v0, h * v1 ) + w0
+
+		def maxAbsLinear( slope, offset, t0, t1 ):
+			return np.maximum( np.abs( slope * t0 + offset ), np.abs( slope * t1 + offset ) )
+
+		curvatureU = np.hypot( maxAbsLinear( a * h - g * b, a * w0 - g * c, v0, v1 ),
+							   maxAbsLinear( d * h - g * e, d * w0 - g * f, v0, v1 ) ) * 2 * abs( g )
+		curvatureV = np.hypot( maxAbsLinear( b * g - h * a, b * w0 - h * c, u0, u1 ),
+							   maxAbsLinear( e * g - h * d, e * w0 - h * f, u0, u1 ) ) * 2 * abs( h )
+
+		validMask = minW > Epsilon
+		minWCube = np.where( validMask, minW, 1.0 )**3
+
+		errorU = np.where( validMask, ( u1 - u0 )**2 / 8 * curvatureU / minWCube, np.inf )
+		errorV = np.where( validMask, ( v1 - v0 )**2 / 8 * curvatureV / minWCube, np.inf )
+
+		return errorU, errorV
+
+	def splitCell_internal( self, cellArray, splitU, splitV ):
+		'''	this function will split each cell in half along u and / or v
+		'''
+
+		sizeU = cellArray[ :, 2 ] >> splitU.astype( np.int64 )
+		sizeV = cellArray[ :, 3 ] >> splitV.astype( np.int64 )
+
+		childList = []
+
+		for offsetU, offsetV in ( ( 0, 0 ), ( 1, 0 ), ( 0, 1 ), ( 1, 1 ) ):
+
+			#	second child along axis exist only when that axis is split
+			childMask = ( splitU >= offsetU ) & ( splitV >= offsetV )
+
+			childList.append( np.column_stack( ( cellArray[ :, 0 ] + offsetU * sizeU, cellArray[ :, 1 ] + offsetV * sizeV,
+												 sizeU, sizeV ) )[ childMask ] )
+
+		return np.concatenate( childList )
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	warpCornerHandler = createWarpCornerHandler( [ [ 200, 100 ], [ 1700, 50 ], [ 1800, 1000 ], [ 100, 1050 ] ] )
+
+	for tolerance in ( 2.0, 0.5, 0.1 ):
+
+		adaptiveSampler = AdaptiveSampler( warpCornerHandler.projectiveMatrix, tolerance )
+		uvArray, xyArray, cellIndexArray = adaptiveSampler.sample()
+
+		print 'tolerance {} :: {} cell, {} evaluation'.format( tolerance, len( cellIndexArray ), adaptiveSampler.evaluationCount )
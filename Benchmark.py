@@ -0,0 +1,444 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import gc
+import json
+import time
+import ctypes
+import optparse
+import platform
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import computeFourPointTransformMatrix, createWarpCornerHandler
+
+#	Quad To Quad Transform
+from QuadToQuadTransform import QuadToQuadTransform
+
+#	Grid Evaluator
+from GridEvaluator import ProjectiveGridEvaluator
+
+#	Homography Estimator
+from HomographyEstimator import estimateHomography, estimateHomographyRansac
+
+#	Image Warper
+from ImageWarper import InterpolationBilinear, InterpolationList, PyramidInterpolationList, warpImage, warpImageTiled
+
+#	Image Pyramid
+from ImagePyramid import ImagePyramid
+
+#	Remap Table
+from RemapTable import bakeRemapTable
+
+######################################################
+#	Globel Member
+
+ModuleDescription = 'This script to benchmark transform solve, homography fit, point mapping and image warp.'
+
+#	NOTES - ScriptVersion.ProgramVersion.SubprogramVersion
+ProgramVersion = '1.0.0'
+ProgramName = 'Benchmark'
+
+NumberRequireArgument = 0
+
+#	fixed seed and quads so that result is comparable between run
+RandomSeed = 0
+
+SrcQuad = [ [ -100, -100 ], [ 100, -100 ], [ 100, 100 ], [ -100, 100 ] ]
+DstQuad = [ [ -90, -110 ], [ 120, -80 ], [ 80, 95 ], [ -110, 70 ] ]
+PointQuad = [ [ -100, -100 ], [ 100, -100 ], [ 100, 100 ], [ -100, 100 ] ]
+
+PointCountList = [ 1000, 10000, 100000, 1000000, 10000000 ]
+QuickPointCountList = [ 1000, 10000, 100000 ]
+
+CorrespondenceCountList = [ 20, 50, 200 ]
+QuickCorrespondenceCountList = [ 50 ]
+
+SamplingList = [ 20, 50, 100, 200 ]
+QuickSamplingList = [ 20, 50 ]
+
+ImageShapeList = [ ( 480, 640, 3 ), ( 1080, 1920, 3 ) ]
+QuickImageShapeList = [ ( 240, 320, 3 ) ]
+
+PercentileList = [ 50, 90, 99 ]
+
+#	NOTES - ru_maxrss is in kilobyte on Linux and in byte on macOS
+MaxRssUnitByte = 1 if sys.platform == 'darwin' else 1024
+
+#	NOTES - glibc serve allocation of at least this size by fresh mmap in measured
+#	        child, instead of reusing freed memory which is already resident
+MemoryMmapThreshold = 128 * 1024
+MallocMmapThresholdParameter = -3
+
+######################################################
+#	Helper Function
+
+def measure( name, function, repeat, numItem = 1, parameterDict = None ):
+	''' This function will run function repeatedly and measure it
+	    INPUTS : case name, function without argument, number of repeat,
+	             number of item processed per call, parameter dict to be reported
+	    OUTPUT : result dict with latency percentile, throughput and memory peak
+	'''
+
+	#	warm up so that lazy preparation is not counted
+	function()
+
+	latencyList = []
+
+	for _ in range( repeat ):
+		gc.collect()
+		startTime = time.time()
+		function()
+		latencyList.append( time.time() - startTime )
+
+	#	measure peak memory of single call separately in child process
+	peakMemory, memoryMethod = measurePeakMemory_internal( function )
+
+	latencyArray = np.array( latencyList )
+	median = float( np.median( latencyArray ) )
+
+	result = { 'name':name, 'parameter':parameterDict or {}, 'repeat':repeat, 'numItem':numItem,
+			   'meanSecond':float( latencyArray.mean() ), 'minSecond':float( latencyArray.min() ),
+			   'itemPerSecond':numItem / median if median > 0 else None,
+			   'peakMemoryByte':peakMemory, 'memoryMethod':memoryMethod }
+
+	for percentile in PercentileList:
+		result[ 'p{}Second'.format( percentile ) ] = float( np.percentile( latencyArray, percentile ) )
+
+	return result
+
+def measurePeakMemory_internal( function ):
+	''' This function will return peak memory allocated by single call
+	    and name of method used
+
+	    NOTES - call is run in forked child, whose max rss start from its rss
+	            at fork, so that growth of max rss is peak of that call alone
+	            instead of peak of whole benchmark so far
+	'''
+
+	if resource is None or not hasattr( os, 'fork' ):
+		return None, None
+
+	readFd, writeFd = os.pipe()
+
+	pid = os.fork()
+
+	if pid == 0:
+
+		try:
+			os.close( readFd )
+
+			#	fixed threshold stop glibc from raising it after large free
+			try:
+				ctypes.CDLL( None ).mallopt( MallocMmapThresholdParameter, MemoryMmapThreshold )
+			except ( AttributeError, OSError ):
+				pass
+
+			startMaxRss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+			function()
+			peak = ( resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss - startMaxRss ) * MaxRssUnitByte
+
+			os.write( writeFd, str( peak ) )
+
+		finally:
+			os._exit( 0 )
+
+	os.close( writeFd )
+
+	data = ''
+	while True:
+		chunk = os.read( readFd, 64 )
+		if not chunk:
+			break
+		data += chunk
+
+	os.close( readFd )
+	os.waitpid( pid, 0 )
+
+	#	child failed before reporting
+	if not data:
+		return None, None
+
+	return int( data ), 'forkMaxRss'
+
+def benchmarkSolve( repeat ):
+	''' This function will benchmark computeFourPointTransformMatrix
+	'''
+
+	cornerList = [ np.array( corner, dtype = np.float64 ) for corner in DstQuad ]
+
+	numSolve = 1000
+
+	def solve():
+		for _ in range( numSolve ):
+			computeFourPointTransformMatrix( *cornerList )
+
+	return [ measure( 'solve', solve, repeat, numSolve ) ]
+
+def benchmarkEstimate( repeat, correspondenceCountList ):
+	''' This function will benchmark homography fit from noisy correspondences,
+	    with 30 percent outlier for RANSAC
+	'''
+
+	randomState = np.random.RandomState( RandomSeed )
+	warpCornerHandler = createWarpCornerHandler( DstQuad )
+
+	resultList = []
+
+	for numCorrespondence in correspondenceCountList:
+
+		parameterDict = { 'numCorrespondence':numCorrespondence }
+
+		srcPointArray = randomState.rand( numCorrespondence, 2 )
+		dstPointArray = warpCornerHandler.calculateXYFromUVBatch( srcPointArray ) + randomState.randn( numCorrespondence, 2 ) * 0.5
+
+		resultList.append( measure( 'estimateHomography', lambda: estimateHomography( srcPointArray, dstPointArray ),
+									repeat, 1, parameterDict ) )
+
+		numOutlier = int( numCorrespondence * 0.3 )
+		dstPointArray[ :numOutlier ] = randomState.rand( numOutlier, 2 ) * 200 - 100
+
+		resultList.append( measure( 'estimateHomographyRansac', lambda: estimateHomographyRansac( srcPointArray, dstPointArray, randomState = randomState ),
+									repeat, 1, parameterDict ) )
+
+	return resultList
+
+def benchmarkPointMapping( repeat, pointCountList ):
+	''' This function will benchmark scalar and batch point mapping
+	'''
+
+	randomState = np.random.RandomState( RandomSeed )
+
+	warpCornerHandler = createWarpCornerHandler( DstQuad )
+
+	resultList = []
+
+	#	scalar api is measured on small count only, its cost is linear
+	numScalar = 1000
+	uvArray = randomState.rand( numScalar, 2 )
+	xyArray = warpCornerHandler.calculateXYFromUVBatch( uvArray )
+
+	def scalarXYFromUV():
+		for u, v in uvArray:
+			warpCornerHandler.calculateXYFromUV( u, v )
+
+	def scalarUVFromXY():
+		for x, y in xyArray:
+			warpCornerHandler.calculateUVFromXY( x, y )
+
+	resultList.append( measure( 'calculateXYFromUV', scalarXYFromUV, repeat, numScalar, { 'numPoint':numScalar } ) )
+	resultList.append( measure( 'calculateUVFromXY', scalarUVFromXY, repeat, numScalar, { 'numPoint':numScalar } ) )
+
+	for numPoint in pointCountList:
+
+		uvArray = randomState.rand( numPoint, 2 )
+		xyArray = warpCornerHandler.calculateXYFromUVBatch( uvArray )
+
+		resultList.append( measure( 'calculateXYFromUVBatch', lambda: warpCornerHandler.calculateXYFromUVBatch( uvArray ),
+									repeat, numPoint, { 'numPoint':numPoint } ) )
+		resultList.append( measure( 'calculateUVFromXYBatch', lambda: warpCornerHandler.calculateUVFromXYBatch( xyArray ),
+									repeat, numPoint, { 'numPoint':numPoint } ) )
+
+		#	detection spread over canvas four times the quad, most of it outside
+		detectionArray = ( randomState.rand( numPoint, 2 ) - 0.5 ) * 4 * ( np.ptp( DstQuad, axis = 0 ) )
+
+		resultList.append( measure( 'filterPointInQuadBatch', lambda: warpCornerHandler.filterPointInQuadBatch( detectionArray ),
+									repeat, numPoint, { 'numPoint':numPoint } ) )
+
+	return resultList
+
+def benchmarkRenderGrid( repeat, samplingList ):
+	''' This function will benchmark remap of sampling grid as drawn by destination display window
+	'''
+
+	resultList = []
+
+	for numSampling in samplingList:
+
+		parameterDict = { 'numSamplingU':numSampling, 'numSamplingV':numSampling }
+		numPoint = ( numSampling + 1 ) ** 2
+
+		def threeHandler():
+			warpCornerHandler_point = createWarpCornerHandler( PointQuad )
+			warpCornerHandler_src = createWarpCornerHandler( SrcQuad )
+			warpCornerHandler_dst = createWarpCornerHandler( DstQuad )
+
+			for sv in range( 0, numSampling + 1 ):
+				for su in range( 0, numSampling + 1 ):
+					u = su * ( 1 / float( numSampling ) )
+					v = sv * ( 1 / float( numSampling ) )
+
+					x, y = warpCornerHandler_point.calculateXYFromUV( u, v )
+					srcU, srcV = warpCornerHandler_src.calculateUVFromXY( x, y )
+					warpCornerHandler_dst.calculateXYFromUV( srcU, srcV )
+
+		def composedBatch():
+			quadToQuadTransform = QuadToQuadTransform( createWarpCornerHandler( SrcQuad ), createWarpCornerHandler( DstQuad ),
+													   createWarpCornerHandler( PointQuad ) )
+
+			samplingArray = np.linspace( 0, 1, numSampling + 1 )
+			u, v = np.meshgrid( samplingArray, samplingArray )
+
+			quadToQuadTransform.transformPointBatch( u, v )
+
+		def forwardDifference():
+			quadToQuadTransform = QuadToQuadTransform( createWarpCornerHandler( SrcQuad ), createWarpCornerHandler( DstQuad ),
+													   createWarpCornerHandler( PointQuad ) )
+
+			ProjectiveGridEvaluator( quadToQuadTransform.matrix ).evaluate( 0, 1.0 / numSampling, numSampling + 1,
+																			0, 1.0 / numSampling, numSampling + 1 )
+
+		resultList.append( measure( 'renderGridThreeHandler', threeHandler, repeat, numPoint, parameterDict ) )
+		resultList.append( measure( 'renderGridComposedBatch', composedBatch, repeat, numPoint, parameterDict ) )
+		resultList.append( measure( 'renderGridForwardDifference', forwardDifference, repeat, numPoint, parameterDict ) )
+
+	return resultList
+
+def benchmarkImageWarp( repeat, imageShapeList ):
+	''' This function will benchmark image warp paths
+	'''
+
+	randomState = np.random.RandomState( RandomSeed )
+
+	resultList = []
+
+	for imageShape in imageShapeList:
+
+		height, width = imageShape[ :2 ]
+		src = randomState.randint( 0, 256, size = imageShape ).astype( np.uint8 )
+
+		srcQuad = [ [ 0, 0 ], [ width - 1, 0 ], [ width - 1, height - 1 ], [ 0, height - 1 ] ]
+		dstQuad = [ [ 0.1 * width, 0.1 * height ], [ 0.9 * width, 0.05 * height ],
+					[ 0.95 * width, 0.9 * height ], [ 0.05 * width, 0.95 * height ] ]
+
+		remapTable = bakeRemapTable( srcQuad, dstQuad, imageShape, srcShape = imageShape )
+		out = np.empty_like( src )
+		scratch = remapTable.createScratch( src )
+
+		for interpolation in InterpolationList:
+
+			parameterDict = { 'height':height, 'width':width, 'channel':imageShape[2], 'interpolation':interpolation }
+			numPixel = height * width
+
+			resultList.append( measure( 'warpImage', lambda: warpImage( src, srcQuad, dstQuad, imageShape, interpolation ),
+										repeat, numPixel, parameterDict ) )
+			resultList.append( measure( 'warpImageTiled', lambda: warpImageTiled( src, srcQuad, dstQuad, imageShape, interpolation ),
+										repeat, numPixel, parameterDict ) )
+			resultList.append( measure( 'remapTableApply', lambda: remapTable.apply( src, interpolation, out = out, scratch = scratch ),
+										repeat, numPixel, parameterDict ) )
+
+		#	quad covering tenth of canvas, cost should follow quad area
+		smallQuad = [ [ 0.1 * width, 0.1 * height ], [ 0.4 * width, 0.12 * height ],
+					  [ 0.42 * width, 0.38 * height ], [ 0.08 * width, 0.4 * height ] ]
+
+		parameterDict = { 'height':height, 'width':width, 'channel':imageShape[2], 'interpolation':InterpolationBilinear }
+		resultList.append( measure( 'warpImageSmallQuad', lambda: warpImage( src, srcQuad, smallQuad, imageShape ),
+									repeat, height * width, parameterDict ) )
+
+		parameterDict = { 'height':height, 'width':width, 'channel':imageShape[2] }
+		resultList.append( measure( 'buildImagePyramid', lambda: ImagePyramid( src ), repeat, height * width, parameterDict ) )
+
+		#	pyramid is built once and reused, as caller warping the same source would
+		imagePyramid = ImagePyramid( src )
+
+		for interpolation in PyramidInterpolationList:
+
+			parameterDict = { 'height':height, 'width':width, 'channel':imageShape[2], 'interpolation':interpolation }
+
+			resultList.append( measure( 'warpImagePyramid', lambda: warpImage( imagePyramid, srcQuad, dstQuad, imageShape, interpolation ),
+										repeat, height * width, parameterDict ) )
+
+	return resultList
+
+def runBenchmark( repeat, flagQuick = False ):
+	''' This function will run every benchmark case and return report dict
+	'''
+
+	resultList = []
+	resultList += benchmarkSolve( repeat )
+	resultList += benchmarkEstimate( repeat, QuickCorrespondenceCountList if flagQuick else CorrespondenceCountList )
+	resultList += benchmarkPointMapping( repeat, QuickPointCountList if flagQuick else PointCountList )
+	resultList += benchmarkRenderGrid( repeat, QuickSamplingList if flagQuick else SamplingList )
+	resultList += benchmarkImageWarp( repeat, QuickImageShapeList if flagQuick else ImageShapeList )
+
+	return { 'version':ProgramVersion, 'python':platform.python_version(), 'numpy':np.__version__,
+			 'machine':platform.machine(), 'repeat':repeat, 'quick':flagQuick, 'result':resultList }
+
+######################################################
+#	Main Function
+
+def main():
+	'''	 get option and arguments before next process
+	'''
+
+	#	Initialize option parser
+	parser = optparse.OptionParser( usage='%prog [options]',
+									prog=ProgramName,
+									version='Version :: {}'.format( ProgramVersion ) )
+
+	#	-o  :: Write JSON report to file ( None )
+	parser.add_option( '-o', dest='outputPath', help='Write JSON report to file ( None )',
+						default=None )
+
+	#	-r  :: Number of repeat per case ( 10 )
+	parser.add_option( '-r', dest='repeat', help='Number of repeat per case ( 10 )',
+						type='int', default=10 )
+
+	#	-q  :: Quick run with small sizes ( False )
+	parser.add_option( '-q', dest='flagQuick', help='Quick run with small sizes ( False )',
+						action='store_true', default=False )
+
+	#	Option and Arguments
+	options, args = parser.parse_args()
+
+	#	Check number of arguments
+	if NumberRequireArgument != -1 and NumberRequireArgument != len( args ):
+
+		print 'Check arguments, Because number of arguments is wrong!!!'
+		print '>>> Terminate script'
+		sys.exit( -1 )
+
+	##################################################################################
+	#
+	#	My code
+	#
+
+	report = runBenchmark( options.repeat, options.flagQuick )
+
+	for result in report[ 'result' ]:
+		parameterString = ' '.join( '{}={}'.format( key, result[ 'parameter' ][ key ] ) for key in sorted( result[ 'parameter' ] ) )
+		print '{:<28} {:<56} p50 {:9.3f} ms  p99 {:9.3f} ms  {:12.0f} item/s  peak {:8.1f} MB'.format(
+				result[ 'name' ], parameterString, result[ 'p50Second' ] * 1000, result[ 'p99Second' ] * 1000,
+				result[ 'itemPerSecond' ] or 0, ( result[ 'peakMemoryByte' ] or 0 ) / float( 1 << 20 ) )
+
+	if options.outputPath is not None:
+		with open( options.outputPath, 'w' ) as outputFile:
+			json.dump( report, outputFile, indent = 2, sort_keys = True )
+
+		print '>>> Write report to {}'.format( options.outputPath )
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	print '\nDescription :: {}\n'.format( ModuleDescription )
+
+	#	Call main function
+	main()
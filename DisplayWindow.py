@@ -0,0 +1,537 @@
+#! /usr/bin/env python
+#
+#	Create date 2017/10/15
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import math
+
+import numpy as np
+
+from fltk import *
+
+from OpenGL import GL, GLU
+
+######################################################
+#	Import Local
+
+#	Grid Renderer
+from GridRenderer import VertexBuffer, computeSrcGridVertexArray, computeDstGridVertexArray, drawVertexArray, \
+						 snapshotPointList
+
+#	Latest Wins Scheduler
+from LatestWinsScheduler import LatestWinsScheduler
+
+#	Point Grid Index
+from PointGridIndex import PointGridIndex
+
+#	Point Store
+from PointStore import PointStore, PointView, PointSetPoint, PointSetSrcPoint, PointSetDstPoint, PointSetList
+
+#	Transform Cache
+from TransformCache import TransformCache
+
+######################################################
+#	Globel Member
+
+NumSamplingU = 20
+NumSamplingV = 20
+
+#	NOTES - set pixel tolerance to sample grid adaptively, dense only where
+#	        perspective bend it, instead of fixed NumSamplingU by NumSamplingV
+AdaptiveSamplingTolerance = None
+
+#	NOTES - shared by all display window, so redraw with unmoved corners skip the solve
+WarpTransformCache = TransformCache( maxSize = 64 )
+
+#	NOTES - draw sampling grid from cached vertex buffer object,
+#	        disable to draw from client memory vertex array
+UseVertexBufferObject = True
+
+#	NOTES - interval to check finished grid computed on worker thread,
+#	        about one display refresh
+GridResultPollInterval = 1 / 60.0
+
+#	NOTES - about grab size of display window, so that picking visit 3-by-3 buckets
+PointIndexCellSize = 10.0
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class PointObject( object ):
+	'''	this class designed for point object,
+		point, srcPoint and dstPoint are views into point store
+	'''
+
+	__slots__ = ( 'point', 'srcPoint', 'dstPoint' )
+
+	def __init__( self, x, y ):
+		'''	initialize class.
+		'''
+
+		#	own single point store until point object is added to point handler
+		pointStore = PointStore( capacity = 1 )
+
+		self.bindPointStore( pointStore, pointStore.addPoint( x, y ) )
+
+	def bindPointStore( self, pointStore, index ):
+		'''	this function will point views of point object into point store
+		'''
+
+		self.point    = PointView( pointStore, PointSetPoint, index )
+
+		self.srcPoint = PointView( pointStore, PointSetSrcPoint, index )
+		self.dstPoint = PointView( pointStore, PointSetDstPoint, index )
+
+	def render( self ):
+		'''	this function will render point to OpenGL
+		'''
+
+		GL.glColor4f( 1.0, 1.0, 1.0, 1.0 )
+		GL.glPointSize( 8.0 )
+
+		GL.glBegin( GL.GL_POINTS )
+		GL.glVertex2f( self.point.x, self.point.y )
+		GL.glEnd()
+
+class PointHandler( object ):
+	'''	this class designed for point handler
+	'''
+
+	def __init__( self, llx, lly, urx, ury ):
+		'''	initialize class.
+		'''
+
+		self.llx = llx
+		self.lly = lly
+		self.urx = urx
+		self.ury = ury
+
+		#	create empty list to store point object
+		self.pointList        = []
+
+		#	coordinate of every point object, shared by all point set
+		self.pointStore       = PointStore()
+
+		#	create empty list to store openGL widget
+		self.openGLWidgetList = []
+
+		#	version of each point set, increase whenever point set is changed
+		#	so that widget can tell whether its cached result is still valid
+		self.versionDict = dict( ( pointSetName, 0 ) for pointSetName in PointSetList )
+
+		#	spatial index of each point set for picking
+		self.pointIndexDict = dict( ( pointSetName, PointGridIndex( PointIndexCellSize ) ) for pointSetName in PointSetList )
+
+	def addPoint( self, pointObject ):
+		'''	add point object to list
+		'''
+
+		#	move coordinate of point object into shared point store
+		positionDict = dict( ( pointSetName, ( getattr( pointObject, pointSetName ).x, getattr( pointObject, pointSetName ).y ) )
+								for pointSetName in PointSetList )
+		pointObject.bindPointStore( self.pointStore, self.pointStore.addPointObject( positionDict ) )
+
+		self.pointList.append( pointObject )
+
+		#	every point set get new point
+		for pointSetName in PointSetList:
+			point = getattr( pointObject, pointSetName )
+			self.pointIndexDict[ pointSetName ].insert( pointObject, point.x, point.y )
+
+			self.versionDict[ pointSetName ] += 1
+
+	def setPointPosition( self, pointObject, pointSetName, x, y ):
+		'''	set position of point object in point set, keep spatial index
+			up to date and redraw widget depend on it.
+			NOTES - point should be moved through this function, not by setting x and y directly
+		'''
+
+		point = getattr( pointObject, pointSetName )
+		point.x = x
+		point.y = y
+
+		self.pointIndexDict[ pointSetName ].move( pointObject, x, y )
+
+		self.markPointSetChanged( pointSetName )
+
+	def getPointArray( self, pointSetName ):
+		'''	return N-by-2 float64 coordinate array of point set without copy,
+			row order follow point list
+		'''
+
+		return self.pointStore.getArray( pointSetName )
+
+	def findNearestPoint( self, pointSetName, x, y, radius ):
+		'''	return point object whose point in point set is nearest to
+			( x, y ) within radius, or None
+		'''
+
+		return self.pointIndexDict[ pointSetName ].nearest( x, y, radius )
+
+	def getVersion( self, pointSetNameList ):
+		'''	return version of given point sets as tuple
+		'''
+
+		return tuple( self.versionDict[ pointSetName ] for pointSetName in pointSetNameList )
+
+	def markPointSetChanged( self, pointSetName ):
+		'''	mark point set as changed and redraw only widget depend on it
+		'''
+
+		self.versionDict[ pointSetName ] += 1
+
+		self.updateOpenGLWidget( pointSetName )
+
+	def addOpenGLWidget( self, openGLWidget ):
+		'''	add openGL widget to list
+		'''	
+
+		self.openGLWidgetList.append( openGLWidget )
+
+	def updateOpenGLWidget( self, pointSetName = None ):
+		'''	redraw widget in openGL widget list which display given point set,
+			or all widget if point set is not given
+		'''
+
+		#	loop over all openGL widget list and call redraw
+		for openGLWidget in self.openGLWidgetList:
+
+			if pointSetName is not None and pointSetName not in openGLWidget.DisplayPointSetList:
+				continue
+
+			openGLWidget.redraw()
+
+class DisplayWindow( Fl_Gl_Window ):
+	'''	this class designed for display window
+	'''
+
+	GrabSize = 10.0
+
+	#	point set moved by grabbing point in this window
+	GrabPointSet = PointSetPoint
+
+	#	point sets drawn in this window, window is redrawn when one of them changed
+	DisplayPointSetList = [ PointSetPoint ]
+
+	#	point sets used to compute sampling grid, grid is recomputed when one of them changed
+	GridPointSetList = []
+
+	def __init__( self, x, y, w, h, pointHandler, l = 'DisplayWindow' ):
+		'''	initialize class.
+		'''
+		Fl_Gl_Window.__init__( self, x, y, w, h, l )
+
+		#	store point handler to member class
+		self.pointHandler = pointHandler
+		self.pointHandler.addOpenGLWidget( self )
+
+		#	declare variable to store grab point object
+		self.grabPointObject = None
+
+		#	declare variable to store vertex buffer of sampling grid
+		self.gridVertexBuffer = VertexBuffer() if UseVertexBufferObject else None
+
+		#	declare variable to store cached sampling grid and point set version it computed from
+		self.gridVertexArray = None
+		self.gridVersion     = None
+
+		#	grid is recomputed on worker thread, only the latest point position is computed
+		self.gridScheduler = LatestWinsScheduler( l )
+		self.pendingGridVersion = None
+		self.isPollingGridResult = False
+
+		#	declare variable to store matrices of last draw used to unproject mouse position
+		self.modelview  = None
+		self.projection = None
+		self.viewport   = None
+
+	def draw( self ):
+		'''	this function will override from fltk
+		'''
+
+		#	specify the lower left corner of the viewport rectangle, in pixels. 
+		#		and size of the viewport
+		GL.glViewport( 0, 0, self.w(), self.h() )
+
+		#	set background color and opaque
+		GL.glClearColor( 0.0, 0.0, 0.0, 0.0 )
+
+		#	clear gl
+		GL.glClearDepth( 0.0 )
+		GL.glClear( GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT )
+
+		#	setup smooth point
+		GL.glEnable( GL.GL_BLEND )
+		GL.glBlendFunc( GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA )
+		GL.glEnable( GL.GL_POINT_SMOOTH )
+
+		#	set matrix mode to projection
+		GL.glMatrixMode( GL.GL_PROJECTION )
+
+		#	reset the projection matrix
+		GL.glLoadIdentity()
+
+		#	orthographic projection (xLeft, xRight, yBottom, yTop, zNear, zFar)
+		#		relative to camera's eye position.
+		GL.glOrtho( -200, 200, -200, 200, -1, 1 )
+
+		#	set matrix mode to model view
+		GL.glMatrixMode( GL.GL_MODELVIEW )
+
+		#	reset the projection matrix
+		GL.glLoadIdentity()
+
+		#	keep matrices so that mouse event does not query GL state every time
+		self.modelview = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
+		self.projection = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
+		self.viewport = GL.glGetIntegerv( GL.GL_VIEWPORT )
+
+		#	call render function 
+		self.render()
+
+	def handle( self, event ):
+		'''	this function will override from fltk
+		'''
+
+		#	get fl event key
+		key = Fl.event_key()
+
+		#	get fl modifier
+		modifier = Fl_event_alt() | Fl_event_ctrl() | Fl_event_shift()
+
+		#	get mouse button
+		mouseButton = Fl_event_button()
+
+		#	get mouse position on image window
+		x = Fl.event_x()
+		y = Fl.event_y()
+
+		#	create key dict
+		keyDict = { 'modifier':modifier, 'key':key, 'mouseState':event }
+
+		if  event in [ FL_PUSH, FL_DRAG, FL_RELEASE ]:
+
+			#	get matrices of last draw, query them if window is not drawn yet
+			if self.viewport is None:
+				self.modelview = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
+				self.projection = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
+				self.viewport = GL.glGetIntegerv( GL.GL_VIEWPORT )
+
+			#	get the world coordinates from the screen coordinates
+			worldPosition = GLU.gluUnProject( x, self.viewport[3] - y, 0, self.modelview, self.projection, self.viewport )
+
+			#	call the grab point event function
+			self.grabPointEvent_callback( worldPosition[0], worldPosition[1], keyDict )
+			return True
+
+		return Fl_Gl_Window.handle( self, event )
+
+	#
+	#	Operation Function
+	#
+
+	def render( self ):
+		'''	this function will render to OpenGL
+		'''
+
+		GL.glColor4f( 1.0, 1.0, 1.0, 1.0 )
+		GL.glLineWidth( 1.0 )
+
+		GL.glBegin( GL.GL_LINE_LOOP )
+		GL.glVertex2f( self.pointHandler.llx, self.pointHandler.lly )
+		GL.glVertex2f( self.pointHandler.urx, self.pointHandler.lly )
+		GL.glVertex2f( self.pointHandler.urx, self.pointHandler.ury )
+		GL.glVertex2f( self.pointHandler.llx, self.pointHandler.ury )
+		GL.glEnd()
+
+		GL.glColor4f( 1.0, 1.0, 1.0, 1.0 )
+		GL.glPointSize( 8.0 )
+
+		#	draw every point straight from point store
+		drawVertexArray( self.pointHandler.getPointArray( PointSetPoint ), GL.GL_POINTS )
+
+	#
+	#	Callback Function
+	#
+
+	def pollGridResult_callback( self, *args ):
+		'''	this function will take grid finished on worker thread and redraw,
+			it keep polling until worker is idle
+		'''
+
+		#	check idle before take result, so that result finished in between is not missed
+		isIdle = self.gridScheduler.isIdle()
+
+		try:
+			result = self.gridScheduler.takeResult()
+		except Exception as e:
+			print 'Can not warp this grid.'
+			result = None
+
+		if result is not None:
+			self.gridVersion, self.gridVertexArray = result
+			self.redraw()
+
+		if isIdle:
+			self.isPollingGridResult = False
+		else:
+			Fl.add_timeout( GridResultPollInterval, self.pollGridResult_callback )
+
+	def grabPointEvent_callback( self, sceneX, sceneY, keyDict ):
+		'''	this function will grab point in openGL widget 
+		'''
+
+		if keyDict[ 'mouseState' ] == FL_PUSH:
+
+			#	pick nearest point within grab radius through spatial index
+			self.grabPointObject = self.pointHandler.findNearestPoint( self.GrabPointSet, sceneX, sceneY, DisplayWindow.GrabSize )
+
+		elif keyDict[ 'mouseState' ] == FL_DRAG and self.grabPointObject != None:
+
+			#	set point position, this also redraw widget that display grabbed point set
+			self.setPointPosition_internal( sceneX, sceneY )
+
+		elif keyDict[ 'mouseState' ] == FL_RELEASE:
+
+			#	set grab point object to none
+			self.grabPointObject = None
+
+	#
+	#	Internal Function
+	#
+
+	def getGridVertexArray_internal( self ):
+		'''	this function will return sampling grid. When point set it depend on
+			has changed, recomputation is submitted to worker thread and the last
+			finished grid is returned meanwhile
+		'''
+
+		version = self.pointHandler.getVersion( self.GridPointSetList )
+
+		#	compute first grid directly so that window is never drawn empty
+		if self.gridVertexArray is None:
+			self.gridVertexArray = self.computeGridVertexArray_internal( self.pointHandler.pointList )
+			self.gridVersion = version
+
+		elif version != self.gridVersion and version != self.pendingGridVersion:
+			self.pendingGridVersion = version
+			self.gridScheduler.submit( version, self.computeGridVertexArray_internal, snapshotPointList( self.pointHandler.pointList ) )
+
+			if not self.isPollingGridResult:
+				self.isPollingGridResult = True
+				Fl.add_timeout( GridResultPollInterval, self.pollGridResult_callback )
+
+		return self.gridVertexArray
+
+	def computeGridVertexArray_internal( self, pointList ):
+		'''	this function will compute sampling grid from point list,
+			base window draw no grid so empty vertex array is returned
+		'''
+
+		return np.zeros( ( 0, 2 ), dtype = np.float32 )
+
+	def setPointPosition_internal( self, pointX, pointY ):
+		'''	this function will set position of grab point set to point object
+		'''
+
+		self.pointHandler.setPointPosition( self.grabPointObject, self.GrabPointSet, pointX, pointY )
+
+class SrcDisplayWindow( DisplayWindow ):
+
+	GrabPointSet = PointSetSrcPoint
+
+	DisplayPointSetList = [ PointSetPoint, PointSetSrcPoint ]
+
+	GridPointSetList = [ PointSetPoint ]
+
+	def __init__( self, x, y, w, h, pointHandler ):
+		'''	initialize class.
+		'''
+		DisplayWindow.__init__( self, x, y, w, h, pointHandler, 'Source Display Window' )
+
+	def render( self ):
+		'''	this function will render to OpenGL
+		'''
+		DisplayWindow.render( self )
+		
+		GL.glColor4f( 1.0, 0.0, 0.0, 1.0 )
+		GL.glPointSize( 8.0 )
+		GL.glLineWidth( 1.0 )
+		
+		#	draw point and outline straight from point store
+		pointArray = self.pointHandler.getPointArray( PointSetSrcPoint )
+
+		drawVertexArray( pointArray, GL.GL_POINTS )
+		drawVertexArray( pointArray, GL.GL_LINE_LOOP )
+
+		GL.glPointSize( 3.0 )
+		
+		GL.glColor4f( 0.0, 1.0, 1.0, 1.0 )
+
+		#	draw whole sampling grid with single call
+		drawVertexArray( self.getGridVertexArray_internal(), GL.GL_POINTS, self.gridVertexBuffer )
+
+	#
+	#	Internal Function
+	#
+
+	def computeGridVertexArray_internal( self, pointList ):
+		'''	this function will compute sampling grid of point quad
+		'''
+
+		return computeSrcGridVertexArray( pointList, NumSamplingU, NumSamplingV, WarpTransformCache, AdaptiveSamplingTolerance )
+
+class DstDisplayWindow( DisplayWindow ):
+
+	GrabPointSet = PointSetDstPoint
+
+	#	NOTES - remapped grid depend on source point too
+	DisplayPointSetList = [ PointSetPoint, PointSetSrcPoint, PointSetDstPoint ]
+
+	GridPointSetList = [ PointSetPoint, PointSetSrcPoint, PointSetDstPoint ]
+
+	def __init__( self, x, y, w, h, pointHandler ):
+		'''	initialize class.
+		'''
+		DisplayWindow.__init__( self, x, y, w, h, pointHandler, 'Destination Display Window' )
+
+	def render( self ):
+		'''	this function will render to OpenGL
+		'''
+		DisplayWindow.render( self )
+
+		GL.glColor4f( 0.0, 1.0, 0.0, 1.0 )
+		GL.glPointSize( 8.0 )
+		GL.glLineWidth( 1.0 )
+		
+		#	draw point and outline straight from point store
+		pointArray = self.pointHandler.getPointArray( PointSetDstPoint )
+
+		drawVertexArray( pointArray, GL.GL_POINTS )
+		drawVertexArray( pointArray, GL.GL_LINE_LOOP )
+
+		GL.glPointSize( 3.0 )
+		
+		GL.glColor4f( 0.0, 1.0, 1.0, 1.0 )
+
+		#	draw whole remapped grid with single call
+		drawVertexArray( self.getGridVertexArray_internal(), GL.GL_POINTS, self.gridVertexBuffer )
+
+	#
+	#	Internal Function
+	#
+
+	def computeGridVertexArray_internal( self, pointList ):
+		'''	this function will compute sampling grid remapped from source quad into destination quad
+		'''
+
+		return computeDstGridVertexArray( pointList, NumSamplingU, NumSamplingV, WarpTransformCache, AdaptiveSamplingTolerance )
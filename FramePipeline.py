@@ -0,0 +1,218 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import time
+import threading
+
+try:
+	import Queue as queue
+except ImportError:
+	import queue
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Image Warper
+from ImageWarper import InterpolationBilinear
+
+#	Remap Table
+from RemapTable import TableFormatFloat32, bakeRemapTable
+
+######################################################
+#	Globel Member
+
+DefaultPrefetch = 2
+
+#	NOTES - number of output buffer yielded in turn by warpFrameStream,
+#	        caller must finish with a frame before requesting this many more
+NumOutputBuffer = 2
+
+#	interval to check stop request while producer thread is blocked
+PollInterval = 0.1
+
+######################################################
+#	Helper Function
+
+def iterateFrameFile( directory, frameShape = None, dtype = None ):
+	''' This function will yield frame from every file in directory in name order
+	    INPUTS : directory of .npy file, or raw file with frame shape and dtype
+	    OUTPUT : generator of frame as read-only memory map
+	'''
+
+	for fileName in sorted( os.listdir( directory ) ):
+
+		path = os.path.join( directory, fileName )
+
+		if not os.path.isfile( path ):
+			continue
+
+		if os.path.splitext( fileName )[1] == '.npy':
+			yield np.load( path, mmap_mode = 'r' )
+
+		elif frameShape is not None and dtype is not None:
+			yield np.memmap( path, dtype = dtype, mode = 'r', shape = tuple( frameShape ) )
+
+def iterateMemmapFrame( path, frameShape, dtype, offset = 0 ):
+	''' This function will yield frame from raw dump of consecutive frames
+	    INPUTS : path to raw file, frame shape, dtype and byte offset of first frame
+	    OUTPUT : generator of frame as read-only memory map
+	'''
+
+	frameShape = tuple( frameShape )
+	frameSize = int( np.prod( frameShape ) ) * np.dtype( dtype ).itemsize
+
+	numFrame = ( os.path.getsize( path ) - offset ) // frameSize
+
+	if numFrame <= 0:
+		return
+
+	frameArray = np.memmap( path, dtype = dtype, mode = 'r', offset = offset, shape = ( numFrame, ) + frameShape )
+
+	for frameIndex in range( numFrame ):
+		yield frameArray[ frameIndex ]
+
+def putUntilStopped_internal( readyQueue, item, stopEvent ):
+	''' This function will put item into bounded queue, polling stop event
+	    so that producer never block after consumer is gone
+	    OUTPUT : True if item is put, False if stop event is set first
+	'''
+
+	while not stopEvent.is_set():
+		try:
+			readyQueue.put( item, timeout = PollInterval )
+			return True
+		except queue.Full:
+			pass
+
+	return False
+
+def prefetchFrame_internal( frameIterable, readyQueue, freeQueue, stopEvent, prefetch ):
+	''' This function will run in producer thread, copy each frame into free
+	    input buffer and pass it to consumer through ready queue
+	'''
+
+	try:
+		bufferCount = 0
+
+		for frame in frameIterable:
+
+			#	allocate input buffer lazily until ring is full,
+			#	after that buffer is only recycled
+			if bufferCount < prefetch + 1 and freeQueue.empty():
+				frameBuffer = np.empty( frame.shape, dtype = frame.dtype )
+				bufferCount += 1
+			else:
+				frameBuffer = None
+				while frameBuffer is None:
+					if stopEvent.is_set():
+						return
+					try:
+						frameBuffer = freeQueue.get( timeout = PollInterval )
+					except queue.Empty:
+						pass
+
+			np.copyto( frameBuffer, frame )
+
+			if not putUntilStopped_internal( readyQueue, ( frameBuffer, None ), stopEvent ):
+				return
+
+		putUntilStopped_internal( readyQueue, ( None, None ), stopEvent )
+
+	except Exception as e:
+		putUntilStopped_internal( readyQueue, ( None, e ), stopEvent )
+
+def warpFrameStream( frameIterable, srcQuad, dstQuad, outShape, interpolation = InterpolationBilinear,
+					 fillValue = 0, prefetch = DefaultPrefetch ):
+	''' This function will warp every frame of frame iterable by quad transform
+	    INPUTS : iterable of frame as numpy array, source and destination quad
+	             as 4-by-2 array of P00, P10, P11, P01, output (height, width),
+	             interpolation, value outside destination quad, number of
+	             frame read ahead by background thread
+	    OUTPUT : generator of warped frame
+
+	    NOTES - transform is solved and baked into remap table once, and its
+	            gather is baked on first frame. Input, output and scratch buffers
+	            of remap table are recycled, so there is no per-frame allocation
+	            in steady state. Yielded array is reused after NumOutputBuffer
+	            more frames, copy it if it must be kept longer
+	'''
+
+	if prefetch < 1:
+		raise ValueError( 'Prefetch must be at least 1' )
+
+	remapTable = bakeRemapTable( srcQuad, dstQuad, outShape, TableFormatFloat32 )
+
+	readyQueue = queue.Queue( maxsize = prefetch )
+	freeQueue = queue.Queue()
+	stopEvent = threading.Event()
+
+	producerThread = threading.Thread( target = prefetchFrame_internal,
+									   args = ( iter( frameIterable ), readyQueue, freeQueue, stopEvent, prefetch ) )
+	producerThread.daemon = True
+	producerThread.start()
+
+	outputBufferList = []
+	scratch = None
+	frameIndex = 0
+
+	try:
+		while True:
+
+			frameBuffer, error = readyQueue.get()
+
+			if error is not None:
+				raise error
+
+			if frameBuffer is None:
+				break
+
+			#	bake gather and allocate double-buffered output and scratch on first frame
+			if not outputBufferList:
+				remapTable.bakeGather( frameBuffer.shape )
+				scratch = remapTable.createScratch( frameBuffer )
+				outputBufferList = [ np.empty( remapTable.shape + frameBuffer.shape[ 2: ], dtype = frameBuffer.dtype )
+										for _ in range( NumOutputBuffer ) ]
+
+			out = outputBufferList[ frameIndex % NumOutputBuffer ]
+			remapTable.apply( frameBuffer, interpolation, fillValue, out = out, scratch = scratch )
+
+			#	give input buffer back to producer
+			freeQueue.put( frameBuffer )
+
+			frameIndex += 1
+
+			yield out
+
+	finally:
+		stopEvent.set()
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	frameList = [ np.random.randint( 0, 256, size = ( 480, 640, 3 ) ).astype( np.uint8 ) for _ in range( 4 ) ]
+
+	srcQuad = [ [ 0, 0 ], [ 639, 0 ], [ 639, 479 ], [ 0, 479 ] ]
+	dstQuad = [ [ 40, 20 ], [ 600, 10 ], [ 620, 460 ], [ 20, 470 ] ]
+
+	numFrame = 120
+
+	startTime = time.time()
+
+	for out in warpFrameStream( ( frameList[ i % len( frameList ) ] for i in range( numFrame ) ), srcQuad, dstQuad, ( 480, 640 ) ):
+		pass
+
+	print '{:.1f} fps'.format( numFrame / ( time.time() - startTime ) )
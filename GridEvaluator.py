@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import time
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import Epsilon, TransformProjective, TransformAffine, classifyTransformMatrix
+
+######################################################
+#	Globel Member
+
+#	NOTES - stepped term is reset to exact value every this many step,
+#	        so rounding error of repeated addition cannot grow past it
+DefaultReanchorInterval = 64
+
+######################################################
+#	Helper Function
+
+def computeSteppedTerm( start, step, count, reanchorInterval = DefaultReanchorInterval ):
+	''' This function will compute start + i * step for i in [0, count)
+	    by repeated addition, re-anchored to exact value every reanchorInterval step
+	    INPUTS : start value, step, number of value, re-anchor interval
+	    OUTPUT : count float64 array
+	'''
+
+	if reanchorInterval < 1:
+		raise ValueError( 'Re-anchor interval must be at least 1' )
+
+	numBlock = -( -count // reanchorInterval )
+
+	#	each row is one block, first column is exact anchor and the rest is step
+	blockArray = np.full( ( numBlock, reanchorInterval ), float( step ) )
+	blockArray[ :, 0 ] = start + np.arange( numBlock ) * reanchorInterval * float( step )
+
+	return np.cumsum( blockArray, axis = 1 ).ravel()[ :count ]
+
+######################################################
+#	Definition Class
+
+class ProjectiveGridEvaluator( object ):
+	'''	this class designed for evaluating projective map on regular grid
+		by forward differencing. Numerator and denominator are linear in
+		u and v, so they split into term along u plus term along v, which
+		are stepped by addition. Each grid point then cost one addition per
+		row of matrix and one divide, no matrix product
+	'''
+
+	def __init__( self, matrix, reanchorInterval = DefaultReanchorInterval, transformClass = None ):
+		'''	initialize class.
+			matrix is projective 3-by-3 matrix, such as projectiveMatrix of warp corner handler,
+			transform class is classified from matrix if it is not given
+		'''
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.matrix = np.asarray( matrix, dtype = np.float64 )
+		self.reanchorInterval = reanchorInterval
+
+		if transformClass is None:
+			transformClass = classifyTransformMatrix( self.matrix )
+
+		self.transformClass = transformClass
+
+	#
+	#	Operation Function
+	#
+
+	def evaluate( self, u0, du, numU, v0, dv, numV, dtype = np.float64 ):
+		'''	this function will map grid u = u0 + i * du, v = v0 + j * dv
+			return x and y as numV-by-numU array of dtype, and boolean validity mask.
+			Point with w not positive is invalid and its x, y is meaningless but finite
+
+			NOTES - for scale-translate and identity class, x only depend on column
+			        and y only on row, so they are returned as read-only broadcast view
+		'''
+
+		termList = self.computeTerm_internal( u0, du, numU, v0, dv, numV )
+
+		#	w is 1 everywhere, no divide needed
+		if self.transformClass != TransformProjective:
+
+			validMask = np.ones( ( numV, numU ), dtype = bool )
+
+			if self.transformClass == TransformAffine:
+				x, y = [ np.add( termU.astype( dtype )[ None, : ], termV.astype( dtype )[ :, None ] ) for termU, termV in termList[ :2 ] ]
+				return x, y, validMask
+
+			#	constant of x is in its term along v and constant of y is in its term along u
+			x = np.broadcast_to( ( termList[0][0] + termList[0][1][0] ).astype( dtype )[ None, : ], ( numV, numU ) )
+			y = np.broadcast_to( ( termList[1][1] + termList[1][0][0] ).astype( dtype )[ :, None ], ( numV, numU ) )
+
+			return x, y, validMask
+
+		#	one addition per grid point for each of x, y and w
+		x, y, w = [ np.add( termU.astype( dtype )[ None, : ], termV.astype( dtype )[ :, None ] ) for termU, termV in termList ]
+
+		validMask = w > Epsilon
+
+		#	replace invalid w, so that division never fail
+		np.copyto( w, 1.0, where = ~validMask )
+		np.reciprocal( w, out = w )
+
+		x *= w
+		y *= w
+
+		return x, y, validMask
+
+	def computeErrorBound( self, u0, du, numU, v0, dv, numV, dtype = np.float64 ):
+		'''	this function will return upper bound of absolute error of x and y
+			from evaluate compare to exact value, or inf if grid contain invalid point
+		'''
+
+		termList = self.computeTerm_internal( u0, du, numU, v0, dv, numV )
+
+		#	rounding error of repeated addition grow with distance to anchor
+		steppingEpsilon = np.finfo( np.float64 ).eps * min( self.reanchorInterval, max( numU, numV ) )
+		evaluateEpsilon = np.finfo( dtype ).eps
+
+		errorList = []
+		maxList = []
+
+		for termU, termV in termList:
+			maxTerm = np.abs( termU ).max() + np.abs( termV ).max()
+			maxList.append( maxTerm )
+
+			#	stepping, cast and addition of the two term
+			errorList.append( maxTerm * ( steppingEpsilon + 2 * evaluateEpsilon ) )
+
+		#	w of sum is smallest where both term is smallest
+		minW = termList[2][0].min() + termList[2][1].min()
+
+		if minW <= errorList[2] + Epsilon:
+			return np.inf
+
+		#	error of x = X / W from error of X and W, plus reciprocal and product
+		return max( ( errorList[i] + maxList[i] / minW * errorList[2] ) / ( minW - errorList[2] ) + maxList[i] / minW * 2 * evaluateEpsilon
+					for i in ( 0, 1 ) )
+
+	#
+	#	Internal Function
+	#
+
+	def computeTerm_internal( self, u0, du, numU, v0, dv, numV ):
+		'''	this function will return list of ( term along u, term along v )
+			for x, y and w, constant of row is kept in term along v
+		'''
+
+		m = self.matrix
+
+		return [ ( computeSteppedTerm( m[ row, 0 ] * u0, m[ row, 0 ] * du, numU, self.reanchorInterval ),
+				   computeSteppedTerm( m[ row, 1 ] * v0 + m[ row, 2 ], m[ row, 1 ] * dv, numV, self.reanchorInterval ) )
+					for row in range( 3 ) ]
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	from WarpCornerHandler import createWarpCornerHandler
+
+	warpCornerHandler = createWarpCornerHandler( [ [ 200, 100 ], [ 1700, 50 ], [ 1800, 1000 ], [ 100, 1050 ] ] )
+
+	gridEvaluator = ProjectiveGridEvaluator( warpCornerHandler.projectiveMatrix )
+
+	numU, numV = 1920, 1080
+
+	startTime = time.time()
+	x, y, validMask = gridEvaluator.evaluate( 0, 1.0 / ( numU - 1 ), numU, 0, 1.0 / ( numV - 1 ), numV )
+
+	print 'forward difference :: {:.1f} ms'.format( ( time.time() - startTime ) * 1000 )
+
+	u, v = np.meshgrid( np.linspace( 0, 1, numU ), np.linspace( 0, 1, numV ) )
+
+	startTime = time.time()
+	xyArray = warpCornerHandler.calculateXYFromUVBatch( u.ravel(), v.ravel() )
+
+	print 'matrix product :: {:.1f} ms'.format( ( time.time() - startTime ) * 1000 )
+
+	print 'max error {:.3g}, bound {:.3g}'.format( max( np.abs( x.ravel() - xyArray[ :, 0 ] ).max(), np.abs( y.ravel() - xyArray[ :, 1 ] ).max() ),
+												  gridEvaluator.computeErrorBound( 0, 1.0 / ( numU - 1 ), numU, 0, 1.0 / ( numV - 1 ), numV ) )
@@ -0,0 +1,328 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import types
+import collections
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import CornerPoint, WarpCornerHandler, QuadUnsolvableList, classifyQuadBatch
+
+#	Quad To Quad Transform
+from QuadToQuadTransform import QuadToQuadTransform
+
+#	Grid Evaluator
+from GridEvaluator import ProjectiveGridEvaluator
+
+#	Adaptive Sampler
+from AdaptiveSampler import AdaptiveSampler
+
+#	Point Store
+from PointStore import PointSetPoint, PointSetSrcPoint, PointSetDstPoint
+
+######################################################
+#	Globel Member
+
+#	NOTES - grid computation below does not touch OpenGL. Draw function and vertex
+#	        buffer import GL when called, so that grid can be computed without PyOpenGL
+#	        and GL can be replaced by RecordingGL to test drawing headlessly
+
+######################################################
+#	Helper Function
+
+def snapshotPointList( pointList ):
+	''' This function will copy coordinate of point object list,
+	    so that grid can be computed on other thread while points are dragged
+	    INPUTS : list of point object
+	    OUTPUT : list of point object snapshot
+	'''
+
+	return [ PointObjectSnapshot( pointObject ) for pointObject in pointList ]
+
+def computeSamplingGrid( numSamplingU, numSamplingV ):
+	''' This function will create uv of regular sampling grid
+	    INPUTS : number of sampling interval along u and v
+	    OUTPUT : ( numSamplingU + 1 ) * ( numSamplingV + 1 )-by-2 array,
+	             u run fastest as in nested sv / su loop
+	'''
+
+	u, v = np.meshgrid( np.linspace( 0, 1, numSamplingU + 1 ), np.linspace( 0, 1, numSamplingV + 1 ) )
+
+	return np.column_stack( ( u.ravel(), v.ravel() ) )
+
+def evaluateSamplingGrid( matrix, numSamplingU, numSamplingV ):
+	''' This function will map regular sampling grid by projective matrix
+	    with forward differencing instead of product per sample
+	    INPUTS : projective 3-by-3 matrix, number of sampling interval along u and v
+	    OUTPUT : N-by-2 float32 vertex array in order of computeSamplingGrid,
+	             sample that cannot be mapped is dropped
+	'''
+
+	x, y, validMask = ProjectiveGridEvaluator( matrix ).evaluate( 0, 1.0 / numSamplingU, numSamplingU + 1,
+																   0, 1.0 / numSamplingV, numSamplingV + 1, np.float32 )
+
+	return np.column_stack( ( x[ validMask ], y[ validMask ] ) )
+
+def evaluateAdaptiveGrid( matrix, tolerance ):
+	''' This function will map vertex of adaptive mesh of unit square by projective matrix
+	    INPUTS : projective 3-by-3 matrix, tolerance in unit of xy
+	    OUTPUT : N-by-2 float32 vertex array
+	'''
+
+	xyArray = AdaptiveSampler( matrix, tolerance ).sample()[1]
+
+	return np.ascontiguousarray( xyArray, dtype = np.float32 )
+
+def isPointListSolvable( pointList, pointSetNameList ):
+	''' This function will classify quads of point sets up front in single batch,
+	    so that grid of unsolvable quad is skipped instead of raising
+	    INPUTS : list of 4 point object, list of point set name
+	    OUTPUT : True if every quad can be solved
+	'''
+
+	cornerArray = [ [ ( getattr( pointObject, pointSetName ).x, getattr( pointObject, pointSetName ).y ) for pointObject in pointList ]
+					for pointSetName in pointSetNameList ]
+
+	return not np.in1d( classifyQuadBatch( cornerArray ), QuadUnsolvableList ).any()
+
+def computeSrcGridVertexArray( pointList, numSamplingU, numSamplingV, transformCache = None, tolerance = None ):
+	''' This function will compute sampling grid of point quad as drawn
+	    in source display window
+	    INPUTS : list of 4 point object, number of sampling, optional transform cache,
+	             optional tolerance to sample adaptively instead of regular grid
+	    OUTPUT : N-by-2 float32 vertex array, sample that cannot be warped is dropped
+	'''
+
+	if not isPointListSolvable( pointList, [ PointSetPoint ] ):
+		return np.zeros( ( 0, 2 ), dtype = np.float32 )
+
+	warpCornerHandler_point = WarpCornerHandler( pointList[0].point, pointList[1].point,
+												 pointList[2].point, pointList[3].point, transformCache = transformCache )
+
+	if tolerance is not None:
+		return evaluateAdaptiveGrid( warpCornerHandler_point.projectiveMatrix, tolerance )
+
+	return evaluateSamplingGrid( warpCornerHandler_point.projectiveMatrix, numSamplingU, numSamplingV )
+
+def computeDstGridVertexArray( pointList, numSamplingU, numSamplingV, transformCache = None, tolerance = None ):
+	''' This function will compute sampling grid of point quad remapped
+	    from source quad into destination quad as drawn in destination display window
+	    INPUTS : list of 4 point object, number of sampling, optional transform cache,
+	             optional tolerance to sample adaptively instead of regular grid
+	    OUTPUT : N-by-2 float32 vertex array, sample that cannot be warped is dropped
+	'''
+
+	if not isPointListSolvable( pointList, [ PointSetPoint, PointSetSrcPoint, PointSetDstPoint ] ):
+		return np.zeros( ( 0, 2 ), dtype = np.float32 )
+
+	warpCornerHandler_point = WarpCornerHandler( pointList[0].point, pointList[1].point,
+												 pointList[2].point, pointList[3].point, transformCache = transformCache )
+
+	warpCornerHandler_src = WarpCornerHandler( pointList[0].srcPoint, pointList[1].srcPoint,
+											   pointList[2].srcPoint, pointList[3].srcPoint, transformCache = transformCache )
+
+	warpCornerHandler_dst = WarpCornerHandler( pointList[0].dstPoint, pointList[1].dstPoint,
+											   pointList[2].dstPoint, pointList[3].dstPoint, transformCache = transformCache )
+
+	#	compose point -> src -> dst chain into single matrix
+	quadToQuadTransform = QuadToQuadTransform( warpCornerHandler_src, warpCornerHandler_dst, warpCornerHandler_point )
+
+	#	sample mapped through infinity is dropped instead of raising
+	if tolerance is not None:
+		return evaluateAdaptiveGrid( quadToQuadTransform.matrix, tolerance )
+
+	return evaluateSamplingGrid( quadToQuadTransform.matrix, numSamplingU, numSamplingV )
+
+def drawVertexArray( vertexArray, mode, vertexBuffer = None ):
+	''' This function will draw N-by-2 vertex array with single glDrawArrays
+	    INPUTS : contiguous float32 or float64 vertex array, GL primitive mode,
+	             optional vertex buffer to draw from
+	'''
+
+	if len( vertexArray ) == 0:
+		return
+
+	from OpenGL import GL
+
+	#	float64 array, such as point store, is drawn without conversion
+	vertexType = GL.GL_DOUBLE if vertexArray.dtype == np.float64 else GL.GL_FLOAT
+
+	GL.glEnableClientState( GL.GL_VERTEX_ARRAY )
+
+	if vertexBuffer is not None:
+		vertexBuffer.bind( vertexArray )
+		GL.glVertexPointer( 2, vertexType, 0, None )
+	else:
+		GL.glVertexPointer( 2, vertexType, 0, vertexArray )
+
+	GL.glDrawArrays( mode, 0, len( vertexArray ) )
+
+	if vertexBuffer is not None:
+		vertexBuffer.unbind()
+
+	GL.glDisableClientState( GL.GL_VERTEX_ARRAY )
+
+######################################################
+#	Definition Class
+
+class PointObjectSnapshot( object ):
+	'''	this class designed for read-only copy of point object coordinate
+	'''
+
+	def __init__( self, pointObject ):
+		'''	initialize class.
+		'''
+
+		self.point    = CornerPoint( pointObject.point.x, pointObject.point.y )
+		self.srcPoint = CornerPoint( pointObject.srcPoint.x, pointObject.srcPoint.y )
+		self.dstPoint = CornerPoint( pointObject.dstPoint.x, pointObject.dstPoint.y )
+
+class VertexBuffer( object ):
+	'''	this class designed for cached vertex buffer object
+		which upload vertex array only when array is changed
+	'''
+
+	def __init__( self ):
+		'''	initialize class.
+		'''
+
+		#	buffer is created lazily, it need current GL context
+		self.bufferId = None
+
+		#	declare variable to store uploaded vertex array
+		self.uploadedArray = None
+
+	def bind( self, vertexArray ):
+		'''	this function will bind buffer and upload vertex array if it is
+			not the array uploaded last time
+		'''
+
+		from OpenGL import GL
+
+		if self.bufferId is None:
+			self.bufferId = GL.glGenBuffers( 1 )
+
+		GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.bufferId )
+
+		if vertexArray is not self.uploadedArray:
+			GL.glBufferData( GL.GL_ARRAY_BUFFER, vertexArray.nbytes, vertexArray, GL.GL_DYNAMIC_DRAW )
+			self.uploadedArray = vertexArray
+
+	def unbind( self ):
+		'''	this function will unbind buffer
+		'''
+
+		from OpenGL import GL
+
+		GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+
+class RecordingGL( object ):
+	'''	this class designed for recording stub of OpenGL GL module.
+		Every gl function call is appended to call list and GL constant is its own name,
+		so that drawing can be checked without display
+	'''
+
+	def __init__( self ):
+		'''	initialize class.
+		'''
+
+		#	list of ( function name, argument tuple )
+		self.callList = []
+
+	def __getattr__( self, name ):
+		'''	this function will return recording function for gl function
+			and name for GL constant
+		'''
+
+		if name.startswith( 'GL_' ):
+			return name
+
+		if not name.startswith( 'gl' ):
+			raise AttributeError( name )
+
+		def record( *args ):
+			self.callList.append( ( name, args ) )
+
+			#	as buffer id of glGenBuffers
+			return len( self.callList )
+
+		return record
+
+	def install( self ):
+		'''	this function will install stub as OpenGL.GL module, so that
+			draw function import it instead of PyOpenGL
+		'''
+
+		openGLModule = types.ModuleType( 'OpenGL' )
+		openGLModule.GL = self
+
+		sys.modules[ 'OpenGL' ] = openGLModule
+		sys.modules[ 'OpenGL.GL' ] = self
+
+	def getCallList( self, name ):
+		'''	this function will return argument tuple of every call of gl function
+		'''
+
+		return [ args for callName, args in self.callList if callName == name ]
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code headlessly, draw 200-by-200 sampling grid
+		of source and destination window through recording stub of OpenGL
+	'''
+
+	recordingGL = RecordingGL()
+	recordingGL.install()
+
+	PointTuple = collections.namedtuple( 'PointTuple', [ 'point', 'srcPoint', 'dstPoint' ] )
+
+	pointList = [ PointTuple( CornerPoint( x, y ), CornerPoint( x, y ), CornerPoint( x * 1.2 + y * 0.1, y * 0.9 ) )
+					for x, y in [ ( -100, -100 ), ( 100, -100 ), ( 100, 100 ), ( -100, 100 ) ] ]
+
+	numSampling = 200
+	numVertex = ( numSampling + 1 ) ** 2
+
+	flagPass = True
+
+	for computeGridVertexArray in ( computeSrcGridVertexArray, computeDstGridVertexArray ):
+
+		vertexArray = computeGridVertexArray( pointList, numSampling, numSampling )
+
+		#	whole grid is single draw call
+		del recordingGL.callList[:]
+		drawVertexArray( vertexArray, recordingGL.GL_POINTS )
+		drawCallList = recordingGL.getCallList( 'glDrawArrays' )
+
+		#	vertex buffer upload grid once, second draw of the same array reuse it
+		vertexBuffer = VertexBuffer()
+
+		del recordingGL.callList[:]
+		drawVertexArray( vertexArray, recordingGL.GL_POINTS, vertexBuffer )
+		drawVertexArray( vertexArray, recordingGL.GL_POINTS, vertexBuffer )
+		bufferDrawCallList = recordingGL.getCallList( 'glDrawArrays' )
+		uploadCallList = recordingGL.getCallList( 'glBufferData' )
+
+		flagGridPass = ( drawCallList == [ ( 'GL_POINTS', 0, numVertex ) ] and
+						 bufferDrawCallList == drawCallList * 2 and len( uploadCallList ) == 1 )
+		flagPass = flagPass and flagGridPass
+
+		print '{} :: {} glDrawArrays of {} vertex, {} upload for 2 buffered draw :: {}'.format(
+				computeGridVertexArray.__name__, len( drawCallList ), drawCallList[0][2] if drawCallList else 0,
+				len( uploadCallList ), 'pass' if flagGridPass else 'FAIL' )
+
+	if not flagPass:
+		sys.exit( -1 )
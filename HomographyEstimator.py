@@ -0,0 +1,278 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import math
+import time
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import Epsilon, computeFourPointTransformMatrixBatch, toPointArray
+
+######################################################
+#	Globel Member
+
+#	NOTES - reprojection error in unit of destination point, pixel for detector
+DefaultInlierThreshold = 2.0
+
+#	NOTES - hypotheses are scored in chunk, after each chunk number of
+#	        hypothesis needed for DefaultConfidence is updated from best inlier ratio
+DefaultHypothesisChunk = 64
+DefaultMaxHypothesis = 1024
+DefaultConfidence = 0.99
+
+#	number of least-squares refit on inliers of best hypothesis
+DefaultNumRefine = 2
+
+######################################################
+#	Helper Function
+
+def computeNormalizeMatrix_internal( pointArray ):
+	''' This function will create similarity transform which move centroid of
+	    points to origin and scale their mean distance to sqrt(2)
+	    INPUTS : N-by-2 point array
+	    OUTPUT : 3-by-3 matrix
+	'''
+
+	centroid = pointArray.mean( axis = 0 )
+	meanDistance = np.sqrt( ( ( pointArray - centroid )**2 ).sum( axis = 1 ) ).mean()
+
+	scale = math.sqrt( 2 ) / max( meanDistance, Epsilon )
+
+	return np.array( [ [ scale, 0, -scale * centroid[0] ],
+					   [ 0, scale, -scale * centroid[1] ],
+					   [ 0, 0, 1 ] ] )
+
+def estimateHomography( srcPointArray, dstPointArray ):
+	''' This function will fit projective matrix from 4 or more point pairs
+	    by normalized direct linear transform in least-squares sense
+	    INPUTS : N-by-2 source point array, N-by-2 destination point array
+	    OUTPUT : projective 3-by-3 matrix which map source into destination,
+	             normalized so that [2,2] is 1 as four-point transform
+
+	    NOTES - points are normalized first, so that the solve is well conditioned
+	            in pixel coordinate. Raise ValueError when points do not fix the
+	            transform, such as fewer than 4 pairs or all points on single line
+	'''
+
+	srcPointArray = toPointArray( srcPointArray )
+	dstPointArray = toPointArray( dstPointArray )
+
+	if len( srcPointArray ) != len( dstPointArray ):
+		raise ValueError( 'Source and destination must have the same number of points' )
+
+	if len( srcPointArray ) < 4:
+		raise ValueError( 'At least 4 point pairs are required' )
+
+	srcNormalizeMatrix = computeNormalizeMatrix_internal( srcPointArray )
+	dstNormalizeMatrix = computeNormalizeMatrix_internal( dstPointArray )
+
+	x, y = ( srcPointArray * srcNormalizeMatrix[ 0, 0 ] + srcNormalizeMatrix[ :2, 2 ] ).T
+	xp, yp = ( dstPointArray * dstNormalizeMatrix[ 0, 0 ] + dstNormalizeMatrix[ :2, 2 ] ).T
+
+	#	two row per pair, A * h = 0 for h as flatten matrix
+	zero = np.zeros_like( x )
+	one = np.ones_like( x )
+
+	equationArray = np.empty( ( 2 * len( x ), 9 ) )
+	equationArray[ 0::2 ] = np.column_stack( ( -x, -y, -one, zero, zero, zero, xp * x, xp * y, xp ) )
+	equationArray[ 1::2 ] = np.column_stack( ( zero, zero, zero, -x, -y, -one, yp * x, yp * y, yp ) )
+
+	#	least-squares solution is eigenvector of smallest eigenvalue of A^T * A,
+	#	9-by-9 no matter how many pairs, normalization keep it well conditioned
+	eigenValue, eigenVector = np.linalg.eigh( np.dot( equationArray.T, equationArray ) )
+
+	#	second smallest eigenvalue near zero mean solution is not unique
+	if eigenValue[1] <= Epsilon * eigenValue[ -1 ]:
+		raise ValueError( 'Point pairs do not determine projective transform' )
+
+	matrix = np.dot( np.linalg.inv( dstNormalizeMatrix ), np.dot( eigenVector[ :, 0 ].reshape( 3, 3 ), srcNormalizeMatrix ) )
+
+	if abs( matrix[2,2] ) <= Epsilon * np.abs( matrix ).max():
+		raise ValueError( 'Fitted transform map source origin to infinity' )
+
+	return matrix / matrix[2,2]
+
+def computeReprojectionError( matrixArray, srcPointArray, dstPointArray ):
+	''' This function will compute squared reprojection error of every point
+	    pair under every matrix at once
+	    INPUTS : K-by-3-by-3 matrix array, N-by-2 source and destination point array
+	    OUTPUT : K-by-N squared error, inf where point is mapped through infinity
+	'''
+
+	#	homogeneous product of all matrix and all point, K-by-3-by-N
+	projectArray = np.einsum( 'kij,jn->kin', matrixArray[ :, :, :2 ], srcPointArray.T ) + matrixArray[ :, :, 2:3 ]
+
+	w = projectArray[ :, 2 ]
+	validMask = w > Epsilon
+	w = np.where( validMask, w, 1.0 )
+
+	errorX = projectArray[ :, 0 ] / w - dstPointArray[ :, 0 ]
+	errorY = projectArray[ :, 1 ] / w - dstPointArray[ :, 1 ]
+
+	return np.where( validMask, errorX**2 + errorY**2, np.inf )
+
+def computeHypothesisBatch( srcPointArray, dstPointArray, sampleIndexArray ):
+	''' This function will solve transform of many 4-point samples at once
+	    INPUTS : N-by-2 source and destination point array,
+	             K-by-4 index array of points in each sample
+	    OUTPUT : K'-by-3-by-3 matrix array of sample which can be solved
+
+	    NOTES - each sample is solved as unit square to source quad and unit square
+	            to destination quad by batched four-point solver, then composed as
+	            H = Hdst * Hsrc^-1, which map the 4 source points exactly onto destination
+	'''
+
+	numSample = len( sampleIndexArray )
+
+	#	solve source and destination quad of every sample in single batch
+	cornerArray = np.concatenate( ( srcPointArray[ sampleIndexArray ], dstPointArray[ sampleIndexArray ] ) )
+	quadMatrixArray, quadValidMask = computeFourPointTransformMatrixBatch( cornerArray )
+
+	validMask = quadValidMask[ :numSample ] & quadValidMask[ numSample: ]
+
+	matrixArray = np.matmul( quadMatrixArray[ numSample: ][ validMask ], np.linalg.inv( quadMatrixArray[ :numSample ][ validMask ] ) )
+
+	#	same normalization as four-point transform, sample sending source origin
+	#	to infinity is dropped
+	scale = matrixArray[ :, 2, 2 ]
+	validMask = np.abs( scale ) > Epsilon
+
+	return matrixArray[ validMask ] / scale[ validMask, None, None ]
+
+def estimateHomographyRansac( srcPointArray, dstPointArray, threshold = DefaultInlierThreshold, randomState = None,
+							  hypothesisChunk = DefaultHypothesisChunk, maxHypothesis = DefaultMaxHypothesis,
+							  confidence = DefaultConfidence, numRefine = DefaultNumRefine ):
+	''' This function will fit projective matrix robustly from noisy point pairs
+	    with outliers
+	    INPUTS : N-by-2 source and destination point array, inlier threshold of
+	             reprojection error, optional numpy random state and RANSAC setting
+	    OUTPUT : projective 3-by-3 matrix, N boolean inlier mask
+
+	    NOTES - random 4-point hypotheses are solved and scored in chunk, score
+	            is truncated squared error ( MSAC ). Best hypothesis is refined by
+	            estimateHomography on its inliers
+	'''
+
+	srcPointArray = toPointArray( srcPointArray )
+	dstPointArray = toPointArray( dstPointArray )
+
+	numPoint = len( srcPointArray )
+
+	if numPoint != len( dstPointArray ):
+		raise ValueError( 'Source and destination must have the same number of points' )
+
+	if numPoint < 4:
+		raise ValueError( 'At least 4 point pairs are required' )
+
+	if randomState is None:
+		randomState = np.random.RandomState()
+
+	thresholdSquare = threshold * threshold
+
+	bestMatrix = None
+	bestScore = np.inf
+	bestNumInlier = 0
+
+	numHypothesis = 0
+	numRequired = maxHypothesis
+
+	while numHypothesis < min( numRequired, maxHypothesis ):
+
+		#	4 random index per hypothesis, sample with repeated index is dropped
+		sampleIndexArray = randomState.randint( 0, numPoint, size = ( hypothesisChunk, 4 ) )
+		sortedIndexArray = np.sort( sampleIndexArray, axis = 1 )
+		sampleIndexArray = sampleIndexArray[ ( sortedIndexArray[ :, 1: ] != sortedIndexArray[ :, :-1 ] ).all( axis = 1 ) ]
+		numHypothesis += hypothesisChunk
+
+		matrixArray = computeHypothesisBatch( srcPointArray, dstPointArray, sampleIndexArray )
+
+		if len( matrixArray ) == 0:
+			continue
+
+		errorArray = computeReprojectionError( matrixArray, srcPointArray, dstPointArray )
+		scoreArray = np.minimum( errorArray, thresholdSquare ).sum( axis = 1 )
+
+		bestIndex = np.argmin( scoreArray )
+
+		if scoreArray[ bestIndex ] < bestScore:
+			bestScore = scoreArray[ bestIndex ]
+			bestMatrix = matrixArray[ bestIndex ]
+			bestNumInlier = int( ( errorArray[ bestIndex ] < thresholdSquare ).sum() )
+
+			#	number of hypothesis so that at least one all-inlier sample is drawn with given confidence
+			inlierRatio = bestNumInlier / float( numPoint )
+
+			if inlierRatio >= 1:
+				numRequired = 0
+			elif inlierRatio > 0:
+				numRequired = math.log( 1 - confidence ) / math.log( 1 - inlierRatio**4 )
+
+	if bestMatrix is None:
+		raise ValueError( 'No hypothesis could be solved from point pairs' )
+
+	inlierMask = computeReprojectionError( bestMatrix[ None ], srcPointArray, dstPointArray )[0] < thresholdSquare
+
+	#	refit on all inliers, which also average out noise of the 4 sample points
+	for _ in range( numRefine ):
+
+		if inlierMask.sum() < 4:
+			break
+
+		try:
+			matrix = estimateHomography( srcPointArray[ inlierMask ], dstPointArray[ inlierMask ] )
+		except ValueError:
+			break
+
+		refinedMask = computeReprojectionError( matrix[ None ], srcPointArray, dstPointArray )[0] < thresholdSquare
+
+		if refinedMask.sum() < inlierMask.sum():
+			break
+
+		isConverged = ( refinedMask == inlierMask ).all()
+
+		bestMatrix, inlierMask = matrix, refinedMask
+
+		#	refit on the same inliers would give the same matrix
+		if isConverged:
+			break
+
+	return bestMatrix, inlierMask
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	from WarpCornerHandler import createWarpCornerHandler
+
+	randomState = np.random.RandomState( 0 )
+
+	#	50 noisy correspondence of warped grid with 30 percent outlier
+	warpCornerHandler = createWarpCornerHandler( [ [ 200, 100 ], [ 1700, 50 ], [ 1800, 1000 ], [ 100, 1050 ] ] )
+
+	srcPointArray = randomState.rand( 50, 2 )
+	dstPointArray = warpCornerHandler.calculateXYFromUVBatch( srcPointArray ) + randomState.randn( 50, 2 ) * 0.5
+	dstPointArray[ :15 ] = randomState.rand( 15, 2 ) * 1000
+
+	startTime = time.time()
+
+	for _ in range( 100 ):
+		matrix, inlierMask = estimateHomographyRansac( srcPointArray, dstPointArray, randomState = randomState )
+
+	print 'ransac :: {:.3f} ms, {} inlier'.format( ( time.time() - startTime ) * 10, inlierMask.sum() )
+	print matrix
+	print warpCornerHandler.projectiveMatrix
@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+######################################################
+#	Globel Member
+
+#	NOTES - coarser level is built until both side reach this size
+MinLevelSize = 1
+
+######################################################
+#	Helper Function
+
+def downsampleImage( image ):
+	''' This function will halve image by averaging each 2-by-2 block,
+	    odd row or column is padded by repeating the last one
+	    INPUTS : image as numpy array (H-by-W or H-by-W-by-C)
+	    OUTPUT : float32 image of ceil(H/2)-by-ceil(W/2)
+	'''
+
+	image = np.asarray( image, dtype = np.float32 )
+
+	height, width = image.shape[ :2 ]
+
+	if height % 2:
+		image = np.concatenate( ( image, image[ -1: ] ), axis = 0 )
+
+	if width % 2:
+		image = np.concatenate( ( image, image[ :, -1: ] ), axis = 1 )
+
+	return ( image[ 0::2, 0::2 ] + image[ 1::2, 0::2 ] + image[ 0::2, 1::2 ] + image[ 1::2, 1::2 ] ) * np.float32( 0.25 )
+
+######################################################
+#	Definition Class
+
+class ImagePyramid( object ):
+	'''	this class designed for mipmap of source image, level k is
+		the image averaged down by 2^k. Build once per source and pass it to
+		warp in place of the image to reuse it across warps
+	'''
+
+	def __init__( self, image ):
+		'''	initialize class.
+		'''
+
+		#
+		#	Set variable from arguments
+		#
+
+		#	level 0 is the image itself, no copy
+		self.image = np.asarray( image )
+
+		self.levelList = [ self.image ]
+
+		while max( self.levelList[ -1 ].shape[ :2 ] ) > MinLevelSize:
+			self.levelList.append( downsampleImage( self.levelList[ -1 ] ) )
+
+		self.numLevel = len( self.levelList )
+
+	#
+	#	Operation Function
+	#
+
+	@property
+	def shape( self ):
+		'''	shape of level 0 image
+		'''
+
+		return self.image.shape
+
+	@property
+	def dtype( self ):
+		'''	dtype of level 0 image
+		'''
+
+		return self.image.dtype
+
+	def getLevel( self, level ):
+		'''	this function will return image of level
+		'''
+
+		return self.levelList[ level ]
+
+	def getLevelCoordinate( self, level, sampleX, sampleY ):
+		'''	this function will convert level 0 pixel coordinate into pixel
+			coordinate of level, pixel center is at integer coordinate on every level
+		'''
+
+		scale = 1.0 / ( 1 << level )
+
+		return ( sampleX + 0.5 ) * scale - 0.5, ( sampleY + 0.5 ) * scale - 0.5
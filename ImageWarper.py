@@ -0,0 +1,701 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import time
+
+import multiprocessing
+import multiprocessing.pool
+import multiprocessing.sharedctypes
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import Epsilon, TransformIdentity, TransformScaleTranslate, QuadValid, CoverageOutside, CoverageEdge, CoverageInside, \
+							  CoverageMargin, classifyTransformMatrix, createWarpCornerHandler
+
+#	Grid Evaluator
+from GridEvaluator import ProjectiveGridEvaluator
+
+#	Image Pyramid
+from ImagePyramid import ImagePyramid
+
+######################################################
+#	Globel Member
+
+InterpolationNearest = 'nearest'
+InterpolationBilinear = 'bilinear'
+
+InterpolationList = [ InterpolationNearest, InterpolationBilinear ]
+
+#	NOTES - pyramid interpolation filter minifying warp from image pyramid,
+#	        level is picked per pixel from Jacobian of sample transform
+InterpolationTrilinear = 'trilinear'
+InterpolationAnisotropic = 'anisotropic'
+
+PyramidInterpolationList = [ InterpolationTrilinear, InterpolationAnisotropic ]
+
+WarpInterpolationList = InterpolationList + PyramidInterpolationList
+
+#	maximum number of tap along major axis of anisotropic footprint
+MaxAnisotropy = 4
+
+#	NOTES - float32 keep sub-pixel precision for image up to several thousand
+#	        pixel and halve memory traffic compare to float64
+CoordinateDtype = np.float32
+
+#	NOTES - sample of source edge pixel may land this far outside source image by
+#	        rounding of composed matrix and float32 coordinate, it is clamped
+#	        onto the edge instead of being dropped
+SampleMargin = 1e-3
+
+#	NOTES - peak temporary memory of tiled warp is about
+#	        numWorker * DefaultTileSize^2 * ( 60 bytes + 20 bytes per channel )
+DefaultTileSize = 256
+
+ExecutorThread = 'thread'
+ExecutorProcess = 'process'
+
+#	state of process pool worker, set by initializer
+ProcessWorkerState = {}
+
+######################################################
+#	Helper Function
+
+def computeNearestIndex( sampleX, sampleY, mask, srcShape ):
+	''' This function will find nearest source pixel of each sample
+	    INPUTS : sample x and y array, boolean mask of sample to be taken,
+	             source image shape
+	    OUTPUT : flat index into source pixel, mask with sample outside source image dropped
+	'''
+
+	height, width = srcShape[ :2 ]
+
+	#	drop sample that fall outside source image
+	mask = mask & ( sampleX > -0.5 ) & ( sampleX < width - 0.5 ) & ( sampleY > -0.5 ) & ( sampleY < height - 0.5 )
+
+	#	round to nearest pixel center, clip so that masked out sample still
+	#	gather valid memory
+	indexX = np.clip( sampleX + 0.5, 0, width - 1 ).astype( np.intp )
+	indexY = np.clip( sampleY + 0.5, 0, height - 1 ).astype( np.intp )
+
+	return indexY * width + indexX, mask
+
+def computeBilinearIndex( sampleX, sampleY, srcShape ):
+	''' This function will find top-left source pixel and weight of each sample
+	    clamped into source image
+	    INPUTS : sample x and y array, source image shape
+	    OUTPUT : flat index of top-left pixel, float32 weight along x and along y
+
+	    NOTES - the other three pixel are at offset computeBilinearOffset of index
+	'''
+
+	height, width = srcShape[ :2 ]
+
+	#	find top-left pixel, clip so that right and bottom pixel stay in image
+	#	and masked out sample still gather valid memory
+	sampleX = np.clip( sampleX, 0, width - 1 )
+	sampleY = np.clip( sampleY, 0, height - 1 )
+	x0 = np.minimum( sampleX.astype( np.intp ), max( width - 2, 0 ) )
+	y0 = np.minimum( sampleY.astype( np.intp ), max( height - 2, 0 ) )
+
+	fx = ( sampleX - x0 ).astype( np.float32 )
+	fy = ( sampleY - y0 ).astype( np.float32 )
+
+	return y0 * width + x0, fx, fy
+
+def computeBilinearOffset( srcShape ):
+	''' This function will return flat offset of right and bottom neighbor
+	    from top-left pixel, zero along axis of single pixel
+	'''
+
+	height, width = srcShape[ :2 ]
+
+	return int( width > 1 ), width * int( height > 1 )
+
+def computeBilinearMask( sampleX, sampleY, mask, srcShape ):
+	''' This function will drop sample that fall outside source image from mask
+	    of bilinear sample
+	'''
+
+	height, width = srcShape[ :2 ]
+
+	return mask & ( sampleX >= -SampleMargin ) & ( sampleX <= width - 1 + SampleMargin ) & \
+				  ( sampleY >= -SampleMargin ) & ( sampleY <= height - 1 + SampleMargin )
+
+def sampleNearest( src, sampleX, sampleY, mask, fillValue = 0 ):
+	''' This function will sample image at nearest pixel
+	    INPUTS : source image (H-by-W or H-by-W-by-C), sample x and y array,
+	             boolean mask of sample to be taken, value for masked out sample
+	    OUTPUT : sampled array with shape of sampleX (plus channel)
+	'''
+
+	index, mask = computeNearestIndex( sampleX, sampleY, mask, src.shape )
+
+	#	gather from flatten image in single pass
+	srcFlat = src.reshape( ( -1, ) + src.shape[ 2: ] )
+	result = np.take( srcFlat, index, axis = 0 )
+
+	result[ ~mask ] = fillValue
+
+	return result
+
+def interpolateBilinear_internal( image, sampleX, sampleY ):
+	''' This function will interpolate image bilinearly at sample clamped into image
+	    and return float32 value with shape of sampleX (plus channel)
+	'''
+
+	index00, fx, fy = computeBilinearIndex( sampleX, sampleY, image.shape )
+	offsetX, offsetY = computeBilinearOffset( image.shape )
+
+	#	broadcast weight over channel
+	if image.ndim == 3:
+		fx = fx[ ..., None ]
+		fy = fy[ ..., None ]
+
+	#	gather four neighbor from flatten image
+	imageFlat = image.reshape( ( -1, ) + image.shape[ 2: ] )
+
+	p00 = np.take( imageFlat, index00, axis = 0 ).astype( np.float32 )
+	p10 = np.take( imageFlat, index00 + offsetX, axis = 0 ).astype( np.float32 )
+	p01 = np.take( imageFlat, index00 + offsetY, axis = 0 ).astype( np.float32 )
+	p11 = np.take( imageFlat, index00 + offsetY + offsetX, axis = 0 ).astype( np.float32 )
+
+	top = p00 + ( p10 - p00 ) * fx
+	bottom = p01 + ( p11 - p01 ) * fx
+
+	return top + ( bottom - top ) * fy
+
+def sampleBilinear( src, sampleX, sampleY, mask, fillValue = 0 ):
+	''' This function will sample image with bilinear interpolation
+	    INPUTS : source image (H-by-W or H-by-W-by-C), sample x and y array,
+	             boolean mask of sample to be taken, value for masked out sample
+	    OUTPUT : sampled array with shape of sampleX (plus channel)
+	'''
+
+	mask = computeBilinearMask( sampleX, sampleY, mask, src.shape )
+
+	value = interpolateBilinear_internal( src, sampleX, sampleY )
+
+	#	round back for integer image
+	if np.issubdtype( src.dtype, np.integer ):
+		value = np.rint( value )
+
+	result = value.astype( src.dtype )
+	result[ ~mask ] = fillValue
+
+	return result
+
+def sampleAxisAligned( src, sampleX, sampleY, mask, interpolation, fillValue = 0 ):
+	''' This function will sample image where sample x only depend on column
+	    and sample y only on row, as warp between axis-aligned rectangles
+	    INPUTS : source image (H-by-W or H-by-W-by-C), sample x of each column,
+	             sample y of each row, boolean mask of sample to be taken,
+	             interpolation, value for masked out sample
+	    OUTPUT : sampled array with shape of mask (plus channel)
+
+	    NOTES - result is the same as sampleNearest and sampleBilinear, but index
+	            and weight are computed once per row and column, and rows are
+	            gathered before columns
+	'''
+
+	height, width = src.shape[ :2 ]
+
+	if interpolation == InterpolationNearest:
+
+		maskX = ( sampleX > -0.5 ) & ( sampleX < width - 0.5 )
+		maskY = ( sampleY > -0.5 ) & ( sampleY < height - 0.5 )
+
+		indexX = np.clip( sampleX + 0.5, 0, width - 1 ).astype( np.intp )
+		indexY = np.clip( sampleY + 0.5, 0, height - 1 ).astype( np.intp )
+
+		result = np.take( np.take( src, indexY, axis = 0 ), indexX, axis = 1 )
+
+	else:
+
+		maskX = ( sampleX >= -SampleMargin ) & ( sampleX <= width - 1 + SampleMargin )
+		maskY = ( sampleY >= -SampleMargin ) & ( sampleY <= height - 1 + SampleMargin )
+
+		sampleX = np.clip( sampleX, 0, width - 1 )
+		sampleY = np.clip( sampleY, 0, height - 1 )
+		indexX0 = np.minimum( sampleX.astype( np.intp ), max( width - 2, 0 ) )
+		indexY0 = np.minimum( sampleY.astype( np.intp ), max( height - 2, 0 ) )
+		indexX1 = indexX0 + ( width > 1 )
+		indexY1 = indexY0 + ( height > 1 )
+
+		#	weight along column and along row, broadcast over channel
+		fx = ( sampleX - indexX0 ).astype( np.float32 ).reshape( ( 1, -1 ) + ( 1, ) * ( src.ndim - 2 ) )
+		fy = ( sampleY - indexY0 ).astype( np.float32 ).reshape( ( -1, 1 ) + ( 1, ) * ( src.ndim - 2 ) )
+
+		row0 = np.take( src, indexY0, axis = 0 )
+		row1 = np.take( src, indexY1, axis = 0 )
+
+		p00 = np.take( row0, indexX0, axis = 1 ).astype( np.float32 )
+		p10 = np.take( row0, indexX1, axis = 1 ).astype( np.float32 )
+		p01 = np.take( row1, indexX0, axis = 1 ).astype( np.float32 )
+		p11 = np.take( row1, indexX1, axis = 1 ).astype( np.float32 )
+
+		top = p00 + ( p10 - p00 ) * fx
+		bottom = p01 + ( p11 - p01 ) * fx
+		value = top + ( bottom - top ) * fy
+
+		if np.issubdtype( src.dtype, np.integer ):
+			value = np.rint( value )
+
+		result = value.astype( src.dtype )
+
+	result[ ~( mask & maskY[ :, None ] & maskX[ None, : ] ) ] = fillValue
+
+	return result
+
+def interpolatePyramidLevel_internal( pyramid, sampleX, sampleY, levelOfDetail ):
+	''' This function will interpolate bilinearly in the two pyramid levels around
+	    level of detail of each sample and blend them by its fractional part
+	    INPUTS : image pyramid, N sample x and y in level 0 pixel, N level of detail
+	    OUTPUT : float32 value of N (plus channel)
+	'''
+
+	levelArray = np.floor( levelOfDetail ).astype( np.intp )
+	fractionArray = ( levelOfDetail - levelArray ).astype( np.float32 )
+
+	value = np.empty( ( len( sampleX ), ) + pyramid.shape[ 2: ], dtype = np.float32 )
+
+	#	sample are gathered per level, so each level is read in single pass
+	for level in np.unique( levelArray ):
+
+		index = np.flatnonzero( levelArray == level )
+
+		levelX, levelY = pyramid.getLevelCoordinate( level, sampleX[ index ], sampleY[ index ] )
+		levelValue = interpolateBilinear_internal( pyramid.getLevel( level ), levelX, levelY )
+
+		#	coarser level is read only by sample in between, magnified sample stay at level 0
+		blendIndex = np.flatnonzero( fractionArray[ index ] > 0 )
+
+		if len( blendIndex ) and level + 1 < pyramid.numLevel:
+
+			levelX, levelY = pyramid.getLevelCoordinate( level + 1, sampleX[ index[ blendIndex ] ], sampleY[ index[ blendIndex ] ] )
+			coarseValue = interpolateBilinear_internal( pyramid.getLevel( level + 1 ), levelX, levelY )
+
+			fraction = fractionArray[ index[ blendIndex ] ].reshape( ( -1, ) + ( 1, ) * ( coarseValue.ndim - 1 ) )
+			levelValue[ blendIndex ] += ( coarseValue - levelValue[ blendIndex ] ) * fraction
+
+		value[ index ] = levelValue
+
+	return value
+
+def samplePyramid( pyramid, matrix, sampleX, sampleY, mask, x0, y0, interpolation, fillValue = 0 ):
+	''' This function will sample image pyramid with footprint of each output pixel
+	    INPUTS : image pyramid, 3-by-3 matrix which map output pixel into source pixel,
+	             sample x and y array of region with top-left output pixel at x0, y0,
+	             boolean mask of sample to be taken, interpolation ('trilinear' or
+	             'anisotropic'), value for masked out sample
+	    OUTPUT : sampled array with shape of sampleX (plus channel)
+
+	    NOTES - footprint of output pixel is the two column of Jacobian of matrix,
+	            which is exact per pixel for projective map. Trilinear pick level from
+	            longer column. Anisotropic take up to MaxAnisotropy tap along longer
+	            column and pick level from footprint of single tap
+	'''
+
+	#	drop sample that fall outside source image, as bilinear
+	mask = computeBilinearMask( sampleX, sampleY, mask, pyramid.shape )
+
+	#	only pixel to be taken is filtered
+	index = np.flatnonzero( mask )
+
+	sampleX = sampleX.ravel()[ index ]
+	sampleY = sampleY.ravel()[ index ]
+	pixelX = x0 + index % mask.shape[1]
+	pixelY = y0 + index // mask.shape[1]
+
+	#	derivative of x = X / W along output pixel is ( dX - x * dW ) / W
+	m = matrix
+	w = m[2,0] * pixelX + m[2,1] * pixelY + m[2,2]
+
+	jacobianXU = ( m[0,0] - m[2,0] * sampleX ) / w
+	jacobianYU = ( m[1,0] - m[2,0] * sampleY ) / w
+	jacobianXV = ( m[0,1] - m[2,1] * sampleX ) / w
+	jacobianYV = ( m[1,1] - m[2,1] * sampleY ) / w
+
+	lengthU = np.hypot( jacobianXU, jacobianYU )
+	lengthV = np.hypot( jacobianXV, jacobianYV )
+
+	maxLevel = pyramid.numLevel - 1
+
+	if interpolation == InterpolationTrilinear:
+
+		#	footprint smaller than source pixel is magnified at level 0
+		levelOfDetail = np.clip( np.log2( np.maximum( np.maximum( lengthU, lengthV ), 1.0 ) ), 0, maxLevel )
+
+		value = interpolatePyramidLevel_internal( pyramid, sampleX, sampleY, levelOfDetail )
+
+	else:
+
+		flagMajorU = lengthU >= lengthV
+		majorLength = np.where( flagMajorU, lengthU, lengthV )
+		minorLength = np.where( flagMajorU, lengthV, lengthU )
+		majorX = np.where( flagMajorU, jacobianXU, jacobianXV )
+		majorY = np.where( flagMajorU, jacobianYU, jacobianYV )
+
+		numTap = np.clip( np.ceil( majorLength / np.maximum( minorLength, 1.0 ) ), 1, MaxAnisotropy ).astype( np.intp )
+
+		levelOfDetail = np.clip( np.log2( np.maximum( np.maximum( majorLength / numTap, minorLength ), 1.0 ) ), 0, maxLevel )
+
+		value = np.zeros( ( len( index ), ) + pyramid.shape[ 2: ], dtype = np.float32 )
+
+		#	tap k of n sit at center of k-th of n equal part of major axis
+		for tap in range( numTap.max() if len( index ) else 0 ):
+
+			tapIndex = np.flatnonzero( numTap > tap )
+			offset = ( tap + 0.5 ) / numTap[ tapIndex ] - 0.5
+
+			value[ tapIndex ] += interpolatePyramidLevel_internal( pyramid, sampleX[ tapIndex ] + offset * majorX[ tapIndex ],
+																	 sampleY[ tapIndex ] + offset * majorY[ tapIndex ],
+																	 levelOfDetail[ tapIndex ] )
+
+		value /= numTap.astype( np.float32 ).reshape( ( -1, ) + ( 1, ) * ( value.ndim - 1 ) )
+
+	#	round back for integer image
+	if np.issubdtype( pyramid.dtype, np.integer ):
+		value = np.rint( value )
+
+	result = np.empty( mask.shape + pyramid.shape[ 2: ], dtype = pyramid.dtype )
+	result[ ~mask ] = fillValue
+	result.reshape( ( -1, ) + pyramid.shape[ 2: ] )[ index ] = value.astype( pyramid.dtype )
+
+	return result
+
+def computeSampleTransform( srcHandler, dstHandler ):
+	''' This function will compose matrix which map output pixel into source image pixel
+	    INPUTS : source and destination warp corner handler
+	    OUTPUT : projective 3-by-3 matrix, transform class of matrix
+	'''
+
+	matrix = np.dot( srcHandler.projectiveMatrix, dstHandler.inverseProjectiveMatrix )
+
+	return matrix, classifyTransformMatrix( matrix )
+
+def computeSampleCoordinate( srcHandler, dstHandler, y0, y1, x0, x1, flagInside = False, sampleTransform = None, dtype = CoordinateDtype ):
+	''' This function will inverse map rectangle region [y0:y1, x0:x1] of
+	    output image into source image
+	    INPUTS : source and destination warp corner handler, region bound,
+	             True if region is known to be inside destination quad,
+	             matrix and transform class from computeSampleTransform if already solved,
+	             dtype of sample coordinate
+	    OUTPUT : sample x and y array, boolean mask of pixel inside destination quad
+	'''
+
+	if flagInside:
+		mask = np.ones( ( y1 - y0, x1 - x0 ), dtype = bool )
+
+	else:
+
+		#	map output pixel into uv of destination quad, stepping along row and column.
+		#	NOTES - uv is evaluated in float64 and tested with Epsilon margin, so that
+		#	        pixel exactly on quad edge is kept no matter where region start
+		u, v, validMask = ProjectiveGridEvaluator( dstHandler.inverseProjectiveMatrix, transformClass = dstHandler.transformClass ).evaluate(
+								x0, 1, x1 - x0, y0, 1, y1 - y0, np.float64 )
+
+		#	only pixel inside destination quad will be sampled
+		mask = validMask & ( u >= -Epsilon ) & ( u <= 1 + Epsilon ) & ( v >= -Epsilon ) & ( v <= 1 + Epsilon )
+
+	#	map output pixel into source image pixel by composed matrix,
+	#	so that second map is stepped as well instead of product per pixel.
+	#	Kernel is picked by class of composed matrix, affine map skip the divide
+	if sampleTransform is None:
+		sampleTransform = computeSampleTransform( srcHandler, dstHandler )
+
+	matrix, transformClass = sampleTransform
+	sampleX, sampleY, sampleValidMask = ProjectiveGridEvaluator( matrix, transformClass = transformClass ).evaluate(
+							x0, 1, x1 - x0, y0, 1, y1 - y0, dtype )
+
+	#	pixel whose source sample is mapped through infinity, as for concave source quad
+	mask &= sampleValidMask
+
+	return sampleX, sampleY, mask
+
+def computeTileCoverage( dstHandler, tileList ):
+	''' This function will classify each tile against destination quad
+	    INPUTS : destination warp corner handler, list of ( y0, y1, x0, x1 ) of each tile
+	    OUTPUT : int8 array of CoverageOutside, CoverageEdge or CoverageInside
+	'''
+
+	if not tileList:
+		return np.zeros( 0, dtype = np.int8 )
+
+	y0, y1, x0, x1 = np.array( tileList, dtype = np.float64 ).T
+
+	#	tile cover pixel center x0 .. x1 - 1 and y0 .. y1 - 1
+	return dstHandler.classifyRectangleCoverage( np.column_stack( ( x0, y0, x1 - 1, y1 - 1 ) ) )
+
+def cropRegionToQuad_internal( dstHandler, y0, y1, x0, x1 ):
+	''' This function will shrink region to pixel within bounding box of
+	    destination quad, region is kept for quad which is not QuadValid
+	'''
+
+	if dstHandler.getQuadClass() != QuadValid:
+		return y0, y1, x0, x1
+
+	xMin, yMin, xMax, yMax = dstHandler.getBoundingBox()
+
+	#	first and one past last pixel center in bounding box, clipped to region
+	cropX0 = int( np.clip( np.ceil( xMin - CoverageMargin ), x0, x1 ) )
+	cropY0 = int( np.clip( np.ceil( yMin - CoverageMargin ), y0, y1 ) )
+	cropX1 = int( np.clip( np.floor( xMax + CoverageMargin ) + 1, cropX0, x1 ) )
+	cropY1 = int( np.clip( np.floor( yMax + CoverageMargin ) + 1, cropY0, y1 ) )
+
+	return cropY0, cropY1, cropX0, cropX1
+
+def warpImageRegion_internal( src, srcHandler, dstHandler, sampleTransform, out, y0, y1, x0, x1, interpolation, fillValue, coverage = CoverageEdge ):
+	''' This function will warp rectangle region [y0:y1, x0:x1] of output image
+	    by inverse mapping each output pixel into source image by sample transform
+	    solved once per warp.
+	    Region outside destination quad is only filled, region on its edge is cropped
+	    to its bounding box, and region inside it is sampled without mask
+	'''
+
+	if coverage == CoverageOutside:
+		out[ y0:y1, x0:x1 ] = fillValue
+		return
+
+	if coverage == CoverageEdge:
+
+		cropRegion = cropRegionToQuad_internal( dstHandler, y0, y1, x0, x1 )
+
+		if cropRegion != ( y0, y1, x0, x1 ):
+			out[ y0:y1, x0:x1 ] = fillValue
+			y0, y1, x0, x1 = cropRegion
+
+		if y0 == y1 or x0 == x1:
+			return
+
+	sampleX, sampleY, mask = computeSampleCoordinate( srcHandler, dstHandler, y0, y1, x0, x1, coverage == CoverageInside, sampleTransform )
+
+	matrix, transformClass = sampleTransform
+
+	#	source is image pyramid for pyramid interpolation
+	if interpolation in PyramidInterpolationList:
+		out[ y0:y1, x0:x1 ] = samplePyramid( src, matrix, sampleX, sampleY, mask, x0, y0, interpolation, fillValue )
+
+	#	warp between axis-aligned rectangles is separable along row and column
+	elif transformClass in ( TransformIdentity, TransformScaleTranslate ):
+		out[ y0:y1, x0:x1 ] = sampleAxisAligned( src, sampleX[ 0, : ], sampleY[ :, 0 ], mask, interpolation, fillValue )
+
+	elif interpolation == InterpolationNearest:
+		out[ y0:y1, x0:x1 ] = sampleNearest( src, sampleX, sampleY, mask, fillValue )
+	else:
+		out[ y0:y1, x0:x1 ] = sampleBilinear( src, sampleX, sampleY, mask, fillValue )
+
+def prepareSource_internal( src, interpolation ):
+	''' This function will return source image and what region warp sample from,
+	    which is image pyramid for pyramid interpolation. Given image pyramid is reused
+	'''
+
+	if interpolation not in WarpInterpolationList:
+		raise ValueError( 'Unknown interpolation {}'.format( interpolation ) )
+
+	if isinstance( src, ImagePyramid ):
+		image = src.image
+	else:
+		image = np.asarray( src )
+
+	if interpolation not in PyramidInterpolationList:
+		return image, image
+
+	if isinstance( src, ImagePyramid ):
+		return image, src
+
+	return image, ImagePyramid( image )
+
+def computeTileList( height, width, tileSize = DefaultTileSize ):
+	''' This function will split image into tiles
+	    INPUTS : image height, width and tile size
+	    OUTPUT : list of ( y0, y1, x0, x1 ) of each tile
+	'''
+
+	return [ ( y0, min( y0 + tileSize, height ), x0, min( x0 + tileSize, width ) )
+				for y0 in range( 0, height, tileSize )
+				for x0 in range( 0, width, tileSize ) ]
+
+def computeTaskList_internal( dstHandler, out, tileList, fillValue ):
+	''' This function will fill tile outside destination quad in place and
+	    return ( y0, y1, x0, x1, coverage ) of the other tiles to be warped
+	'''
+
+	taskList = []
+
+	for tile, coverage in zip( tileList, computeTileCoverage( dstHandler, tileList ) ):
+
+		y0, y1, x0, x1 = tile
+
+		if coverage == CoverageOutside:
+			out[ y0:y1, x0:x1 ] = fillValue
+		else:
+			taskList.append( ( y0, y1, x0, x1, int( coverage ) ) )
+
+	return taskList
+
+def initializeProcessWorker_internal( src, srcHandler, dstHandler, sampleTransform, sharedOut, outShape, outDtype, interpolation, fillValue ):
+	''' This function will store warp state in worker process,
+	    so that each task only send its tile
+	'''
+
+	ProcessWorkerState[ 'src' ] = src
+	ProcessWorkerState[ 'srcHandler' ] = srcHandler
+	ProcessWorkerState[ 'dstHandler' ] = dstHandler
+	ProcessWorkerState[ 'sampleTransform' ] = sampleTransform
+	ProcessWorkerState[ 'out' ] = np.frombuffer( sharedOut, dtype = outDtype ).reshape( outShape )
+	ProcessWorkerState[ 'interpolation' ] = interpolation
+	ProcessWorkerState[ 'fillValue' ] = fillValue
+
+def warpTileInProcess_internal( task ):
+	''' This function will warp single tile in worker process into shared output
+	'''
+
+	y0, y1, x0, x1, coverage = task
+
+	warpImageRegion_internal( ProcessWorkerState[ 'src' ], ProcessWorkerState[ 'srcHandler' ], ProcessWorkerState[ 'dstHandler' ],
+							  ProcessWorkerState[ 'sampleTransform' ], ProcessWorkerState[ 'out' ], y0, y1, x0, x1,
+							  ProcessWorkerState[ 'interpolation' ], ProcessWorkerState[ 'fillValue' ], coverage )
+
+def warpImage( src, srcQuad, dstQuad, outShape, interpolation = InterpolationBilinear, fillValue = 0 ):
+	''' This function will warp source quadrilateral of image into
+	    destination quadrilateral of output image
+	    INPUTS : source image as numpy array (H-by-W or H-by-W-by-C) or its image pyramid,
+	             source and destination quad as 4-by-2 array of P00, P10, P11, P01
+	             in pixel coordinate, output (height, width),
+	             interpolation ('nearest', 'bilinear', 'trilinear' or 'anisotropic'),
+	             value outside destination quad
+	    OUTPUT : warped image as numpy array with same dtype as source
+
+	    NOTES - pixel center is at integer coordinate. Pyramid interpolation build
+	            image pyramid of source, pass ImagePyramid as source to reuse it.
+	            Only bounding box of destination quad is mapped, so cost scale with
+	            quad area instead of output size
+	'''
+
+	src, sampleSource = prepareSource_internal( src, interpolation )
+
+	srcHandler = createWarpCornerHandler( srcQuad )
+	dstHandler = createWarpCornerHandler( dstQuad )
+
+	#	transform is solved once and shared by every region
+	sampleTransform = computeSampleTransform( srcHandler, dstHandler )
+
+	height, width = outShape[ :2 ]
+	out = np.empty( ( height, width ) + src.shape[ 2: ], dtype = src.dtype )
+
+	warpImageRegion_internal( sampleSource, srcHandler, dstHandler, sampleTransform, out, 0, height, 0, width, interpolation, fillValue )
+
+	return out
+
+def warpImageTiled( src, srcQuad, dstQuad, outShape, interpolation = InterpolationBilinear, fillValue = 0,
+					tileSize = DefaultTileSize, numWorker = None, executor = ExecutorThread, pool = None ):
+	''' This function will warp image as warpImage but split output into tiles
+	    and run them on worker pool
+	    INPUTS : same as warpImage, plus tile size, number of worker
+	             (default to number of cpu), executor ('thread' or 'process')
+	             and optional existing thread pool to be reused across call
+	    OUTPUT : warped image as numpy array with same dtype as source
+
+	    NOTES - numpy release the GIL in its kernel, so thread pool scale with core.
+	            Process pool write into shared memory output which is returned
+	            as numpy array backed by that shared memory, worker must inherit it
+	            at start so process pool is created per call. Tile outside destination
+	            quad is filled without being sent to pool, and only tile on its edge is masked
+	'''
+
+	if executor not in ( ExecutorThread, ExecutorProcess ):
+		raise ValueError( 'Unknown executor {}'.format( executor ) )
+
+	if pool is not None and executor == ExecutorProcess:
+		raise ValueError( 'Existing pool can only be reused with thread executor' )
+
+	src, sampleSource = prepareSource_internal( src, interpolation )
+
+	srcHandler = createWarpCornerHandler( srcQuad )
+	dstHandler = createWarpCornerHandler( dstQuad )
+
+	#	transform is solved once and shared by every region
+	sampleTransform = computeSampleTransform( srcHandler, dstHandler )
+
+	height, width = outShape[ :2 ]
+	outShape = ( height, width ) + src.shape[ 2: ]
+
+	tileList = computeTileList( height, width, tileSize )
+
+	if numWorker is None:
+		numWorker = multiprocessing.cpu_count()
+
+	if executor == ExecutorThread:
+
+		out = np.empty( outShape, dtype = src.dtype )
+
+		taskList = computeTaskList_internal( dstHandler, out, tileList, fillValue )
+
+		def warpTile( task ):
+			y0, y1, x0, x1, coverage = task
+			warpImageRegion_internal( sampleSource, srcHandler, dstHandler, sampleTransform, out, y0, y1, x0, x1, interpolation, fillValue, coverage )
+
+		#	create pool only when caller does not give one
+		workerPool = pool if pool is not None else multiprocessing.pool.ThreadPool( numWorker )
+
+		try:
+			for _ in workerPool.imap_unordered( warpTile, taskList ):
+				pass
+		finally:
+			if pool is None:
+				workerPool.close()
+
+		return out
+
+	#	allocate output in shared memory so that worker process write directly into it
+	sharedOut = multiprocessing.sharedctypes.RawArray( 'b', int( np.prod( outShape ) ) * src.dtype.itemsize )
+
+	taskList = computeTaskList_internal( dstHandler, np.frombuffer( sharedOut, dtype = src.dtype ).reshape( outShape ), tileList, fillValue )
+
+	workerPool = multiprocessing.Pool( numWorker, initializeProcessWorker_internal,
+									   ( sampleSource, srcHandler, dstHandler, sampleTransform, sharedOut, outShape, src.dtype, interpolation, fillValue ) )
+
+	try:
+		for _ in workerPool.imap_unordered( warpTileInProcess_internal, taskList ):
+			pass
+	finally:
+		workerPool.close()
+		workerPool.join()
+
+	return np.frombuffer( sharedOut, dtype = src.dtype ).reshape( outShape )
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	src = np.random.randint( 0, 256, size = ( 1080, 1920, 3 ) ).astype( np.uint8 )
+
+	srcQuad = [ [ 0, 0 ], [ 1919, 0 ], [ 1919, 1079 ], [ 0, 1079 ] ]
+	dstQuad = [ [ 200, 100 ], [ 1700, 50 ], [ 1800, 1000 ], [ 100, 1050 ] ]
+
+	for interpolation in WarpInterpolationList:
+
+		startTime = time.time()
+		out = warpImage( src, srcQuad, dstQuad, src.shape, interpolation )
+
+		print '{} :: {:.1f} ms'.format( interpolation, ( time.time() - startTime ) * 1000 )
+
+		startTime = time.time()
+		outTiled = warpImageTiled( src, srcQuad, dstQuad, src.shape, interpolation )
+
+		print '{} tiled :: {:.1f} ms'.format( interpolation, ( time.time() - startTime ) * 1000 )
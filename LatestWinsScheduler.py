@@ -0,0 +1,154 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import threading
+
+######################################################
+#	Import Local
+
+######################################################
+#	Globel Member
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class LatestWinsScheduler( object ):
+	'''	this class designed for running job on single worker thread
+		where only the latest submitted job matters.
+		Job submitted while another is waiting replace it, and only
+		the most recent finished result is kept
+	'''
+
+	def __init__( self, name = 'LatestWinsScheduler' ):
+		'''	initialize class.
+		'''
+
+		self.name = name
+
+		self.condition = threading.Condition()
+
+		#	declare variable to store waiting job as ( tag, function, args )
+		self.pendingJob = None
+
+		#	declare variable to store finished result as ( tag, value, error )
+		self.finishedResult = None
+
+		self.isRunning = False
+		self.isStopped = False
+
+		#	worker thread is started on first submit
+		self.workerThread = None
+
+		#	counter
+		self.submitCount  = 0
+		self.runCount     = 0
+		self.droppedCount = 0
+
+	#
+	#	Operation Function
+	#
+
+	def submit( self, tag, function, *args ):
+		'''	this function will queue function( *args ) to run on worker thread,
+			replacing job that has not started yet. tag is returned with result
+		'''
+
+		with self.condition:
+
+			if self.isStopped:
+				raise RuntimeError( 'Scheduler {} is stopped'.format( self.name ) )
+
+			if self.pendingJob is not None:
+				self.droppedCount += 1
+
+			self.pendingJob = ( tag, function, args )
+			self.submitCount += 1
+
+			if self.workerThread is None:
+				self.workerThread = threading.Thread( target = self.runWorker_internal, name = self.name )
+				self.workerThread.daemon = True
+				self.workerThread.start()
+
+			self.condition.notify()
+
+	def takeResult( self ):
+		'''	this function will return ( tag, value ) of latest finished job and
+			clear it, or None if nothing finished since last call.
+			Exception raised by job is raised here
+		'''
+
+		with self.condition:
+			result = self.finishedResult
+			self.finishedResult = None
+
+		if result is None:
+			return None
+
+		tag, value, error = result
+
+		if error is not None:
+			raise error
+
+		return tag, value
+
+	def isIdle( self ):
+		'''	this function will return True if no job is waiting or running
+		'''
+
+		with self.condition:
+			return self.pendingJob is None and not self.isRunning
+
+	def stop( self ):
+		'''	this function will stop worker thread after current job
+		'''
+
+		with self.condition:
+			self.isStopped = True
+			self.pendingJob = None
+			self.condition.notify()
+
+	#
+	#	Internal Function
+	#
+
+	def runWorker_internal( self ):
+		'''	this function will run on worker thread
+		'''
+
+		while True:
+
+			with self.condition:
+
+				while self.pendingJob is None and not self.isStopped:
+					self.condition.wait()
+
+				if self.isStopped:
+					return
+
+				tag, function, args = self.pendingJob
+				self.pendingJob = None
+				self.isRunning = True
+
+			value = None
+			error = None
+
+			try:
+				value = function( *args )
+			except Exception as e:
+				error = e
+
+			with self.condition:
+				self.finishedResult = ( tag, value, error )
+				self.isRunning = False
+				self.runCount += 1
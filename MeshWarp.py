@@ -0,0 +1,241 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import Epsilon, computeFourPointTransformMatrixBatch, toPointArray
+
+######################################################
+#	Globel Member
+
+#	NOTES - tolerance of local uv range check, so that point on shared
+#	        edge of two cells is not lost by rounding
+CellEdgeTolerance = 1e-9
+
+######################################################
+#	Helper Function
+
+def gatherTransform_internal( matrixArray, cellIndex, pointArray ):
+	''' This function will apply per-point projective matrix picked by cell index
+	    INPUTS : C-by-3-by-3 matrix array, N cell index, N-by-2 point array
+	    OUTPUT : transformed N-by-2 array
+	'''
+
+	m = matrixArray.reshape( -1, 9 )[ cellIndex ]
+
+	u = pointArray[ :, 0 ]
+	v = pointArray[ :, 1 ]
+
+	w = 1.0 / ( m[ :, 6 ] * u + m[ :, 7 ] * v + m[ :, 8 ] )
+
+	result = np.empty_like( pointArray )
+	result[ :, 0 ] = ( m[ :, 0 ] * u + m[ :, 1 ] * v + m[ :, 2 ] ) * w
+	result[ :, 1 ] = ( m[ :, 3 ] * u + m[ :, 4 ] * v + m[ :, 5 ] ) * w
+
+	return result
+
+######################################################
+#	Definition Class
+
+class MeshWarp( object ):
+	'''	this class designed for piecewise projective warp of unit square
+		by mesh of control points, each mesh cell is its own four-point transform
+	'''
+
+	def __init__( self, controlPointArray ):
+		'''	initialize class.
+			controlPointArray is ( numV + 1 )-by-( numU + 1 )-by-2 array of xy,
+			row index run along v and column index run along u
+		'''
+
+		controlPointArray = np.asarray( controlPointArray, dtype = np.float64 )
+
+		if controlPointArray.ndim != 3 or controlPointArray.shape[2] != 2 or min( controlPointArray.shape[ :2 ] ) < 2:
+			raise ValueError( 'Control point array must have shape (numV + 1, numU + 1, 2) with at least one cell' )
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.controlPointArray = controlPointArray
+
+		self.numCellV = controlPointArray.shape[0] - 1
+		self.numCellU = controlPointArray.shape[1] - 1
+
+		#	corner of every cell as P00, P10, P11, P01, cell index is iv * numCellU + iu
+		cornerArray = np.stack( ( controlPointArray[ :-1, :-1 ], controlPointArray[ :-1, 1: ],
+								  controlPointArray[ 1:, 1: ], controlPointArray[ 1:, :-1 ] ), axis = 2 ).reshape( -1, 4, 2 )
+
+		self.cellCornerArray = cornerArray
+
+		#	solve every cell in single batch
+		self.cellMatrixArray, self.cellValidMask = computeFourPointTransformMatrixBatch( cornerArray )
+
+		self.cellInverseMatrixArray = np.full_like( self.cellMatrixArray, np.nan )
+		self.cellInverseMatrixArray[ self.cellValidMask ] = np.linalg.inv( self.cellMatrixArray[ self.cellValidMask ] )
+
+		self.buildCellIndex_internal()
+
+	#
+	#	Operation Function
+	#
+
+	def calculateXYFromUVBatch( self, u, v = None ):
+		'''	this function will calculate xy of many global uv in unit square
+			containing cell is found directly from uv, O(1) per point
+			return N-by-2 numpy array
+		'''
+
+		uvArray = toPointArray( u, v )
+
+		#	scale to cell unit, point on far edge belong to last cell
+		scaledU = uvArray[ :, 0 ] * self.numCellU
+		scaledV = uvArray[ :, 1 ] * self.numCellV
+
+		cellU = np.clip( np.floor( scaledU ), 0, self.numCellU - 1 ).astype( np.intp )
+		cellV = np.clip( np.floor( scaledV ), 0, self.numCellV - 1 ).astype( np.intp )
+
+		localArray = np.column_stack( ( scaledU - cellU, scaledV - cellV ) )
+
+		return gatherTransform_internal( self.cellMatrixArray, cellV * self.numCellU + cellU, localArray )
+
+	def calculateUVFromXYBatch( self, x, y = None ):
+		'''	this function will calculate global uv of many xy,
+			point outside mesh get nan
+			return N-by-2 numpy array
+		'''
+
+		return self.locate( x, y )[0]
+
+	def locate( self, x, y = None ):
+		'''	this function will find containing cell of many xy through cell index
+			return N-by-2 global uv ( nan outside mesh ) and N cell index ( -1 outside mesh )
+		'''
+
+		xyArray = toPointArray( x, y )
+		numPoint = len( xyArray )
+
+		uvArray = np.full( ( numPoint, 2 ), np.nan )
+		cellIndexArray = np.full( numPoint, -1, dtype = np.intp )
+
+		#	bucket of each point, point outside index bound has no candidate
+		bucketX = np.floor( ( xyArray[ :, 0 ] - self.indexOrigin[0] ) / self.bucketSize[0] )
+		bucketY = np.floor( ( xyArray[ :, 1 ] - self.indexOrigin[1] ) / self.bucketSize[1] )
+
+		insideMask = ( bucketX >= 0 ) & ( bucketX <= self.numBucketX ) & ( bucketY >= 0 ) & ( bucketY <= self.numBucketY )
+
+		#	point on far bound belong to last bucket
+		pointIndex = np.flatnonzero( insideMask )
+		bucketX = np.minimum( bucketX[ pointIndex ], self.numBucketX - 1 )
+		bucketY = np.minimum( bucketY[ pointIndex ], self.numBucketY - 1 )
+		bucketIndex = ( bucketY * self.numBucketX + bucketX ).astype( np.intp )
+
+		#	test k-th candidate of every unresolved point at once,
+		#	number of round is bounded by the most crowded bucket
+		for candidateOrder in range( self.maxBucketCount ):
+
+			hasCandidate = self.bucketCount[ bucketIndex ] > candidateOrder
+			pointIndex = pointIndex[ hasCandidate ]
+			bucketIndex = bucketIndex[ hasCandidate ]
+
+			if len( pointIndex ) == 0:
+				break
+
+			cellIndex = self.bucketCellArray[ self.bucketStart[ bucketIndex ] + candidateOrder ]
+
+			with np.errstate( divide = 'ignore', invalid = 'ignore' ):
+				localArray = gatherTransform_internal( self.cellInverseMatrixArray, cellIndex, xyArray[ pointIndex ] )
+
+			foundMask = ( ( localArray >= -CellEdgeTolerance ) & ( localArray <= 1 + CellEdgeTolerance ) ).all( axis = 1 )
+
+			foundPoint = pointIndex[ foundMask ]
+			foundCell = cellIndex[ foundMask ]
+
+			cellIndexArray[ foundPoint ] = foundCell
+			uvArray[ foundPoint, 0 ] = ( foundCell % self.numCellU + localArray[ foundMask, 0 ] ) / self.numCellU
+			uvArray[ foundPoint, 1 ] = ( foundCell // self.numCellU + localArray[ foundMask, 1 ] ) / self.numCellV
+
+			pointIndex = pointIndex[ ~foundMask ]
+			bucketIndex = bucketIndex[ ~foundMask ]
+
+		return uvArray, cellIndexArray
+
+	#
+	#	Internal Function
+	#
+
+	def buildCellIndex_internal( self ):
+		'''	this function will build uniform bucket grid over mesh bound,
+			each bucket list cells whose bounding box overlap it
+		'''
+
+		validCellIndex = np.flatnonzero( self.cellValidMask )
+
+		cellMin = self.cellCornerArray.min( axis = 1 )
+		cellMax = self.cellCornerArray.max( axis = 1 )
+
+		self.indexOrigin = cellMin.min( axis = 0 )
+		indexExtent = np.maximum( cellMax.max( axis = 0 ) - self.indexOrigin, Epsilon )
+
+		#	about one bucket per cell along each axis
+		self.numBucketX = self.numCellU
+		self.numBucketY = self.numCellV
+		self.bucketSize = indexExtent / [ self.numBucketX, self.numBucketY ]
+
+		#	bucket range covered by each cell bounding box
+		bucketMin = np.floor( ( cellMin - self.indexOrigin ) / self.bucketSize ).astype( np.intp )
+		bucketMax = np.floor( ( cellMax - self.indexOrigin ) / self.bucketSize ).astype( np.intp )
+		bucketMin = np.clip( bucketMin, 0, [ self.numBucketX - 1, self.numBucketY - 1 ] )
+		bucketMax = np.clip( bucketMax, 0, [ self.numBucketX - 1, self.numBucketY - 1 ] )
+
+		bucketList = []
+		cellList = []
+
+		for cellIndex in validCellIndex:
+			bucketX, bucketY = np.meshgrid( np.arange( bucketMin[ cellIndex, 0 ], bucketMax[ cellIndex, 0 ] + 1 ),
+											np.arange( bucketMin[ cellIndex, 1 ], bucketMax[ cellIndex, 1 ] + 1 ) )
+			bucketList.append( ( bucketY * self.numBucketX + bucketX ).ravel() )
+			cellList.append( np.full( bucketX.size, cellIndex, dtype = np.intp ) )
+
+		bucketArray = np.concatenate( bucketList ) if bucketList else np.zeros( 0, dtype = np.intp )
+		cellArray = np.concatenate( cellList ) if cellList else np.zeros( 0, dtype = np.intp )
+
+		#	store as compressed list, cells of bucket b are
+		#	bucketCellArray[ bucketStart[b] : bucketStart[b] + bucketCount[b] ]
+		order = np.argsort( bucketArray, kind = 'mergesort' )
+
+		self.bucketCellArray = cellArray[ order ]
+		self.bucketCount = np.bincount( bucketArray, minlength = self.numBucketX * self.numBucketY )
+		self.bucketStart = np.concatenate( ( [ 0 ], np.cumsum( self.bucketCount )[ :-1 ] ) ).astype( np.intp )
+		self.maxBucketCount = int( self.bucketCount.max() ) if len( self.bucketCount ) else 0
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	#	wavy 8-by-6 cell mesh over 100-by-80 area
+	v, u = np.mgrid[ 0:7, 0:9 ]
+	controlPointArray = np.dstack( ( u * 12.5 + 2 * np.sin( v ), v * 13.3 + 2 * np.cos( u ) ) )
+
+	meshWarp = MeshWarp( controlPointArray )
+
+	uvArray = np.random.rand( 5, 2 )
+	xyArray = meshWarp.calculateXYFromUVBatch( uvArray )
+
+	print uvArray
+	print meshWarp.calculateUVFromXYBatch( xyArray )
@@ -0,0 +1,155 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import math
+
+######################################################
+#	Import Local
+
+######################################################
+#	Globel Member
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class PointGridIndex( object ):
+	'''	this class designed for uniform grid hash of 2d points, so that
+		nearest point query only look at buckets around query position
+		no matter how many points are stored
+	'''
+
+	def __init__( self, cellSize ):
+		'''	initialize class.
+			cellSize should be about query radius, so that query visit 3-by-3 buckets
+		'''
+
+		if cellSize <= 0:
+			raise ValueError( 'Cell size must be positive' )
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.cellSize = float( cellSize )
+
+		#	bucket ( cellX, cellY ) -> set of key
+		self.bucketDict = {}
+
+		#	key -> ( x, y )
+		self.positionDict = {}
+
+	def __len__( self ):
+		'''	return number of stored point
+		'''
+
+		return len( self.positionDict )
+
+	def __contains__( self, key ):
+		'''	return True if key is stored
+		'''
+
+		return key in self.positionDict
+
+	#
+	#	Operation Function
+	#
+
+	def insert( self, key, x, y ):
+		'''	this function will store point under key, key must be hashable
+		'''
+
+		if key in self.positionDict:
+			self.remove( key )
+
+		self.positionDict[ key ] = ( x, y )
+		self.bucketDict.setdefault( self.getCell_internal( x, y ), set() ).add( key )
+
+	def remove( self, key ):
+		'''	this function will remove point of key
+		'''
+
+		x, y = self.positionDict.pop( key )
+
+		cell = self.getCell_internal( x, y )
+		bucket = self.bucketDict[ cell ]
+		bucket.discard( key )
+
+		if not bucket:
+			del self.bucketDict[ cell ]
+
+	def move( self, key, x, y ):
+		'''	this function will update position of stored point,
+			bucket is touched only when point cross cell border
+		'''
+
+		oldX, oldY = self.positionDict[ key ]
+
+		oldCell = self.getCell_internal( oldX, oldY )
+		newCell = self.getCell_internal( x, y )
+
+		if oldCell != newCell:
+			bucket = self.bucketDict[ oldCell ]
+			bucket.discard( key )
+
+			if not bucket:
+				del self.bucketDict[ oldCell ]
+
+			self.bucketDict.setdefault( newCell, set() ).add( key )
+
+		self.positionDict[ key ] = ( x, y )
+
+	def nearest( self, x, y, radius ):
+		'''	this function will return key of nearest point strictly within radius,
+			or None if there is none
+		'''
+
+		radiusSquare = radius * radius
+
+		#	number of cell to look at on each side of query cell
+		reach = int( math.ceil( radius / self.cellSize ) )
+
+		cellX, cellY = self.getCell_internal( x, y )
+
+		nearestKey = None
+		nearestDistanceSquare = radiusSquare
+
+		for bucketX in range( cellX - reach, cellX + reach + 1 ):
+			for bucketY in range( cellY - reach, cellY + reach + 1 ):
+
+				bucket = self.bucketDict.get( ( bucketX, bucketY ) )
+
+				if bucket is None:
+					continue
+
+				for key in bucket:
+					pointX, pointY = self.positionDict[ key ]
+
+					#	compare squared distance, no square root needed
+					distanceSquare = ( pointX - x )**2 + ( pointY - y )**2
+
+					if distanceSquare < nearestDistanceSquare:
+						nearestKey = key
+						nearestDistanceSquare = distanceSquare
+
+		return nearestKey
+
+	#
+	#	Internal Function
+	#
+
+	def getCell_internal( self, x, y ):
+		'''	this function will return cell of position
+		'''
+
+		return int( math.floor( x / self.cellSize ) ), int( math.floor( y / self.cellSize ) )
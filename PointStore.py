@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+######################################################
+#	Globel Member
+
+#	name of point set in point object
+PointSetPoint    = 'point'
+PointSetSrcPoint = 'srcPoint'
+PointSetDstPoint = 'dstPoint'
+
+PointSetList = [ PointSetPoint, PointSetSrcPoint, PointSetDstPoint ]
+
+DefaultCapacity = 16
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class PointStore( object ):
+	'''	this class designed for structure-of-arrays storage of point sets,
+		each point set is contiguous N-by-2 float64 array
+	'''
+
+	def __init__( self, capacity = DefaultCapacity ):
+		'''	initialize class.
+		'''
+
+		capacity = max( int( capacity ), 1 )
+
+		#	number of stored point
+		self.count = 0
+
+		#	point set name -> capacity-by-2 array, only first count rows are used
+		self.coordinateDict = dict( ( pointSetName, np.empty( ( capacity, 2 ) ) ) for pointSetName in PointSetList )
+
+	def __len__( self ):
+		'''	return number of stored point
+		'''
+
+		return self.count
+
+	#
+	#	Operation Function
+	#
+
+	def addPoint( self, x, y ):
+		'''	this function will append point with every point set at ( x, y )
+			return index of new point
+		'''
+
+		return self.addPointObject( dict( ( pointSetName, ( x, y ) ) for pointSetName in PointSetList ) )
+
+	def addPointObject( self, positionDict ):
+		'''	this function will append point with position of each point set
+			positionDict is point set name -> ( x, y )
+			return index of new point
+		'''
+
+		capacity = len( self.coordinateDict[ PointSetPoint ] )
+
+		#	grow geometrically so that append is amortized constant
+		if self.count == capacity:
+			for pointSetName in PointSetList:
+				coordinateArray = np.empty( ( capacity * 2, 2 ) )
+				coordinateArray[ :self.count ] = self.coordinateDict[ pointSetName ][ :self.count ]
+				self.coordinateDict[ pointSetName ] = coordinateArray
+
+		index = self.count
+
+		for pointSetName in PointSetList:
+			self.coordinateDict[ pointSetName ][ index ] = positionDict[ pointSetName ]
+
+		self.count += 1
+
+		return index
+
+	def getArray( self, pointSetName ):
+		'''	this function will return N-by-2 view of point set without copy
+			NOTES - view is not valid any more once store grow by addPoint
+		'''
+
+		return self.coordinateDict[ pointSetName ][ :self.count ]
+
+class PointView( object ):
+	'''	this class designed for lightweight point with x and y stored in point store,
+		it can be used where CornerPoint with x and y attribute is expected
+	'''
+
+	__slots__ = ( 'pointStore', 'pointSetName', 'index' )
+
+	def __init__( self, pointStore, pointSetName, index ):
+		'''	initialize class.
+		'''
+
+		self.pointStore   = pointStore
+		self.pointSetName = pointSetName
+		self.index        = index
+
+	@property
+	def x( self ):
+		'''	x coordinate
+		'''
+
+		return float( self.pointStore.coordinateDict[ self.pointSetName ][ self.index, 0 ] )
+
+	@x.setter
+	def x( self, value ):
+		self.pointStore.coordinateDict[ self.pointSetName ][ self.index, 0 ] = value
+
+	@property
+	def y( self ):
+		'''	y coordinate
+		'''
+
+		return float( self.pointStore.coordinateDict[ self.pointSetName ][ self.index, 1 ] )
+
+	@y.setter
+	def y( self, value ):
+		self.pointStore.coordinateDict[ self.pointSetName ][ self.index, 1 ] = value
@@ -0,0 +1,203 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import time
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import QuadValid, createWarpCornerHandler, toPointArray
+
+######################################################
+#	Globel Member
+
+#	NOTES - cell size is this many times of mean bounding box size of quads,
+#	        so that each quad overlap only few bucket
+DefaultCellScale = 1.0
+
+#	NOTES - grid is dense over union of bounding box, so cell size is grown until
+#	        number of cell is at most this many per bucketed quad. Quads far apart
+#	        then share coarse cell instead of allocating empty cell in between
+MaxCellPerQuad = 4
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class QuadGridIndex( object ):
+	'''	this class designed for testing single point set against many quads.
+		Bounding box of quads is bucketed on uniform grid, points are sorted by
+		bucket once per query, then each quad test only the points of buckets it
+		overlap with filterPointInQuadBatch of its warp corner handler
+	'''
+
+	def __init__( self, warpCornerHandlerList, cellSize = None ):
+		'''	initialize class.
+			cellSize is in unit of xy, default to mean bounding box size of quads,
+			it is grown when grid would have more than MaxCellPerQuad cell per quad
+		'''
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.warpCornerHandlerList = list( warpCornerHandlerList )
+
+		#	quad which is not QuadValid is not bounded by its corners, so it is
+		#	tested against every point instead of being bucketed
+		self.bucketedIndexList = [ index for index, warpCornerHandler in enumerate( self.warpCornerHandlerList )
+									if warpCornerHandler.getQuadClass() == QuadValid ]
+		self.unboundedIndexList = [ index for index, warpCornerHandler in enumerate( self.warpCornerHandlerList )
+									if warpCornerHandler.getQuadClass() != QuadValid ]
+
+		#	K-by-4 bounding box as ( xMin, yMin, xMax, yMax ) of bucketed quad
+		boundingBoxArray = np.array( [ self.warpCornerHandlerList[ index ].getBoundingBox() for index in self.bucketedIndexList ],
+									 dtype = np.float64 ).reshape( -1, 4 )
+
+		if cellSize is None:
+
+			cellSize = 1.0
+
+			#	quad of zero size give zero mean, keep default then
+			if len( boundingBoxArray ):
+				cellSize = DefaultCellScale * ( boundingBoxArray[ :, 2: ] - boundingBoxArray[ :, :2 ] ).mean() or cellSize
+
+		if cellSize <= 0:
+			raise ValueError( 'Cell size must be positive' )
+
+		self.cellSize = float( cellSize )
+
+		#	grid cover union of bounding box
+		if len( boundingBoxArray ):
+			self.origin = boundingBoxArray[ :, :2 ].min( axis = 0 )
+			extent = boundingBoxArray[ :, 2: ].max( axis = 0 ) - self.origin
+
+			maxNumCell = MaxCellPerQuad * len( boundingBoxArray )
+
+			#	start from cell which would fit if grid were square, then double until it fit
+			self.cellSize = max( self.cellSize, np.sqrt( extent[0] * extent[1] / maxNumCell ) )
+
+			while np.prod( np.floor( extent / self.cellSize ) + 1 ) > maxNumCell:
+				self.cellSize *= 2
+
+			self.numBucketX, self.numBucketY = np.floor( extent / self.cellSize ).astype( int ) + 1
+		else:
+			self.origin = np.zeros( 2 )
+			self.numBucketX, self.numBucketY = 1, 1
+
+		#	bucket range ( x0, y0, x1, y1 ) inclusive of each bucketed quad
+		self.bucketRangeArray = np.column_stack( ( self.computeCell_internal( boundingBoxArray[ :, :2 ] ),
+												   self.computeCell_internal( boundingBoxArray[ :, 2: ] ) ) )
+
+	#
+	#	Operation Function
+	#
+
+	def query( self, x, y = None ):
+		'''	this function will find every pair of point and quad containing it
+			x can be N-by-2 array, or x and y can be given as separated array
+			return point index array, quad index array into warp corner handler list
+			and uv array of point in that quad, one row per pair
+
+			NOTES - point on shared edge of two quads is paired with both
+		'''
+
+		pointArray = toPointArray( x, y )
+
+		#	point outside grid get id past the last bucket, so that no quad read it
+		bucketCoordinate = np.floor( ( pointArray - self.origin ) / self.cellSize )
+		insideGridMask = ( ( bucketCoordinate >= 0 ) & ( bucketCoordinate < ( self.numBucketX, self.numBucketY ) ) ).all( axis = 1 )
+
+		numBucket = self.numBucketX * self.numBucketY
+		bucketIdArray = np.where( insideGridMask, bucketCoordinate[ :, 1 ] * self.numBucketX + bucketCoordinate[ :, 0 ], numBucket ).astype( np.intp )
+
+		#	sort point by bucket, point of bucket b is sortedIndex[ bucketStart[b] : bucketStart[b+1] ]
+		sortedIndex = np.argsort( bucketIdArray, kind = 'mergesort' )
+		bucketStart = np.searchsorted( bucketIdArray[ sortedIndex ], np.arange( numBucket + 1 ) )
+
+		pointIndexList = []
+		quadIndexList = []
+		uvList = []
+
+		for quadIndex, ( bucketX0, bucketY0, bucketX1, bucketY1 ) in zip( self.bucketedIndexList, self.bucketRangeArray ):
+
+			#	buckets of single grid row are adjacent in id, so they are single slice
+			candidateIndex = np.concatenate( [ sortedIndex[ bucketStart[ bucketY * self.numBucketX + bucketX0 ] :
+															bucketStart[ bucketY * self.numBucketX + bucketX1 + 1 ] ]
+												for bucketY in range( bucketY0, bucketY1 + 1 ) ] )
+
+			index, uvArray = self.warpCornerHandlerList[ quadIndex ].filterPointInQuadBatch( pointArray[ candidateIndex ] )
+
+			pointIndexList.append( candidateIndex[ index ] )
+			quadIndexList.append( np.full( len( index ), quadIndex, dtype = np.intp ) )
+			uvList.append( uvArray )
+
+		for quadIndex in self.unboundedIndexList:
+
+			index, uvArray = self.warpCornerHandlerList[ quadIndex ].filterPointInQuadBatch( pointArray )
+
+			pointIndexList.append( index )
+			quadIndexList.append( np.full( len( index ), quadIndex, dtype = np.intp ) )
+			uvList.append( uvArray )
+
+		if not pointIndexList:
+			return np.zeros( 0, dtype = np.intp ), np.zeros( 0, dtype = np.intp ), np.zeros( ( 0, 2 ) )
+
+		return np.concatenate( pointIndexList ).astype( np.intp ), np.concatenate( quadIndexList ), np.concatenate( uvList )
+
+	#
+	#	Internal Function
+	#
+
+	def computeCell_internal( self, pointArray ):
+		'''	this function will return cell column and row of N-by-2 point array,
+			clipped into grid
+		'''
+
+		bucketCoordinate = np.floor( ( pointArray - self.origin ) / self.cellSize ).astype( np.intp )
+
+		return np.clip( bucketCoordinate, 0, ( self.numBucketX - 1, self.numBucketY - 1 ) )
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	randomState = np.random.RandomState( 0 )
+
+	#	grid of 20-by-20 jittered quad on 2000-by-2000 canvas
+	warpCornerHandlerList = []
+
+	for row in range( 20 ):
+		for column in range( 20 ):
+			x0, y0 = column * 100, row * 100
+			quad = np.array( [ [ x0, y0 ], [ x0 + 80, y0 ], [ x0 + 80, y0 + 80 ], [ x0, y0 + 80 ] ] ) + randomState.rand( 4, 2 ) * 15
+			warpCornerHandlerList.append( createWarpCornerHandler( quad ) )
+
+	pointArray = randomState.rand( 1000000, 2 ) * 2000
+
+	startTime = time.time()
+	quadGridIndex = QuadGridIndex( warpCornerHandlerList )
+	pointIndexArray, quadIndexArray, uvArray = quadGridIndex.query( pointArray )
+
+	print 'grid index :: {:.1f} ms, {} pair'.format( ( time.time() - startTime ) * 1000, len( pointIndexArray ) )
+
+	startTime = time.time()
+	numPair = sum( len( warpCornerHandler.filterPointInQuadBatch( pointArray )[0] ) for warpCornerHandler in warpCornerHandlerList )
+
+	print 'every quad :: {:.1f} ms, {} pair'.format( ( time.time() - startTime ) * 1000, numPair )
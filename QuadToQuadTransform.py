@@ -0,0 +1,143 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import TransformClassTolerance, CornerPoint, WarpCornerHandler, classifyTransformMatrix, transformPoint, transformPointArrayMasked, toPointArray
+
+######################################################
+#	Globel Member
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class QuadToQuadTransform( object ):
+	'''	this class designed for remap point in source quadrilateral
+		into destination quadrilateral by single composed matrix
+	'''
+
+	def __init__( self, srcWarpCornerHandler, dstWarpCornerHandler, uvWarpCornerHandler = None ):
+		'''	initialize class.
+
+			point in source quad is mapped to uv by source handler, then
+			uv is mapped into destination quad by destination handler.
+			If uv handler is given, input is uv of uv handler instead of xy,
+			which is the chain used to draw warped grid.
+		'''
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.srcWarpCornerHandler = srcWarpCornerHandler
+		self.dstWarpCornerHandler = dstWarpCornerHandler
+		self.uvWarpCornerHandler  = uvWarpCornerHandler
+
+		#	compose dst * src^-1 ( * uv ) once
+		matrix = np.dot( dstWarpCornerHandler.projectiveMatrix, srcWarpCornerHandler.inverseProjectiveMatrix )
+
+		if uvWarpCornerHandler is not None:
+			matrix = np.dot( matrix, uvWarpCornerHandler.projectiveMatrix )
+
+		self.matrix = self.normalizeMatrix_internal( matrix )
+		self.inverseMatrix = np.linalg.inv( self.matrix )
+
+		#	kernel used by every mapping call, inverse has the same class
+		self.transformClass = classifyTransformMatrix( self.matrix )
+
+	#
+	#	Operation Function
+	#
+
+	def transformPoint( self, x, y ):
+		'''	this function will map point from source into destination
+		'''
+
+		return transformPoint( self.matrix, x, y, self.transformClass )
+
+	def inverseTransformPoint( self, x, y ):
+		'''	this function will map point from destination back into source
+		'''
+
+		return transformPoint( self.inverseMatrix, x, y, self.transformClass )
+
+	def transformPointBatch( self, x, y = None, returnMask = False ):
+		'''	this function will map many points from source into destination
+			x can be N-by-2 array, or x and y can be given as separated array
+			return N-by-2 numpy array with nan on point that cannot be mapped,
+			and also N boolean validity mask if returnMask is True
+		'''
+
+		result, validMask = transformPointArrayMasked( self.matrix, toPointArray( x, y ), self.transformClass )
+
+		return ( result, validMask ) if returnMask else result
+
+	def inverseTransformPointBatch( self, x, y = None, returnMask = False ):
+		'''	this function will map many points from destination back into source
+			x can be N-by-2 array, or x and y can be given as separated array
+			return N-by-2 numpy array with nan on point that cannot be mapped,
+			and also N boolean validity mask if returnMask is True
+		'''
+
+		result, validMask = transformPointArrayMasked( self.inverseMatrix, toPointArray( x, y ), self.transformClass )
+
+		return ( result, validMask ) if returnMask else result
+
+	#
+	#	Internal Function
+	#
+
+	def normalizeMatrix_internal( self, matrix ):
+		'''	this function will scale composed matrix so that w is positive inside input quad
+
+			NOTES - matrix with g = h = 0 is divided by w coefficient of origin, so that
+			        w stay exactly 1 and affine kernel can be used, that coefficient cannot
+			        be 0 for invertible matrix. Otherwise origin may lie on line at infinity,
+			        so matrix is divided by its norm, with sign of w at center of input quad
+		'''
+
+		if matrix[2,2] != 0 and abs( matrix[2,0] ) + abs( matrix[2,1] ) <= TransformClassTolerance * abs( matrix[2,2] ):
+			return matrix / matrix[2,2]
+
+		#	input is uv of uv handler or xy of source quad
+		if self.uvWarpCornerHandler is not None:
+			centerX, centerY = 0.5, 0.5
+		else:
+			centerX, centerY = self.srcWarpCornerHandler.calculateXYFromUV( 0.5, 0.5 )
+
+		w = matrix[2,0] * centerX + matrix[2,1] * centerY + matrix[2,2]
+
+		return matrix / ( np.linalg.norm( matrix ) * ( -1.0 if w < 0 else 1.0 ) )
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	srcWarpCornerHandler = WarpCornerHandler( CornerPoint(  0,  0 ), CornerPoint( 10,  0 ),
+											  CornerPoint( 10, 10 ), CornerPoint(  0, 10 ) )
+	dstWarpCornerHandler = WarpCornerHandler( CornerPoint(  0,  0 ), CornerPoint( 20,  2 ),
+											  CornerPoint( 18, 16 ), CornerPoint(  1, 12 ) )
+
+	quadToQuadTransform = QuadToQuadTransform( srcWarpCornerHandler, dstWarpCornerHandler )
+
+	print quadToQuadTransform.transformPoint( 5.0, 5.0 )
+	print dstWarpCornerHandler.calculateXYFromUV( *srcWarpCornerHandler.calculateUVFromXY( 5.0, 5.0 ) )
+	print quadToQuadTransform.inverseTransformPointBatch( quadToQuadTransform.transformPointBatch( [ [ 5.0, 5.0 ], [ 2.0, 8.0 ] ] ) )
@@ -0,0 +1,419 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import time
+
+import numpy as np
+
+######################################################
+#	Import Local
+
+#	Warp Corner Handler
+from WarpCornerHandler import CoverageOutside, CoverageInside, createWarpCornerHandler
+
+#	Image Warper
+from ImageWarper import InterpolationNearest, InterpolationBilinear, InterpolationList, \
+						DefaultTileSize, computeSampleTransform, computeSampleCoordinate, computeTileList, computeTileCoverage, \
+						computeNearestIndex, computeBilinearIndex, computeBilinearOffset, computeBilinearMask
+
+######################################################
+#	Globel Member
+
+TableFormatFloat32 = 'float32'
+TableFormatFloat64 = 'float64'
+TableFormatFixed   = 'fixed'
+
+TableFormatDtypeDict = { TableFormatFloat32:np.float32, TableFormatFloat64:np.float64, TableFormatFixed:np.int32 }
+
+#	NOTES - fixed-point table store coordinate * 2^FixedPointFractionBit as int32,
+#	        which keep 1/256 pixel precision for image up to 8M pixel wide
+FixedPointFractionBit = 8
+
+#	marker of output pixel outside destination quad
+InvalidFixedCoordinate = np.iinfo( np.int32 ).min
+
+#	NOTES - gather of each output pixel baked from table for one source shape,
+#	        flat index into source pixel of nearest sample and of top-left pixel
+#	        of bilinear sample, bilinear weight and output pixel to be filled
+GatherFieldList = [ ( 'nearestIndex', np.int32 ), ( 'bilinearIndex', np.int32 ),
+					( 'weightX', np.float32 ), ( 'weightY', np.float32 ),
+					( 'nearestInvalid', np.bool_ ), ( 'bilinearInvalid', np.bool_ ) ]
+
+GatherDtype = np.dtype( GatherFieldList, align = True )
+
+#	NOTES - apply gather block of this many output pixel at a time,
+#	        so that scratch buffer stay in cache no matter how big the table is
+ApplyBlockSize = 1 << 16
+
+######################################################
+#	Helper Function
+
+def createRecordDtype_internal( tableDtype ):
+	''' This function will return dtype of table saved with its gather,
+	    coordinate and gather of each output pixel are kept in single record
+	'''
+
+	return np.dtype( [ ( 'coordinate', tableDtype, ( 2, ) ) ] + GatherFieldList, align = True )
+
+def bakeRemapTable( srcQuad, dstQuad, outShape, tableFormat = TableFormatFloat32, tileSize = DefaultTileSize, srcShape = None ):
+	''' This function will bake inverse map of quad warp into dense remap table
+	    INPUTS : source and destination quad as 4-by-2 array of P00, P10, P11, P01,
+	             output (height, width), table format ('float32', 'float64' or 'fixed'),
+	             tile size, source image shape to bake gather for
+	    OUTPUT : remap table
+
+	    NOTES - transform is solved once, table is filled tile by tile
+	            so temporary memory stay bounded by tile size.
+	            Coordinate is evaluated in float64 except for float32 table
+	'''
+
+	if tableFormat not in TableFormatDtypeDict:
+		raise ValueError( 'Unknown table format {}'.format( tableFormat ) )
+
+	srcHandler = createWarpCornerHandler( srcQuad )
+	dstHandler = createWarpCornerHandler( dstQuad )
+
+	sampleTransform = computeSampleTransform( srcHandler, dstHandler )
+
+	coordinateDtype = np.float32 if tableFormat == TableFormatFloat32 else np.float64
+
+	height, width = outShape[ :2 ]
+	table = np.empty( ( height, width, 2 ), dtype = TableFormatDtypeDict[ tableFormat ] )
+
+	tileList = computeTileList( height, width, tileSize )
+
+	for ( y0, y1, x0, x1 ), coverage in zip( tileList, computeTileCoverage( dstHandler, tileList ) ):
+
+		tile = table[ y0:y1, x0:x1 ]
+
+		#	tile outside destination quad is marked invalid without mapping
+		if coverage == CoverageOutside:
+			tile[...] = InvalidFixedCoordinate if tableFormat == TableFormatFixed else np.nan
+			continue
+
+		sampleX, sampleY, mask = computeSampleCoordinate( srcHandler, dstHandler, y0, y1, x0, x1, coverage == CoverageInside,
+														  sampleTransform, coordinateDtype )
+
+		if tableFormat == TableFormatFixed:
+			scale = float( 1 << FixedPointFractionBit )
+			tile[ ..., 0 ] = np.where( mask, np.rint( sampleX * scale ), InvalidFixedCoordinate )
+			tile[ ..., 1 ] = np.where( mask, np.rint( sampleY * scale ), InvalidFixedCoordinate )
+		else:
+			tile[ ..., 0 ] = np.where( mask, sampleX, np.nan )
+			tile[ ..., 1 ] = np.where( mask, sampleY, np.nan )
+
+	remapTable = RemapTable( table )
+
+	if srcShape is not None:
+		remapTable.bakeGather( srcShape )
+
+	return remapTable
+
+def loadRemapTable( path, outShape = None, tableFormat = None, srcShape = None ):
+	''' This function will load remap table as read-only memory map,
+	    so that many process can share single copy of table and its gather
+	    INPUTS : path to .npy file, or raw file with output (height, width)
+	             and table format, source image shape if table is saved with gather
+	    OUTPUT : remap table
+	'''
+
+	if os.path.splitext( path )[1] == '.npy':
+		array = np.load( path, mmap_mode = 'r' )
+
+	else:
+
+		if outShape is None or tableFormat is None:
+			raise ValueError( 'Raw remap table requires output shape and table format' )
+
+		height, width = outShape[ :2 ]
+		tableDtype = TableFormatDtypeDict[ tableFormat ]
+
+		if srcShape is None:
+			array = np.memmap( path, dtype = tableDtype, mode = 'r', shape = ( height, width, 2 ) )
+		else:
+			array = np.memmap( path, dtype = createRecordDtype_internal( tableDtype ), mode = 'r', shape = ( height, width ) )
+
+	#	plain coordinate table
+	if array.dtype.names is None:
+		return RemapTable( array )
+
+	if srcShape is None:
+		raise ValueError( 'Remap table saved with gather requires source shape' )
+
+	return RemapTable( array[ 'coordinate' ], array, srcShape )
+
+######################################################
+#	Definition Class
+
+class RemapTable( object ):
+	'''	this class designed for dense H-by-W-by-2 table of source pixel
+		coordinate of each output pixel, and gather baked from it for
+		one source shape
+	'''
+
+	def __init__( self, table, gather = None, srcShape = None ):
+		'''	initialize class.
+			gather is H-by-W array with GatherFieldList fields baked for srcShape
+		'''
+
+		#
+		#	Set variable from arguments
+		#
+
+		if table.ndim != 3 or table.shape[2] != 2:
+			raise ValueError( 'Remap table must have shape (H, W, 2)' )
+
+		if gather is not None and ( gather.shape != table.shape[ :2 ] or srcShape is None ):
+			raise ValueError( 'Gather must have shape (H, W) of table and be given with source shape' )
+
+		self.table = table
+
+		#	fixed-point table is stored as integer
+		self.isFixedPoint = np.issubdtype( table.dtype, np.integer )
+
+		self.gather = gather
+		self.srcShape = tuple( srcShape[ :2 ] ) if srcShape is not None else None
+
+	@property
+	def shape( self ):
+		'''	return output shape ( height, width )
+		'''
+
+		return self.table.shape[ :2 ]
+
+	#
+	#	Operation Function
+	#
+
+	def bakeGather( self, srcShape ):
+		'''	this function will convert table into gather for source image of srcShape,
+			same rule as ImageWarper sampling, block by block so that temporary
+			memory stay bounded by ApplyBlockSize
+		'''
+
+		height, width = srcShape[ :2 ]
+
+		if height * width > np.iinfo( np.int32 ).max:
+			raise ValueError( 'Source image is too large for int32 gather index' )
+
+		gather = np.empty( self.shape, dtype = GatherDtype )
+
+		tableFlat = self.table.reshape( -1, 2 )
+		gatherFlat = gather.reshape( -1 )
+
+		for start in range( 0, len( tableFlat ), ApplyBlockSize ):
+
+			stop = min( start + ApplyBlockSize, len( tableFlat ) )
+			gatherBlock = gatherFlat[ start:stop ]
+
+			sampleX, sampleY, mask = self.getCoordinate_internal( tableFlat[ start:stop ] )
+
+			index, nearestMask = computeNearestIndex( sampleX, sampleY, mask, srcShape )
+			gatherBlock[ 'nearestIndex' ] = index
+			gatherBlock[ 'nearestInvalid' ] = ~nearestMask
+
+			index, weightX, weightY = computeBilinearIndex( sampleX, sampleY, srcShape )
+			gatherBlock[ 'bilinearIndex' ] = index
+			gatherBlock[ 'weightX' ] = weightX
+			gatherBlock[ 'weightY' ] = weightY
+			gatherBlock[ 'bilinearInvalid' ] = ~computeBilinearMask( sampleX, sampleY, mask, srcShape )
+
+		self.gather = gather
+		self.srcShape = ( height, width )
+
+	def createScratch( self, src ):
+		'''	this function will allocate scratch buffer of apply for source image
+			of the same channel shape and dtype as src, so that apply can be
+			called repeatedly without allocation
+		'''
+
+		blockShape = ( max( min( ApplyBlockSize, self.shape[0] * self.shape[1] ), 1 ), ) + src.shape[ 2: ]
+
+		return { 'key' : ( src.shape[ 2: ], src.dtype ),
+				 'index' : np.empty( blockShape[0], dtype = np.intp ),
+				 'gather0' : np.empty( blockShape, dtype = src.dtype ),
+				 'gather1' : np.empty( blockShape, dtype = src.dtype ),
+				 'top' : np.empty( blockShape, dtype = np.float32 ),
+				 'bottom' : np.empty( blockShape, dtype = np.float32 ) }
+
+	def save( self, path ):
+		'''	this function will save table to .npy file, or raw file for other extension.
+			Table with gather is saved as single record of coordinate and gather
+			per output pixel, which is loaded back with its source shape
+		'''
+
+		if self.gather is None:
+			array = self.table
+
+		else:
+			array = np.empty( self.shape, dtype = createRecordDtype_internal( self.table.dtype ) )
+			array[ 'coordinate' ] = self.table
+
+			for name in GatherDtype.names:
+				array[ name ] = self.gather[ name ]
+
+		if os.path.splitext( path )[1] == '.npy':
+			np.save( path, array )
+		else:
+			np.ascontiguousarray( array ).tofile( path )
+
+	def apply( self, src, interpolation = InterpolationBilinear, fillValue = 0, out = None, scratch = None ):
+		'''	this function will remap source image by gather of table
+			If out and scratch from createScratch are given, result is written
+			into out and no memory is allocated
+
+			NOTES - gather is baked in memory on first apply when table has no
+			        gather for source shape, bake it with bakeRemapTable or bakeGather
+			        and save it to share single copy between process
+		'''
+
+		if interpolation not in InterpolationList:
+			raise ValueError( 'Unknown interpolation {}'.format( interpolation ) )
+
+		src = np.asarray( src )
+
+		outShape = self.shape + src.shape[ 2: ]
+
+		if out is None:
+			out = np.empty( outShape, dtype = src.dtype )
+		elif out.shape != outShape or out.dtype != src.dtype or not out.flags.c_contiguous:
+			raise ValueError( 'Output must be contiguous array of shape {} and dtype {}'.format( outShape, src.dtype ) )
+
+		if scratch is None:
+			scratch = self.createScratch( src )
+		elif scratch[ 'key' ] != ( src.shape[ 2: ], src.dtype ):
+			raise ValueError( 'Scratch is created for other source channel shape or dtype' )
+
+		if self.gather is None or self.srcShape != src.shape[ :2 ]:
+			self.bakeGather( src.shape )
+
+		srcFlat = src.reshape( ( -1, ) + src.shape[ 2: ] )
+		outFlat = out.reshape( ( -1, ) + src.shape[ 2: ] )
+		gatherFlat = self.gather.reshape( -1 )
+
+		#	mask and weight broadcast over channel
+		broadcastShape = ( -1, ) + ( 1, ) * ( src.ndim - 2 )
+
+		for start in range( 0, len( gatherFlat ), ApplyBlockSize ):
+
+			stop = min( start + ApplyBlockSize, len( gatherFlat ) )
+			gatherBlock = gatherFlat[ start:stop ]
+			outBlock = outFlat[ start:stop ]
+
+			if interpolation == InterpolationNearest:
+				self.gatherNearest_internal( srcFlat, gatherBlock, outBlock, scratch )
+				invalidMask = gatherBlock[ 'nearestInvalid' ]
+			else:
+				self.gatherBilinear_internal( srcFlat, gatherBlock, outBlock, scratch, broadcastShape )
+				invalidMask = gatherBlock[ 'bilinearInvalid' ]
+
+			np.copyto( outBlock, fillValue, casting = 'unsafe', where = invalidMask.reshape( broadcastShape ) )
+
+		return out
+
+	#
+	#	Internal Function
+	#
+
+	def getCoordinate_internal( self, tableBlock ):
+		'''	this function will return N-by-2 block of table as float coordinate and valid mask
+		'''
+
+		sampleX = tableBlock[ :, 0 ]
+		sampleY = tableBlock[ :, 1 ]
+
+		if self.isFixedPoint:
+			mask = sampleX != InvalidFixedCoordinate
+			scale = 1.0 / ( 1 << FixedPointFractionBit )
+			sampleX = sampleX * scale
+			sampleY = sampleY * scale
+		else:
+			mask = np.isfinite( sampleX ) & np.isfinite( sampleY )
+			sampleX = np.where( mask, sampleX, -1 ).astype( np.float64 )
+			sampleY = np.where( mask, sampleY, -1 ).astype( np.float64 )
+
+		return sampleX, sampleY, mask
+
+	def gatherNearest_internal( self, srcFlat, gatherBlock, outBlock, scratch ):
+		'''	this function will gather nearest pixel of block straight into output
+		'''
+
+		index = scratch[ 'index' ][ :len( gatherBlock ) ]
+		np.copyto( index, gatherBlock[ 'nearestIndex' ] )
+
+		#	index is always in source, clip mode skip buffering of output
+		np.take( srcFlat, index, axis = 0, out = outBlock, mode = 'clip' )
+
+	def gatherBilinear_internal( self, srcFlat, gatherBlock, outBlock, scratch, broadcastShape ):
+		'''	this function will gather four neighbor of block and blend them
+			into output in scratch buffer, same arithmetic as sampleBilinear
+		'''
+
+		numPixel = len( gatherBlock )
+
+		index = scratch[ 'index' ][ :numPixel ]
+		gather0 = scratch[ 'gather0' ][ :numPixel ]
+		gather1 = scratch[ 'gather1' ][ :numPixel ]
+		top = scratch[ 'top' ][ :numPixel ]
+		bottom = scratch[ 'bottom' ][ :numPixel ]
+
+		weightX = gatherBlock[ 'weightX' ].reshape( broadcastShape )
+		weightY = gatherBlock[ 'weightY' ].reshape( broadcastShape )
+
+		offsetX, offsetY = computeBilinearOffset( self.srcShape )
+
+		np.copyto( index, gatherBlock[ 'bilinearIndex' ] )
+
+		#	top = p00 + ( p10 - p00 ) * fx, then bottom from the next row the same way
+		for row, offset in ( ( top, 0 ), ( bottom, offsetY ) ):
+
+			index += offset
+			np.take( srcFlat, index, axis = 0, out = gather0, mode = 'clip' )
+			index += offsetX
+			np.take( srcFlat, index, axis = 0, out = gather1, mode = 'clip' )
+			index -= offsetX
+
+			np.subtract( gather1, gather0, out = row, dtype = np.float32 )
+			np.multiply( row, weightX, out = row )
+			np.add( row, gather0, out = row, dtype = np.float32 )
+
+		np.subtract( bottom, top, out = bottom )
+		np.multiply( bottom, weightY, out = bottom )
+		np.add( bottom, top, out = bottom )
+
+		#	round back for integer image
+		if np.issubdtype( srcFlat.dtype, np.integer ):
+			np.rint( bottom, out = bottom )
+
+		np.copyto( outBlock, bottom, casting = 'unsafe' )
+
+######################################################
+#	Main Function
+
+if __name__ == '__main__':
+	'''	this function for run code
+	'''
+
+	src = np.random.randint( 0, 256, size = ( 1080, 1920, 3 ) ).astype( np.uint8 )
+
+	srcQuad = [ [ 0, 0 ], [ 1919, 0 ], [ 1919, 1079 ], [ 0, 1079 ] ]
+	dstQuad = [ [ 200, 100 ], [ 1700, 50 ], [ 1800, 1000 ], [ 100, 1050 ] ]
+
+	remapTable = bakeRemapTable( srcQuad, dstQuad, src.shape, srcShape = src.shape )
+	out = np.empty_like( src )
+	scratch = remapTable.createScratch( src )
+
+	for interpolation in InterpolationList:
+
+		startTime = time.time()
+		remapTable.apply( src, interpolation, out = out, scratch = scratch )
+
+		print '{} :: {:.1f} ms'.format( interpolation, ( time.time() - startTime ) * 1000 )
@@ -0,0 +1,128 @@
+#! /usr/bin/env python
+#
+#	Create date 2026/10/18
+#
+
+######################################################
+#	Import Standard
+
+import os
+import sys
+
+import threading
+import collections
+
+######################################################
+#	Import Local
+
+######################################################
+#	Globel Member
+
+DefaultMaxSize = 128
+
+#	NOTES - corner closer than this are treated as the same quad
+DefaultQuantum = 1e-9
+
+######################################################
+#	Helper Function
+
+######################################################
+#	Definition Class
+
+class TransformCache( object ):
+	'''	this class designed for bounded, thread-safe LRU cache of solved
+		transform keyed on quantized corner coordinate
+	'''
+
+	def __init__( self, maxSize = DefaultMaxSize, quantum = DefaultQuantum ):
+		'''	initialize class.
+		'''
+
+		if maxSize < 1:
+			raise ValueError( 'Cache size must be at least 1' )
+
+		#
+		#	Set variable from arguments
+		#
+
+		self.maxSize = maxSize
+		self.quantum = float( quantum )
+
+		#	ordered dict keep least recently used entry at front
+		self.entryDict = collections.OrderedDict()
+
+		self.lock = threading.Lock()
+
+		#	counter
+		self.hitCount      = 0
+		self.missCount     = 0
+		self.evictionCount = 0
+
+	def __len__( self ):
+		'''	return number of cached entry
+		'''
+
+		return len( self.entryDict )
+
+	#
+	#	Operation Function
+	#
+
+	def makeKey( self, cornerList ):
+		'''	this function will create hashable key from corner coordinate
+			cornerList is sequence of ( x, y )
+		'''
+
+		return tuple( int( round( float( value ) / self.quantum ) ) for corner in cornerList for value in corner )
+
+	def get( self, cornerList, solveFunction ):
+		'''	this function will return cached solution of corner list
+			or call solveFunction( cornerList ) and cache its result on miss
+		'''
+
+		key = self.makeKey( cornerList )
+
+		with self.lock:
+			if key in self.entryDict:
+				self.hitCount += 1
+
+				#	move to back as most recently used
+				value = self.entryDict.pop( key )
+				self.entryDict[ key ] = value
+
+				return value
+
+			self.missCount += 1
+
+		#	solve outside of lock so that other thread is not blocked,
+		#	concurrent miss of the same key just solve twice
+		value = solveFunction( cornerList )
+
+		with self.lock:
+			self.entryDict[ key ] = value
+
+			#	evict least recently used entry
+			while len( self.entryDict ) > self.maxSize:
+				self.entryDict.popitem( last = False )
+				self.evictionCount += 1
+
+		return value
+
+	def clear( self ):
+		'''	this function will remove all entry and reset counter
+		'''
+
+		with self.lock:
+			self.entryDict.clear()
+
+			self.hitCount      = 0
+			self.missCount     = 0
+			self.evictionCount = 0
+
+	def getStatistic( self ):
+		'''	this function will return dict of cache statistic
+		'''
+
+		with self.lock:
+			return { 'size':len( self.entryDict ), 'maxSize':self.maxSize,
+					 'hit':self.hitCount, 'miss':self.missCount, 'eviction':self.evictionCount }
@@ -21,6 +21,42 @@ import numpy as np
 
 Epsilon = 1e-8
 
+#	class of quadrilateral, see classifyQuadBatch
+QuadValid            = 0
+QuadConcave          = 1
+QuadSelfIntersecting = 2
+QuadDenominatorZero  = 3
+QuadDegenerate       = 4
+
+QuadClassNameDict = { QuadValid:'valid', QuadConcave:'concave', QuadSelfIntersecting:'self-intersecting',
+					  QuadDenominatorZero:'denominator near zero', QuadDegenerate:'degenerate' }
+
+#	class of solved transform, from the cheapest kernel to the most general
+TransformIdentity       = 'identity'
+TransformScaleTranslate = 'scaleTranslate'
+TransformAffine         = 'affine'
+TransformProjective     = 'projective'
+
+TransformClassList = [ TransformIdentity, TransformScaleTranslate, TransformAffine, TransformProjective ]
+
+#	NOTES - matrix coefficient within this relative tolerance of zero ( or one )
+#	        is treated as exact when transform is classified
+TransformClassTolerance = 1e-14
+
+#	NOTES - transform of these class cannot be solved at all, other invalid class
+#	        can be solved but part of unit square is mapped through infinity
+QuadUnsolvableList = [ QuadDenominatorZero, QuadDegenerate ]
+
+#	coverage of axis-aligned rectangle by quad, see classifyRectangleCoverageBatch
+CoverageOutside = 0
+CoverageEdge    = 1
+CoverageInside  = 2
+
+#	NOTES - rectangle must be this far from quad edge, in unit of xy, to be
+#	        classified inside or outside, so that rounding of uv near the edge
+#	        never disagree with the classification
+CoverageMargin = 1e-2
+
 ######################################################
 #	Helper Function
 
@@ -108,10 +144,10 @@ def computeFourPointTransformMatrix( P00, P10, P11, P01 ):
 	#   destructure result vector into g and h
 	g, h = [ result[i,0] for i in (0,1) ]
 
-	#	assert that g, h stay in valid domain
-	assert( abs( g - 1 ) > Epsilon )
-	assert( abs( h - 1 ) > Epsilon )
-	assert( abs( g + h - 1 ) > Epsilon )
+	#	check that g, h stay in valid domain, w of corner P10, P01 and P11
+	#	must not vanish, otherwise that corner is at infinity
+	if min( abs( g + 1 ), abs( h + 1 ), abs( g + h + 1 ) ) <= Epsilon:
+		raise ValueError( 'Cannot solve four-point transform because denominator of corner is near zero' )
 
 	#
 	#   The following section will compute parallelogram's points
@@ -135,12 +171,14 @@ def computeFourPointTransformMatrix( P00, P10, P11, P01 ):
 	P11_prime = np.array( P11 ) * ( g + h + 1 )
 	P10_prime = np.array( P10 ) * ( g + 1 )
 
-	#   assert that the given parallelogram points
-	#       really form  aparallelogram by check parallelity of 2 opposite segment pairs
-	assert( P01_prime[0] - P00_prime[0] - P11_prime[0] + P10_prime[0] < Epsilon )
-	assert( P01_prime[1] - P00_prime[1] - P11_prime[1] + P10_prime[1] < Epsilon )
-	assert( P10_prime[0] - P00_prime[0] - P11_prime[0] + P01_prime[0] < Epsilon )
-	assert( P10_prime[1] - P00_prime[1] - P11_prime[1] + P01_prime[1] < Epsilon )
+	#   check that the given parallelogram points
+	#       really form parallelogram by check that diagonals bisect each other,
+	#       tolerance is relative to size of parallelogram
+	residual = P01_prime + P10_prime - P00_prime - P11_prime
+	scale = 1.0 + max( np.abs( P00_prime ).max(), np.abs( P01_prime ).max(), np.abs( P11_prime ).max(), np.abs( P10_prime ).max() )
+
+	if np.abs( residual ).max() > Epsilon * scale:
+		raise ValueError( 'Cannot solve four-point transform because solved points do not form parallelogram' )
 
 	#
 	#   The following section compute for a, b, c, d, e, f
@@ -160,15 +198,395 @@ def computeFourPointTransformMatrix( P00, P10, P11, P01 ):
 		[ g, h, 0, 1 ]
 	] )
 
+def computeFourPointTransformMatrixBatch( cornerArray ):
+	''' This function will create four-point transform matrix of many
+	    quadrilaterals at once
+	    INPUTS : K-by-4-by-2 array of corner P00, P10, P11, P01 of each quad
+	    OUTPUT : K-by-3-by-3 projective matrix as numpy array,
+	             K boolean validity mask
+
+	    NOTES - this is vectorized version of computeFourPointTransformMatrix
+	            using closed-form g and h given in its comment. Degenerate quad
+	            does not raise, its matrix is filled with nan and mask is False
+	'''
+
+	cornerArray = np.asarray( cornerArray, dtype = np.float64 )
+
+	if cornerArray.ndim != 3 or cornerArray.shape[1:] != ( 4, 2 ):
+		raise ValueError( 'Corner array must have shape (K, 4, 2)' )
+
+	P00 = cornerArray[ :, 0 ]
+	P10 = cornerArray[ :, 1 ]
+	P11 = cornerArray[ :, 2 ]
+	P01 = cornerArray[ :, 3 ]
+
+	#	compute coefficient in the equation, see computeFourPointTransformMatrix
+	t0 = P11 - P10
+	t1 = P11 - P01
+	t2 = P01 + P10 - P11 - P00
+
+	determinant = t0[ :, 0 ] * t1[ :, 1 ] - t1[ :, 0 ] * t0[ :, 1 ]
+
+	#	P11-P01 and P11-P10 are parallel, replace determinant to avoid
+	#	division by zero, these quad are masked out below. Tolerance is
+	#	relative to product of edge length, so it does not depend on scale of quad
+	validMask = np.abs( determinant ) > Epsilon * np.hypot( t0[ :, 0 ], t0[ :, 1 ] ) * np.hypot( t1[ :, 0 ], t1[ :, 1 ] )
+	determinant = np.where( validMask, determinant, 1.0 )
+
+	#	solve for g and h by closed-form formulae
+	g = ( t1[ :, 1 ] * t2[ :, 0 ] - t1[ :, 0 ] * t2[ :, 1 ] ) / determinant
+	h = ( -t0[ :, 1 ] * t2[ :, 0 ] + t0[ :, 0 ] * t2[ :, 1 ] ) / determinant
+
+	#	point goes toward infinity when any denominator of [eq.3-8] vanish
+	validMask &= ( np.abs( g + 1 ) > Epsilon ) & ( np.abs( h + 1 ) > Epsilon ) & ( np.abs( g + h + 1 ) > Epsilon )
+
+	#	compute parallelogram's points and a, b, c, d, e, f
+	P01_prime = P01 * ( h + 1 )[ :, None ]
+	P10_prime = P10 * ( g + 1 )[ :, None ]
+
+	matrixArray = np.empty( ( len( cornerArray ), 3, 3 ) )
+	matrixArray[ :, 0:2, 0 ] = P10_prime - P00
+	matrixArray[ :, 0:2, 1 ] = P01_prime - P00
+	matrixArray[ :, 0:2, 2 ] = P00
+	matrixArray[ :, 2, 0 ] = g
+	matrixArray[ :, 2, 1 ] = h
+	matrixArray[ :, 2, 2 ] = 1.0
+
+	#	three corner on single line give non-invertible matrix. Row of x and y is
+	#	divided by size of quad first, so that every entry is unitless, then
+	#	determinant is compared to product of column length which bound it
+	validMask &= np.isfinite( matrixArray ).all( axis = ( 1, 2 ) )
+
+	edge = np.roll( cornerArray, -1, axis = 1 ) - cornerArray
+	size = np.sqrt( ( edge**2 ).sum( axis = 2 ).max( axis = 1 ) )
+	validMask &= size > 0
+
+	normalizedArray = np.where( validMask[ :, None, None ], matrixArray, np.eye( 3 ) )
+	normalizedArray[ :, :2 ] /= np.where( validMask, size, 1.0 )[ :, None, None ]
+
+	validMask &= np.abs( np.linalg.det( normalizedArray ) ) > Epsilon * np.prod( np.sqrt( ( normalizedArray**2 ).sum( axis = 1 ) ), axis = 1 )
+
+	matrixArray[ ~validMask ] = np.nan
+
+	return matrixArray, validMask
+
+def classifyQuadBatch( cornerArray ):
+	''' This function will classify many quadrilaterals at once
+	    INPUTS : K-by-4-by-2 array of corner P00, P10, P11, P01 of each quad
+	    OUTPUT : K int8 array of quad class, QuadValid for convex quad
+	             which can be solved and map whole unit square to finite point
+
+	    NOTES - class is checked in order degenerate, denominator near zero,
+	            self-intersecting, concave, first match win.
+	            Degenerate quad has repeated corner or three corner on single line
+	'''
+
+	cornerArray = np.asarray( cornerArray, dtype = np.float64 )
+
+	if cornerArray.ndim != 3 or cornerArray.shape[1:] != ( 4, 2 ):
+		raise ValueError( 'Corner array must have shape (K, 4, 2)' )
+
+	#	edge i run from corner i to corner i+1, cross of edge i and i+1 is turn at corner i+1
+	edge = np.roll( cornerArray, -1, axis = 1 ) - cornerArray
+	nextEdge = np.roll( edge, -1, axis = 1 )
+	cross = edge[ :, :, 0 ] * nextEdge[ :, :, 1 ] - edge[ :, :, 1 ] * nextEdge[ :, :, 0 ]
+
+	#	tolerance of cross is relative to squared size of quad
+	scaleSquare = ( edge**2 ).sum( axis = 2 ).max( axis = 1 )
+	degenerateMask = ( scaleSquare <= Epsilon**2 ) | ( np.abs( cross ) <= Epsilon * scaleSquare[ :, None ] ).any( axis = 1 )
+
+	#	convex quad turn the same way at every corner, concave quad has single
+	#	reflex corner, self-intersecting quad turn twice each way
+	numPositiveTurn = ( cross > 0 ).sum( axis = 1 )
+
+	#	solve g and h as computeFourPointTransformMatrixBatch, determinant is turn at P11
+	P00, P10, P11, P01 = [ cornerArray[ :, i ] for i in range( 4 ) ]
+
+	t0 = P11 - P10
+	t1 = P11 - P01
+	t2 = P01 + P10 - P11 - P00
+
+	determinant = t0[ :, 0 ] * t1[ :, 1 ] - t1[ :, 0 ] * t0[ :, 1 ]
+	determinant = np.where( degenerateMask, 1.0, determinant )
+
+	g = ( t1[ :, 1 ] * t2[ :, 0 ] - t1[ :, 0 ] * t2[ :, 1 ] ) / determinant
+	h = ( -t0[ :, 1 ] * t2[ :, 0 ] + t0[ :, 0 ] * t2[ :, 1 ] ) / determinant
+
+	denominatorZeroMask = ( np.abs( g + 1 ) <= Epsilon ) | ( np.abs( h + 1 ) <= Epsilon ) | ( np.abs( g + h + 1 ) <= Epsilon )
+
+	return np.select( [ degenerateMask, denominatorZeroMask, numPositiveTurn == 2, ( numPositiveTurn == 1 ) | ( numPositiveTurn == 3 ) ],
+					  [ QuadDegenerate, QuadDenominatorZero, QuadSelfIntersecting, QuadConcave ], QuadValid ).astype( np.int8 )
+
+def computeInwardNormal_internal( cornerArray ):
+	''' This function will compute unit normal of each edge of convex quad
+	    pointing into quad, whichever way quad turn
+	    INPUTS : 4-by-2 corner array
+	    OUTPUT : 4-by-2 normal array, edge i run from corner i to corner i+1
+	'''
+
+	edge = np.roll( cornerArray, -1, axis = 0 ) - cornerArray
+	nextEdge = np.roll( edge, -1, axis = 0 )
+	orientation = np.sign( ( edge[ :, 0 ] * nextEdge[ :, 1 ] - edge[ :, 1 ] * nextEdge[ :, 0 ] ).sum() )
+
+	return np.column_stack( ( -edge[ :, 1 ], edge[ :, 0 ] ) ) * orientation / np.hypot( edge[ :, 0 ], edge[ :, 1 ] )[ :, None ]
+
+def computePointInQuadMask( cornerList, pointArray ):
+	''' This function will test many points against convex quad at once
+	    INPUTS : sequence of 4 ( x, y ) corner as P00, P10, P11, P01 of convex quad,
+	             N-by-2 point array
+	    OUTPUT : N boolean mask of point inside quad or on its edge
+
+	    NOTES - points outside bounding box of quad are rejected first, only the
+	            rest is tested against edge. Result is meaningful only for quad
+	            of class QuadValid
+	'''
+
+	cornerArray = np.asarray( cornerList, dtype = np.float64 )
+	pointArray = toPointArray( pointArray )
+
+	x = pointArray[ :, 0 ]
+	y = pointArray[ :, 1 ]
+
+	mask = ( x >= cornerArray[ :, 0 ].min() ) & ( x <= cornerArray[ :, 0 ].max() ) & \
+		   ( y >= cornerArray[ :, 1 ].min() ) & ( y <= cornerArray[ :, 1 ].max() )
+
+	candidateIndex = np.flatnonzero( mask )
+	candidateX = x[ candidateIndex ]
+	candidateY = y[ candidateIndex ]
+
+	insideMask = np.ones( len( candidateIndex ), dtype = bool )
+
+	#	point inside convex quad is on inner side of every edge
+	for corner, normal in zip( cornerArray, computeInwardNormal_internal( cornerArray ) ):
+		insideMask &= normal[0] * ( candidateX - corner[0] ) + normal[1] * ( candidateY - corner[1] ) >= 0
+
+	mask[ candidateIndex ] = insideMask
+
+	return mask
+
+def classifyRectangleCoverageBatch( cornerList, rectangleArray, margin = CoverageMargin ):
+	''' This function will classify many axis-aligned rectangles against convex quad
+	    INPUTS : sequence of 4 ( x, y ) corner as P00, P10, P11, P01 of convex quad,
+	             K-by-4 array of rectangle as ( xMin, yMin, xMax, yMax ), margin
+	    OUTPUT : K int8 array of CoverageOutside, CoverageEdge or CoverageInside
+
+	    NOTES - rectangle is inside when its 4 corners are inside every edge, and
+	            outside when bounding box of quad or single edge separate it from quad.
+	            Result is meaningful only for quad of class QuadValid
+	'''
+
+	cornerArray = np.asarray( cornerList, dtype = np.float64 )
+	rectangleArray = np.asarray( rectangleArray, dtype = np.float64 ).reshape( -1, 4 )
+
+	#	4 corner of each rectangle, K-by-4
+	rectangleX = rectangleArray[ :, [ 0, 2, 2, 0 ] ]
+	rectangleY = rectangleArray[ :, [ 1, 1, 3, 3 ] ]
+
+	normal = computeInwardNormal_internal( cornerArray )
+
+	#	signed distance of each rectangle corner to each edge, K-by-4 edge-by-4 corner
+	distance = ( normal[ None, :, 0, None ] * ( rectangleX[ :, None, : ] - cornerArray[ None, :, 0, None ] ) +
+				 normal[ None, :, 1, None ] * ( rectangleY[ :, None, : ] - cornerArray[ None, :, 1, None ] ) )
+
+	insideMask = ( distance > margin ).all( axis = ( 1, 2 ) )
+
+	outsideMask = ( distance < -margin ).all( axis = 2 ).any( axis = 1 )
+	outsideMask |= ( rectangleArray[ :, 0 ] > cornerArray[ :, 0 ].max() + margin ) | ( rectangleArray[ :, 2 ] < cornerArray[ :, 0 ].min() - margin )
+	outsideMask |= ( rectangleArray[ :, 1 ] > cornerArray[ :, 1 ].max() + margin ) | ( rectangleArray[ :, 3 ] < cornerArray[ :, 1 ].min() - margin )
+
+	return np.select( [ insideMask, outsideMask ], [ CoverageInside, CoverageOutside ], CoverageEdge ).astype( np.int8 )
+
+def classifyQuad( cornerList ):
+	''' This function will classify single quadrilateral
+	    INPUTS : sequence of 4 ( x, y ) corner as P00, P10, P11, P01
+	    OUTPUT : quad class
+	'''
+
+	return int( classifyQuadBatch( np.asarray( cornerList, dtype = np.float64 )[ None ] )[0] )
+
+def solveCornerTransform( cornerList ):
+	''' This function will solve four-point transform of corner list
+	    INPUTS : sequence of 4 ( x, y ) corner as P00, P10, P11, P01
+	    OUTPUT : tuple of four-point transform 4-by-4 matrix,
+	             projective 3-by-3 matrix, its inverse and transform class
+
+	    NOTES - returned arrays are read-only so that they are safe to share
+	            through transform cache
+	'''
+
+	fourPointTransform = computeFourPointTransformMatrix( *[ np.array( corner, dtype = np.float64 ) for corner in cornerList ] )
+
+	projectiveMatrix = extractProjectiveMatrix( fourPointTransform )
+	inverseProjectiveMatrix = np.linalg.inv( projectiveMatrix )
+
+	for matrix in ( fourPointTransform, projectiveMatrix, inverseProjectiveMatrix ):
+		matrix.setflags( write = False )
+
+	return fourPointTransform, projectiveMatrix, inverseProjectiveMatrix, classifyTransformMatrix( projectiveMatrix )
+
+def classifyTransformMatrix( m ):
+	''' This function will classify projective matrix by the cheapest kernel
+	    that compute it exactly
+	    INPUTS : projective 3-by-3 matrix as numpy array
+	    OUTPUT : transform class
+
+	    NOTES - matrix with g = h = 0 ( parallelogram quad ) is affine, and
+	            affine matrix of axis-aligned rectangle is scale-translate.
+	            Inverse of matrix has the same class
+	'''
+
+	tolerance = TransformClassTolerance
+
+	#	comparison with nan is always False, so garbage would look like identity
+	if not np.isfinite( m ).all():
+		return TransformProjective
+
+	#	w must stay exactly 1 so that fast kernel can skip perspective divide
+	if abs( m[2,0] ) > tolerance or abs( m[2,1] ) > tolerance or abs( m[2,2] - 1 ) > tolerance:
+		return TransformProjective
+
+	scale = max( abs( m[0,0] ), abs( m[0,1] ), abs( m[1,0] ), abs( m[1,1] ) )
+
+	if abs( m[0,1] ) > tolerance * scale or abs( m[1,0] ) > tolerance * scale:
+		return TransformAffine
+
+	if abs( m[0,0] - 1 ) > tolerance or abs( m[1,1] - 1 ) > tolerance or abs( m[0,2] ) > tolerance or abs( m[1,2] ) > tolerance:
+		return TransformScaleTranslate
+
+	return TransformIdentity
+
+def transformPoint( m, x, y, transformClass = TransformProjective ):
+	''' This function will apply projective transform to single point
+	    with kernel of transform class
+	    INPUTS : projective 3-by-3 matrix as numpy array, point x and y, transform class
+	    OUTPUT : transformed x and y
+	'''
+
+	if transformClass == TransformProjective:
+		w = m[2,0] * x + m[2,1] * y + m[2,2]
+
+		return ( m[0,0] * x + m[0,1] * y + m[0,2] ) / w, ( m[1,0] * x + m[1,1] * y + m[1,2] ) / w
+
+	#	no perspective divide from here
+	if transformClass == TransformAffine:
+		return m[0,0] * x + m[0,1] * y + m[0,2], m[1,0] * x + m[1,1] * y + m[1,2]
+
+	return m[0,0] * x + m[0,2], m[1,1] * y + m[1,2]
+
+def extractProjectiveMatrix( fourPointTransform ):
+	''' This function will extract 3-by-3 projective matrix from
+	    four-point transform 4-by-4 matrix
+	    INPUTS : four-point transform 4-by-4 matrix as numpy matrix
+	    OUTPUT : projective 3-by-3 matrix as numpy array
+
+	    NOTES - row and column of z in 4-by-4 matrix is always identity padding,
+	            so drop them and keep only x, y and w
+	'''
+
+	return np.array( np.asarray( fourPointTransform )[ np.ix_( ( 0, 1, 3 ), ( 0, 1, 3 ) ) ] )
+
+def toPointArray( u, v = None ):
+	''' This function will pack point coordinates into N-by-2 array
+	    INPUTS : N-by-2 array-like, or separate u and v array-like
+	    OUTPUT : N-by-2 numpy array of float64
+	'''
+
+	#	separate coordinate arrays, so stack them as column
+	if v is not None:
+		return np.column_stack( ( np.asarray( u, dtype = np.float64 ).ravel(),
+								  np.asarray( v, dtype = np.float64 ).ravel() ) )
+
+	pointArray = np.asarray( u, dtype = np.float64 )
+
+	#	allow single point to be passed as 1-d array
+	if pointArray.ndim == 1:
+		pointArray = pointArray.reshape( -1, 2 )
+
+	if pointArray.ndim != 2 or pointArray.shape[1] != 2:
+		raise ValueError( 'Point array must have shape (N, 2)' )
+
+	return pointArray
+
+def transformPointArrayMasked( m, pointArray, transformClass = TransformProjective ):
+	''' This function will apply projective transform to many points at once,
+	    without producing inf or numpy warning
+	    INPUTS : projective 3-by-3 matrix as numpy array, N-by-2 numpy array,
+	             transform class to select kernel
+	    OUTPUT : transformed N-by-2 numpy array with nan on invalid point,
+	             N boolean validity mask
+
+	    NOTES - point is valid only when its w is positive, point with
+	            w near zero is at infinity and point with negative w is mapped
+	            through infinity to the other side
+	'''
+
+	#	w is 1 everywhere for non-projective class, only nan input is invalid
+	if transformClass == TransformIdentity:
+		result = pointArray.copy()
+	elif transformClass == TransformScaleTranslate:
+		result = pointArray * [ m[0,0], m[1,1] ] + [ m[0,2], m[1,2] ]
+	elif transformClass == TransformAffine:
+		result = np.dot( pointArray, m[ :2, :2 ].T ) + m[ :2, 2 ]
+
+	if transformClass != TransformProjective:
+		return result, ~np.isnan( result ).any( axis = 1 )
+
+	u = pointArray[ :, 0 ]
+	v = pointArray[ :, 1 ]
+
+	w = m[2,0] * u + m[2,1] * v + m[2,2]
+
+	#	nan input is compared false, so it is invalid as well
+	with np.errstate( invalid = 'ignore' ):
+		validMask = w > Epsilon
+
+	#	replace invalid w, so that division never fail
+	w = 1.0 / np.where( validMask, w, 1.0 )
+
+	result = np.empty_like( pointArray )
+	result[ :, 0 ] = ( m[0,0] * u + m[0,1] * v + m[0,2] ) * w
+	result[ :, 1 ] = ( m[1,0] * u + m[1,1] * v + m[1,2] ) * w
+
+	result[ ~validMask ] = np.nan
+
+	return result, validMask
+
+def createWarpCornerHandler( quad, transformCache = None ):
+	''' This function will create warp corner handler from quadrilateral array
+	    INPUTS : 4-by-2 array-like of corner P00, P10, P11, P01,
+	             optional transform cache
+	    OUTPUT : warp corner handler
+	'''
+
+	quad = np.asarray( quad, dtype = np.float64 )
+
+	if quad.shape != ( 4, 2 ):
+		raise ValueError( 'Quadrilateral must have shape (4, 2)' )
+
+	return WarpCornerHandler( *[ CornerPoint( x, y ) for x, y in quad ], transformCache = transformCache )
+
 ######################################################
 #	Definition Class
 
+class CornerPoint( object ):
+	'''	this class designed for corner point
+	'''
+
+	def __init__( self, x, y ):
+		'''	initialize class.
+		'''
+
+		self.x = float( x )
+		self.y = float( y )
+
 class WarpCornerHandler( object ):
 	'''	this class designed for warp corner handler
 	'''
 
-	def __init__( self, p0, p1, p2, p3 ):
+	def __init__( self, p0, p1, p2, p3, transformCache = None ):
 		'''	initialize class.
+			If transform cache is given, solved transform of the same corners
+			is reused instead of solving again
 		'''
 
 		#
@@ -181,11 +599,19 @@ class WarpCornerHandler( object ):
 		self.p2 = p2
 		self.p3 = p3
 
-		self.fourPointTransform = computeFourPointTransformMatrix( \
-										np.array( [ p0.x, p0.y ] ), \
-										np.array( [ p1.x, p1.y ] ), \
-										np.array( [ p2.x, p2.y ] ), \
-										np.array( [ p3.x, p3.y ] ) )
+		#	keep compact 3-by-3 projective matrix and its inverse,
+		#	so inverse query costs the same as forward query
+		cornerList = ( ( p0.x, p0.y ), ( p1.x, p1.y ), ( p2.x, p2.y ), ( p3.x, p3.y ) )
+
+		if transformCache is None:
+			solution = solveCornerTransform( cornerList )
+		else:
+			solution = transformCache.get( cornerList, solveCornerTransform )
+
+		self.fourPointTransform, self.projectiveMatrix, self.inverseProjectiveMatrix, self.transformClass = solution
+
+		#	declare variable to store quad class, it is classified on first request
+		self.quadClass = None
 
 	#
 	#	Operation Function
@@ -201,21 +627,110 @@ class WarpCornerHandler( object ):
 		'''	this function will calculate uv in four corner point used bilinear interpolation
 		'''
 
-		#   transform by matrix
-		transformedPoint = self.fourPointTransform.I * np.matrix( [[ x, y, 0, 1 ]] ).T
-
-		#   return
-		return transformedPoint[0,0] / transformedPoint[3,0], transformedPoint[1,0] / transformedPoint[3,0]
+		#   transform by inverse matrix, inverse has the same class
+		return transformPoint( self.inverseProjectiveMatrix, x, y, self.transformClass )
 
 	def calculateXYFromUV( self, u, v ):
 		'''	this function will calculate xy in four corner point used bilinear interpolation
 		'''
 
 		#   transform by matrix
-		transformedPoint = self.fourPointTransform * np.matrix( [[ u, v, 0, 1 ]] ).T
+		return transformPoint( self.projectiveMatrix, u, v, self.transformClass )
+
+	def calculateUVFromXYBatch( self, x, y = None, returnMask = False ):
+		'''	this function will calculate uv of many xy points in single pass
+			x can be N-by-2 array, or x and y can be given as separated array
+			return N-by-2 numpy array with nan on point that cannot be mapped,
+			and also N boolean validity mask if returnMask is True
+		'''
+
+		result, validMask = transformPointArrayMasked( self.inverseProjectiveMatrix, toPointArray( x, y ), self.transformClass )
+
+		return ( result, validMask ) if returnMask else result
+
+	def calculateXYFromUVBatch( self, u, v = None, returnMask = False ):
+		'''	this function will calculate xy of many uv points in single pass
+			u can be N-by-2 array, or u and v can be given as separated array
+			return N-by-2 numpy array with nan on point that cannot be mapped,
+			and also N boolean validity mask if returnMask is True
+		'''
+
+		result, validMask = transformPointArrayMasked( self.projectiveMatrix, toPointArray( u, v ), self.transformClass )
+
+		return ( result, validMask ) if returnMask else result
+
+	def getQuadClass( self ):
+		'''	this function will return class of four corner point quad
+		'''
+
+		if self.quadClass is None:
+			self.quadClass = classifyQuad( self.getCornerList() )
+
+		return self.quadClass
+
+	def filterPointInQuadBatch( self, x, y = None, returnMask = False ):
+		'''	this function will find which of many xy points are in four corner point quad
+			and calculate uv of only those points, as calculateUVFromXYBatch and
+			check of uv range but without mapping points outside
+			x can be N-by-2 array, or x and y can be given as separated array
+			return index of contained point, or N boolean mask if returnMask is True,
+			and M-by-2 uv array of contained point
+
+			NOTES - convex quad is tested by bounding box and edge sign. Quad which is
+			        not QuadValid map part of unit square through infinity, so every point
+			        is mapped and checked by its uv instead
+		'''
+
+		pointArray = toPointArray( x, y )
+
+		if self.getQuadClass() == QuadValid:
+
+			mask = computePointInQuadMask( self.getCornerList(), pointArray )
+			index = np.flatnonzero( mask )
+
+			uvArray, _ = transformPointArrayMasked( self.inverseProjectiveMatrix, pointArray[ index ], self.transformClass )
 
-		#   return
-		return transformedPoint[0,0] / transformedPoint[3,0], transformedPoint[1,0] / transformedPoint[3,0]
+			#	point on edge can be rounded to just outside unit square
+			uvArray = np.clip( uvArray, 0, 1 )
+
+		else:
+
+			uvArray, validMask = transformPointArrayMasked( self.inverseProjectiveMatrix, pointArray, self.transformClass )
+
+			with np.errstate( invalid = 'ignore' ):
+				mask = validMask & ( uvArray >= 0 ).all( axis = 1 ) & ( uvArray <= 1 ).all( axis = 1 )
+
+			index = np.flatnonzero( mask )
+			uvArray = uvArray[ index ]
+
+		return ( mask if returnMask else index ), uvArray
+
+	def getCornerList( self ):
+		'''	this function will return four corner point as list of ( x, y )
+		'''
+
+		return [ ( self.p0.x, self.p0.y ), ( self.p1.x, self.p1.y ), ( self.p2.x, self.p2.y ), ( self.p3.x, self.p3.y ) ]
+
+	def getBoundingBox( self ):
+		'''	this function will return bounding box of four corner point
+			as ( xMin, yMin, xMax, yMax )
+		'''
+
+		xList, yList = zip( *self.getCornerList() )
+
+		return min( xList ), min( yList ), max( xList ), max( yList )
+
+	def classifyRectangleCoverage( self, rectangleArray ):
+		'''	this function will classify K-by-4 array of rectangle ( xMin, yMin, xMax, yMax )
+			as outside, edge or inside of four corner point quad.
+			Rectangle is never culled for quad which is not QuadValid, since part of it
+			is mapped through infinity, so every rectangle is edge
+		'''
+
+		if self.getQuadClass() != QuadValid:
+			return np.full( len( rectangleArray ), CoverageEdge, dtype = np.int8 )
+
+		return classifyRectangleCoverageBatch( self.getCornerList(), rectangleArray )
 
 ######################################################
 #	Main Function
@@ -224,23 +739,15 @@ if __name__ == '__main__':
 	'''	this function for run code
 	'''
 
-	class Point( object ):
-		'''	this class designed for point
-		'''
-
-		def __init__( self, x, y ):
-			'''	initialize class.
-			'''
-
-			self.x = float( x )
-			self.y = float( y )
-
-	p0 = Point(  0,  0 )
-	p1 = Point( 10,  0 )
-	p2 = Point( 10, 10 )
-	p3 = Point(  0, 10 )
+	p0 = CornerPoint(  0,  0 )
+	p1 = CornerPoint( 10,  0 )
+	p2 = CornerPoint( 10, 10 )
+	p3 = CornerPoint(  0, 10 )
 
 	warpCornerHandler = WarpCornerHandler( p0, p1, p2, p3 )
 
 	print warpCornerHandler.calculateXYFromUV( 0.5, 0.5 )
 	print warpCornerHandler.calculateUVFromXY( 5.0, 5.0 )
+
+	print warpCornerHandler.calculateXYFromUVBatch( [ [ 0.5, 0.5 ], [ 0.25, 0.75 ] ] )
+	print warpCornerHandler.calculateUVFromXYBatch( [ 5.0, 2.5 ], [ 5.0, 7.5 ] )
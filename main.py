@@ -14,15 +14,19 @@ import optparse
 
 import time
 
-from fltk import *
-
-from OpenGL import GL, GLU
+import numpy as np
 
 ######################################################
 #	Import Local
 
+#	NOTES - display window (fltk and OpenGL) is imported only in gui mode,
+#	        so headless mode start fast and work without display
+
 #	Warp Corner Handler
-from WarpCornerHandler import WarpCornerHandler
+from WarpCornerHandler import createWarpCornerHandler
+
+#	Quad To Quad Transform
+from QuadToQuadTransform import QuadToQuadTransform
 
 ######################################################
 #	Globel Member
@@ -30,433 +34,144 @@ from WarpCornerHandler import WarpCornerHandler
 ModuleDescription = 'This script to test warp four points to four points.'
 
 #	NOTES - ScriptVersion.ProgramVersion.SubprogramVersion
-ProgramVersion = '1.0.0'
+ProgramVersion = '1.1.0'
 ProgramName = 'main'
 
-NumberRequireArgument = 0 
+ModeGui = 'gui'
+ModePoints = 'points'
+ModeImage = 'image'
 
-NumSamplingU = 20
-NumSamplingV = 20
+#	number of arguments after mode name
+ModeNumberArgumentDict = { ModeGui:0, ModePoints:3, ModeImage:4 }
 
-######################################################
-#	Helper Function
+#	NOTES - same as ImageWarper.WarpInterpolationList, kept here so that
+#	        parsing option does not import image warper
+InterpolationChoiceList = [ 'nearest', 'bilinear', 'trilinear', 'anisotropic' ]
 
 ######################################################
-#	Definition Class
+#	Helper Function
 
-class Point( object ):
-	'''	this class designed for point
+def loadArray( path ):
+	''' This function will load array from .npy file or whitespace separated text file
 	'''
 
-	def __init__( self, x, y ):
-		'''	initialize class.
-		'''
+	if os.path.splitext( path )[1] == '.npy':
+		return np.load( path )
 
-		self.x = float( x )
-		self.y = float( y )
+	return np.loadtxt( path, ndmin = 2 )
 
-class PointObject( object ):
-	'''	this class designed for point object
+def saveArray( path, array ):
+	''' This function will save array to .npy file or whitespace separated text file
 	'''
 
-	def __init__( self, x, y ):
-		'''	initialize class.
-		'''
-
-		self.point    = Point( x, y )
-
-		self.srcPoint = Point( x, y )
-		self.dstPoint = Point( x, y )
-
-	def render( self ):
-		'''	this function will render point to OpenGL
-		'''
+	if os.path.splitext( path )[1] == '.npy':
+		np.save( path, array )
+	else:
+		np.savetxt( path, array )
 
-		GL.glColor4f( 1.0, 1.0, 1.0, 1.0 )
-		GL.glPointSize( 8.0 )
-
-		GL.glBegin( GL.GL_POINTS )
-		GL.glVertex2f( self.point.x, self.point.y )
-		GL.glEnd()
-
-class PointHandler( object ):
-	'''	this class designed for point handler
+def loadCornerHandler( path ):
+	''' This function will load corner file and solve its warp corner handler,
+	    error of corner which cannot be solved is raised with file path
 	'''
 
-	def __init__( self, llx, lly, urx, ury ):
-		'''	initialize class.
-		'''
-
-		self.llx = llx
-		self.lly = lly
-		self.urx = urx
-		self.ury = ury
-
-		#	create empty list to store point object
-		self.pointList        = []
-
-		#	create empty list to store openGL widget
-		self.openGLWidgetList = []
-
-	def addPoint( self, pointObject ):
-		'''	add point object to list
-		'''
-
-		self.pointList.append( pointObject )
-
-	def addOpenGLWidget( self, openGLWidget ):
-		'''	add openGL widget to list
-		'''	
-
-		self.openGLWidgetList.append( openGLWidget )
+	try:
+		return createWarpCornerHandler( loadArray( path ) )
+	except ValueError as e:
+		raise ValueError( 'Corner file {} :: {}'.format( path, e ) )
 
-	def updateOpenGLWidget( self ):
-		'''	redraw all widget in openGL widget list
-		'''
-
-		#	loop over all openGL widget list and call redraw
-		for openGLWidget in self.openGLWidgetList:
-			openGLWidget.redraw()
-
-class DisplayWindow( Fl_Gl_Window ):
-	'''	this class designed for display window
+def runGuiMode():
+	''' This function will open source and destination display window
 	'''
 
-	GrabSize = 10.0
-
-	def __init__( self, x, y, w, h, pointHandler, l = 'DisplayWindow' ):
-		'''	initialize class.
-		'''
-		Fl_Gl_Window.__init__( self, x, y, w, h, l )
-
-		#	store point handler to member class
-		self.pointHandler = pointHandler
-		self.pointHandler.addOpenGLWidget( self )
-
-		#	declare variable to store grab point object
-		self.grabPointObject = None
-
-	def draw( self ):
-		'''	this function will override from fltk
-		'''
-
-		#	specify the lower left corner of the viewport rectangle, in pixels. 
-		#		and size of the viewport
-		GL.glViewport( 0, 0, self.w(), self.h() )
-
-		#	set background color and opaque
-		GL.glClearColor( 0.0, 0.0, 0.0, 0.0 )
-
-		#	clear gl
-		GL.glClearDepth( 0.0 )
-		GL.glClear( GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT )
-
-		#	setup smooth point
-		GL.glEnable( GL.GL_BLEND )
-		GL.glBlendFunc( GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA )
-		GL.glEnable( GL.GL_POINT_SMOOTH )
-
-		#	set matrix mode to projection
-		GL.glMatrixMode( GL.GL_PROJECTION )
-
-		#	reset the projection matrix
-		GL.glLoadIdentity()
-
-		#	orthographic projection (xLeft, xRight, yBottom, yTop, zNear, zFar)
-		#		relative to camera's eye position.
-		GL.glOrtho( -200, 200, -200, 200, -1, 1 )
-
-		#	set matrix mode to model view
-		GL.glMatrixMode( GL.GL_MODELVIEW )
-
-		#	reset the projection matrix
-		GL.glLoadIdentity()
-
-		#	call render function 
-		self.render()
-
-	def handle( self, event ):
-		'''	this function will override from fltk
-		'''
-
-		#	get fl event key
-		key = Fl.event_key()
-
-		#	get fl modifier
-		modifier = Fl_event_alt() | Fl_event_ctrl() | Fl_event_shift()
-
-		#	get mouse button
-		mouseButton = Fl_event_button()
-
-		#	get mouse position on image window
-		x = Fl.event_x()
-		y = Fl.event_y()
-
-		#	create key dict
-		keyDict = { 'modifier':modifier, 'key':key, 'mouseState':event }
-
-		if  event in [ FL_PUSH, FL_DRAG, FL_RELEASE ]:
-
-			#	get the modelview info
-			modelview = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
-
-			#	get the projection matrix info
-			projection = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
-
-			#	get the viewport info
-			viewport = GL.glGetIntegerv( GL.GL_VIEWPORT )
-
-			#	get the world coordinates from the screen coordinates
-			worldPosition = GLU.gluUnProject( x, viewport[3] - y, 0, modelview, projection, viewport )
-
-			#	call the grab point event function
-			self.grabPointEvent_callback( worldPosition[0], worldPosition[1], keyDict )
-			return True
-
-		return Fl_Gl_Window.handle( self, event )
-
-	#
-	#	Operation Function
-	#
-
-	def render( self ):
-		'''	this function will render to OpenGL
-		'''
-
-		GL.glColor4f( 1.0, 1.0, 1.0, 1.0 )
-		GL.glLineWidth( 1.0 )
-
-		GL.glBegin( GL.GL_LINE_LOOP )
-		GL.glVertex2f( self.pointHandler.llx, self.pointHandler.lly )
-		GL.glVertex2f( self.pointHandler.urx, self.pointHandler.lly )
-		GL.glVertex2f( self.pointHandler.urx, self.pointHandler.ury )
-		GL.glVertex2f( self.pointHandler.llx, self.pointHandler.ury )
-		GL.glEnd()
-
-		#	loop over all point object in point list
-		for pointObject in self.pointHandler.pointList:
-
-			#	render point object
-			pointObject.render()
-
-	#
-	#	Callback Function
-	#
-
-	def grabPointEvent_callback( self, sceneX, sceneY, keyDict ):
-		'''	this function will grab point in openGL widget 
-		'''
-
-		if keyDict[ 'mouseState' ] == FL_PUSH:
-
-			#	loop over all point object in point list
-			for pointObject in self.pointHandler.pointList:
-
-				#	check if point object out of grab radius
-				#	so, continue
-				if( not self.isGrabPointObject_internal( pointObject, sceneX, sceneY ) ):
-					continue
-
-				#	set grab point object
-				self.grabPointObject = pointObject
-
-				break
-
-		elif keyDict[ 'mouseState' ] == FL_DRAG and self.grabPointObject != None:
-
-			#	set point position
-			self.setPointPosition_internal( sceneX, sceneY )
-			
-			#	call the redraw
-			self.pointHandler.updateOpenGLWidget()
-
-		elif keyDict[ 'mouseState' ] == FL_RELEASE:
-
-			#	set grab point object to none
-			self.grabPointObject = None
-
-		self.redraw()
-
-	#
-	#	Internal Function
-	#
+	#	import here so that headless mode does not need fltk and OpenGL
+	from DisplayWindow import Fl, PointHandler, PointObject, SrcDisplayWindow, DstDisplayWindow
 
-	def isGrabPointObject_internal( self, pointObject, sceneX, sceneY ):
-		'''	this function will return is grab point object or not
-		'''
-
-		#	get point position
-		pointX, pointY = self.getPointPosition_internal( pointObject )
-
-		#	check if point object out of grab radius
-		#	so, continue
-		if( ( ( pointX - sceneX )**2 + ( pointY - sceneY )**2 )**0.5 < DisplayWindow.GrabSize ):
-			return True
-
-		return False
-
-	def getPointPosition_internal( self, pointObject ):
-		'''	this function will return position from point object
-		'''
-
-		return pointObject.point.x, pointObject.point.y
-
-	def setPointPosition_internal( self, pointX, pointY ):
-		'''	this function will set position to point object
-		'''
-
-		self.grabPointObject.point.x = pointX
-		self.grabPointObject.point.y = pointY
-
-class SrcDisplayWindow( DisplayWindow ):
-
-	def __init__( self, x, y, w, h, pointHandler ):
-		'''	initialize class.
-		'''
-		DisplayWindow.__init__( self, x, y, w, h, pointHandler, 'Source Display Window' )
-
-	def render( self ):
-		'''	this function will render to OpenGL
-		'''
-		DisplayWindow.render( self )
-		
-		GL.glColor4f( 1.0, 0.0, 0.0, 1.0 )
-		GL.glPointSize( 8.0 )
-		GL.glLineWidth( 1.0 )
-		
-		GL.glBegin( GL.GL_POINTS )
-
-		#	loop over all point object in point list
-		for pointObject in self.pointHandler.pointList:
-			GL.glVertex2f( pointObject.srcPoint.x, pointObject.srcPoint.y )
-		
-		GL.glEnd()
-
-		GL.glBegin( GL.GL_LINE_LOOP )
-
-		#	loop over all point object in point list
-		for pointObject in self.pointHandler.pointList:
-			GL.glVertex2f( pointObject.srcPoint.x, pointObject.srcPoint.y )
-		
-		GL.glEnd()
-
-		GL.glPointSize( 3.0 )
-		
-		GL.glColor4f( 0.0, 1.0, 1.0, 1.0 )
-		GL.glBegin( GL.GL_POINTS )
-
-		warpCornerHandler_point = WarpCornerHandler( self.pointHandler.pointList[0].point, self.pointHandler.pointList[1].point,
-								  					 self.pointHandler.pointList[2].point, self.pointHandler.pointList[3].point )
-
-		for sv in range( 0, NumSamplingV + 1 ):
-			for su in range( 0, NumSamplingU + 1 ):
-				u = su * ( 1 / float( NumSamplingU ) )
-				v = sv * ( 1 / float( NumSamplingV ) )
-
-				x, y = warpCornerHandler_point.calculateXYFromUV( u, v )
-
-				GL.glVertex2f( x, y )
-
-		GL.glEnd()
-
-	#
-	#	Internal Function
-	#
-
-	def getPointPosition_internal( self, pointObject ):
-		'''	this function will return position from point object
-		'''
+	pointHandler = PointHandler( -150, -150, 150, 150 )
 
-		return pointObject.srcPoint.x, pointObject.srcPoint.y
+	pointHandler.addPoint( PointObject( -100, -100 ) )
+	pointHandler.addPoint( PointObject(  100, -100 ) )
+	pointHandler.addPoint( PointObject(  100,  100 ) )
+	pointHandler.addPoint( PointObject( -100,  100 ) )
 
-	def setPointPosition_internal( self, pointX, pointY ):
-		'''	this function will set position to point object
-		'''
+	# pointHandler.pointList[3].srcPoint.x = 0
+	# pointHandler.pointList[3].srcPoint.y = 0
 
-		self.grabPointObject.srcPoint.x = pointX
-		self.grabPointObject.srcPoint.y = pointY
+	srcDisplay = SrcDisplayWindow( 100, 150, 720, 480, pointHandler )
+	dstDisplay = DstDisplayWindow( 920, 150, 720, 480, pointHandler )
+	srcDisplay.show()
+	dstDisplay.show()
 
-class DstDisplayWindow( DisplayWindow ):
+	Fl.run()
 
-	def __init__( self, x, y, w, h, pointHandler ):
-		'''	initialize class.
-		'''
-		DisplayWindow.__init__( self, x, y, w, h, pointHandler, 'Destination Display Window' )
+def runPointsMode( cornerPath, inputPath, outputPath, dstCornerPath = None, flagInverse = False ):
+	''' This function will transform point file in bulk
+	    Without destination corner, uv is mapped to xy of corner quad ( xy to uv if inverse ).
+	    With destination corner, xy in corner quad is remapped into destination quad.
+	'''
 
-	def render( self ):
-		'''	this function will render to OpenGL
-		'''
-		DisplayWindow.render( self )
+	warpCornerHandler = loadCornerHandler( cornerPath )
 
-		GL.glColor4f( 0.0, 1.0, 0.0, 1.0 )
-		GL.glPointSize( 8.0 )
-		GL.glLineWidth( 1.0 )
-		
-		GL.glBegin( GL.GL_POINTS )
+	pointArray = loadArray( inputPath )
 
-		#	loop over all point object in point list
-		for pointObject in self.pointHandler.pointList:
-			GL.glVertex2f( pointObject.dstPoint.x, pointObject.dstPoint.y )
-		
-		GL.glEnd()
+	if dstCornerPath is None:
+		if flagInverse:
+			result = warpCornerHandler.calculateUVFromXYBatch( pointArray )
+		else:
+			result = warpCornerHandler.calculateXYFromUVBatch( pointArray )
+	else:
+		quadToQuadTransform = QuadToQuadTransform( warpCornerHandler, loadCornerHandler( dstCornerPath ) )
 
-		GL.glBegin( GL.GL_LINE_LOOP )
+		if flagInverse:
+			result = quadToQuadTransform.inverseTransformPointBatch( pointArray )
+		else:
+			result = quadToQuadTransform.transformPointBatch( pointArray )
 
-		#	loop over all point object in point list
-		for pointObject in self.pointHandler.pointList:
-			GL.glVertex2f( pointObject.dstPoint.x, pointObject.dstPoint.y )
-		
-		GL.glEnd()
+	saveArray( outputPath, result )
 
-		GL.glPointSize( 3.0 )
-		
-		GL.glColor4f( 0.0, 1.0, 1.0, 1.0 )
-		GL.glBegin( GL.GL_POINTS )
+	return len( result )
 
-		warpCornerHandler_point = WarpCornerHandler( self.pointHandler.pointList[0].point, self.pointHandler.pointList[1].point,
-								  					 self.pointHandler.pointList[2].point, self.pointHandler.pointList[3].point )
+def parseSize( text ):
+	''' This function will parse HEIGHTxWIDTH into ( height, width ),
+	    or return None if text is not in that form
+	'''
 
-		warpCornerHandler_src = WarpCornerHandler( self.pointHandler.pointList[0].srcPoint, self.pointHandler.pointList[1].srcPoint,
-								  				   self.pointHandler.pointList[2].srcPoint, self.pointHandler.pointList[3].srcPoint )
+	valueList = text.lower().split( 'x' )
 
-		warpCornerHandler_dst = WarpCornerHandler( self.pointHandler.pointList[0].dstPoint, self.pointHandler.pointList[1].dstPoint,
-								  				   self.pointHandler.pointList[2].dstPoint, self.pointHandler.pointList[3].dstPoint )
+	if len( valueList ) != 2:
+		return None
 
-		for sv in range( 0, NumSamplingV + 1 ):
-			for su in range( 0, NumSamplingU + 1 ):
-				u = su * ( 1 / float( NumSamplingU ) )
-				v = sv * ( 1 / float( NumSamplingV ) )
+	try:
+		height, width = [ int( value ) for value in valueList ]
+	except ValueError:
+		return None
 
-				try:
+	if height <= 0 or width <= 0:
+		return None
 
-					x, y       = warpCornerHandler_point.calculateXYFromUV( u, v )
-					srcU, srcV = warpCornerHandler_src.calculateUVFromXY( x, y )
-					dstX, dstY = warpCornerHandler_dst.calculateXYFromUV( srcU, srcV )
+	return height, width
 
-					GL.glVertex2f( dstX, dstY )
+def runImageMode( srcCornerPath, dstCornerPath, inputPath, outputPath, outShape = None,
+				  interpolation = 'bilinear', tileSize = None, numWorker = None ):
+	''' This function will warp .npy image from source quad into destination quad
+	'''
 
-				except Exception as e:
-					print 'Can not warp this point.'
-					pass
+	#	import here so that points mode does not pay for it
+	from ImageWarper import warpImageTiled, DefaultTileSize
 
-		GL.glEnd()
+	srcQuad = loadCornerHandler( srcCornerPath ).getCornerList()
+	dstQuad = loadCornerHandler( dstCornerPath ).getCornerList()
 
-	#
-	#	Internal Function
-	#
+	src = np.load( inputPath )
 
-	def getPointPosition_internal( self, pointObject ):
-		'''	this function will return position from point object
-		'''
+	if outShape is None:
+		outShape = src.shape[ :2 ]
 
-		return pointObject.dstPoint.x, pointObject.dstPoint.y
+	out = warpImageTiled( src, srcQuad, dstQuad, outShape, interpolation,
+						  tileSize = tileSize if tileSize is not None else DefaultTileSize, numWorker = numWorker )
 
-	def setPointPosition_internal( self, pointX, pointY ):
-		'''	this function will set position to point object
-		'''
+	np.save( outputPath, out )
 
-		self.grabPointObject.dstPoint.x = pointX
-		self.grabPointObject.dstPoint.y = pointY
+	return out.shape
 
 ######################################################
 #	Main Function
@@ -466,36 +181,58 @@ def main():
 	'''
 
 	#	Initialize option parser
-	parser = optparse.OptionParser( usage='%prog <arg1> <arg2> [options]',
+	parser = optparse.OptionParser( usage='%prog [gui] [options]\n'
+										  '       %prog points <corner> <input> <output> [options]\n'
+										  '       %prog image <srcCorner> <dstCorner> <input.npy> <output.npy> [options]',
 									prog=ProgramName,
 									version='Version :: {}'.format( ProgramVersion ) )
 
 	#	-d  :: Enabled debug mode ( False )
-	parser.add_option( '-d', dest='flagDebugMode', help='Enabled debug mode ( False )', 
+	parser.add_option( '-d', dest='flagDebugMode', help='Enabled debug mode ( False )',
 						action='store_true', default=False )
 
 	#	-l  :: Enabled log mode ( False )
 	parser.add_option( '-l', dest='flagLogMode', help='Enabled log mode ( False )',
 						action='store_true', default=False )
 
+	#	-i  :: Inverse transform in points mode ( False )
+	parser.add_option( '-i', dest='flagInverse', help='Inverse transform in points mode ( False )',
+						action='store_true', default=False )
+
+	#	--dst-corner  :: Destination corner file to remap quad to quad in points mode ( None )
+	parser.add_option( '--dst-corner', dest='dstCornerPath', help='Destination corner file in points mode ( None )',
+						default=None )
+
+	#	--size  :: Output image size as HEIGHTxWIDTH in image mode ( input size )
+	parser.add_option( '--size', dest='outSize', help='Output image size as HEIGHTxWIDTH in image mode ( input size )',
+						default=None )
+
+	#	--interpolation  :: Interpolation in image mode ( bilinear )
+	parser.add_option( '--interpolation', dest='interpolation', help='nearest, bilinear, trilinear or anisotropic in image mode ( bilinear )',
+						type='choice', choices=InterpolationChoiceList, default='bilinear' )
+
+	#	--tile-size  :: Tile size in image mode ( 256 )
+	parser.add_option( '--tile-size', dest='tileSize', help='Tile size in image mode ( 256 )',
+						type='int', default=None )
+
+	#	--worker  :: Number of worker thread in image mode ( number of cpu )
+	parser.add_option( '--worker', dest='numWorker', help='Number of worker thread in image mode ( number of cpu )',
+						type='int', default=None )
+
 	#	Option and Arguments
 	options, args = parser.parse_args()
 
+	#	no argument is interactive mode as before
+	mode = args[0] if args else ModeGui
+	args = args[1:]
+
 	#	Check number of arguments
-	if NumberRequireArgument != -1 and NumberRequireArgument != len( args ):
+	if mode not in ModeNumberArgumentDict or ModeNumberArgumentDict[ mode ] != len( args ):
 
 		print 'Check arguments, Because number of arguments is wrong!!!'
 		print '>>> Terminate script'
 		sys.exit( -1 )
 
-	##################################################################################
-	#
-	#	Arguments
-	#	
-
-	# arg0 = args[0]
-	# arg1 = args[1]
-
 	##################################################################################
 	#
 	#	Option
@@ -504,6 +241,19 @@ def main():
 	flagDebugMode = options.flagDebugMode
 	flagLogMode = options.flagLogMode
 
+	outShape = None
+	if options.outSize is not None:
+		outShape = parseSize( options.outSize )
+
+		if outShape is None:
+			parser.error( '--size must be HEIGHTxWIDTH of positive integers, got {}'.format( options.outSize ) )
+
+	if options.tileSize is not None and options.tileSize <= 0:
+		parser.error( '--tile-size must be positive integer, got {}'.format( options.tileSize ) )
+
+	if options.numWorker is not None and options.numWorker <= 0:
+		parser.error( '--worker must be positive integer, got {}'.format( options.numWorker ) )
+
 	##################################################################################
 	#
 	#	Represent
@@ -520,22 +270,32 @@ def main():
 	#	My code
 	#
 
-	pointHandler = PointHandler( -150, -150, 150, 150 )
+	startTime = time.time()
 
-	pointHandler.addPoint( PointObject( -100, -100 ) )
-	pointHandler.addPoint( PointObject(  100, -100 ) )
-	pointHandler.addPoint( PointObject(  100,  100 ) )
-	pointHandler.addPoint( PointObject( -100,  100 ) )
+	if mode == ModeGui:
+		runGuiMode()
 
-	# pointHandler.pointList[3].srcPoint.x = 0
-	# pointHandler.pointList[3].srcPoint.y = 0
+	else:
 
-	srcDisplay = SrcDisplayWindow( 100, 150, 720, 480, pointHandler )
-	dstDisplay = DstDisplayWindow( 920, 150, 720, 480, pointHandler )
-	srcDisplay.show()
-	dstDisplay.show()
+		try:
+			if mode == ModePoints:
+				numPoint = runPointsMode( args[0], args[1], args[2], options.dstCornerPath, options.flagInverse )
+				print '>>> Transformed {} points into {}'.format( numPoint, args[2] )
 
-	Fl.run()
+			else:
+				shape = runImageMode( args[0], args[1], args[2], args[3], outShape,
+									  options.interpolation, options.tileSize, options.numWorker )
+				print '>>> Warped image of shape {} into {}'.format( shape, args[3] )
+
+		#	corner or input file which cannot be used is reported in single line
+		except ValueError as e:
+
+			print '>>> {}'.format( e )
+			print '>>> Terminate script'
+			sys.exit( -1 )
+
+	if flagLogMode and mode != ModeGui:
+		print '>>> Done in {:.3f} s'.format( time.time() - startTime )
 
 if __name__ == '__main__':
 	'''	this function for run code